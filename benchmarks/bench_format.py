@@ -0,0 +1,39 @@
+import phonenumbers as pn
+import pytest
+
+from digitz.enums import PhoneNumberFormat
+from conftest import fresh_copies
+
+FORMATS = {
+    "e164": PhoneNumberFormat.E164,
+    "international": PhoneNumberFormat.INTERNATIONAL,
+    "national": PhoneNumberFormat.NATIONAL,
+    "rfc3966": PhoneNumberFormat.RFC3966,
+}
+
+
+@pytest.mark.parametrize("name", FORMATS)
+def test_digitz_format_cold(benchmark, digitz_numbers, name) -> None:
+    benchmark.group = f"format-{name}"
+    method = f"to_{name}"
+    benchmark.pedantic(
+        lambda numbers: [getattr(number, method)() for number in numbers],
+        setup=lambda: ((fresh_copies(digitz_numbers),), {}),
+        rounds=20,
+    )
+
+
+@pytest.mark.parametrize("name", FORMATS)
+def test_digitz_format_warm(benchmark, digitz_numbers, name) -> None:
+    benchmark.group = f"format-{name}"
+    method = f"to_{name}"
+    for number in digitz_numbers:
+        getattr(number, method)()
+    benchmark(lambda: [getattr(number, method)() for number in digitz_numbers])
+
+
+@pytest.mark.parametrize("name", FORMATS)
+def test_phonenumbers_format(benchmark, pn_numbers, name) -> None:
+    benchmark.group = f"format-{name}"
+    format = FORMATS[name]
+    benchmark(lambda: [pn.format_number(numobj, format) for numobj in pn_numbers])
@@ -0,0 +1,30 @@
+from phonenumbers import carrier, geocoder
+import pytest
+
+from conftest import fresh_copies
+
+# The phonenumbers equivalent of each lookup method.
+LOOKUPS = {
+    "get_carrier_name": carrier.name_for_number,
+    "get_country_name": geocoder.country_name_for_number,
+    "get_description": geocoder.description_for_number,
+}
+
+
+@pytest.mark.parametrize("name", LOOKUPS)
+def test_digitz_lookup_cold(benchmark, digitz_numbers, name) -> None:
+    benchmark.group = f"lookup-{name}"
+    benchmark.pedantic(
+        lambda numbers: [getattr(number, name)("en") for number in numbers],
+        setup=lambda: ((fresh_copies(digitz_numbers),), {}),
+        rounds=10,
+        warmup_rounds=1,
+    )
+
+
+@pytest.mark.parametrize("name", LOOKUPS)
+def test_phonenumbers_lookup(benchmark, pn_numbers, name) -> None:
+    benchmark.group = f"lookup-{name}"
+    function = LOOKUPS[name]
+    function(pn_numbers[0], "en")
+    benchmark(lambda: [function(numobj, "en") for numobj in pn_numbers])
@@ -0,0 +1,14 @@
+import phonenumbers as pn
+import pytest
+
+
+@pytest.mark.benchmark(group="match")
+def test_digitz_match(benchmark, digitz_numbers) -> None:
+    pairs = list(zip(digitz_numbers, digitz_numbers[1:] + digitz_numbers[:1]))
+    benchmark(lambda: [left.match(right) for left, right in pairs])
+
+
+@pytest.mark.benchmark(group="match")
+def test_phonenumbers_match(benchmark, pn_numbers) -> None:
+    pairs = list(zip(pn_numbers, pn_numbers[1:] + pn_numbers[:1]))
+    benchmark(lambda: [pn.is_number_match(left, right) for left, right in pairs])
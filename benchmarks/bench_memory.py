@@ -0,0 +1,60 @@
+"""Measures the memory per instance next to the time to create the instances.
+
+The memory is reported in the extra info of each benchmark, e.g. with
+`--benchmark-columns=mean,ops --benchmark-verbose` or in the saved JSON.
+"""
+import gc
+import tracemalloc
+from typing import Callable
+
+import phonenumbers as pn
+import pytest
+
+from digitz import PhoneNumber
+from digitz.enums import PhoneNumberFormat
+
+
+def _bytes_per_instance(create: Callable[[], list]) -> float:
+    # Fills the metadata and compiled pattern caches, which are shared.
+    create()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        objects = create()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # The list holding the instances takes a pointer per instance.
+    return (current - baseline) / len(objects) - 8
+
+
+@pytest.mark.benchmark(group="memory")
+def test_digitz_memory(benchmark, e164_strings) -> None:
+    def create() -> list:
+        return [PhoneNumber.parse(number) for number in e164_strings]
+
+    benchmark.extra_info["bytes_per_instance"] = _bytes_per_instance(create)
+    benchmark(create)
+
+
+@pytest.mark.benchmark(group="memory")
+def test_digitz_memory_analyzed(benchmark, e164_strings) -> None:
+    def create() -> list:
+        numbers = [PhoneNumber.parse(number) for number in e164_strings]
+        for number in numbers:
+            number.analyze()
+            number.format(PhoneNumberFormat.E164)
+        return numbers
+
+    benchmark.extra_info["bytes_per_instance"] = _bytes_per_instance(create)
+    benchmark(create)
+
+
+@pytest.mark.benchmark(group="memory")
+def test_phonenumbers_memory(benchmark, e164_strings) -> None:
+    def create() -> list:
+        return [pn.parse(number) for number in e164_strings]
+
+    benchmark.extra_info["bytes_per_instance"] = _bytes_per_instance(create)
+    benchmark(create)
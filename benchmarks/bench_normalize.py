@@ -0,0 +1,53 @@
+import pytest
+
+from digitz import PhoneNumber, normalize, normalize_many
+
+US_STRINGS = [f"(201) 555-{index:04d}" for index in range(1000)]
+
+
+@pytest.mark.benchmark(group="normalize-e164")
+def test_digitz_parse_to_e164(benchmark, e164_strings) -> None:
+    benchmark(lambda: [PhoneNumber.parse(number).to_e164() for number in e164_strings])
+
+
+@pytest.mark.benchmark(group="normalize-e164")
+def test_digitz_normalize_e164(benchmark, e164_strings) -> None:
+    benchmark(lambda: [normalize(number) for number in e164_strings])
+
+
+@pytest.mark.benchmark(group="normalize-e164")
+def test_digitz_normalize_many_e164(benchmark, e164_strings) -> None:
+    benchmark(normalize_many, e164_strings)
+
+
+@pytest.mark.benchmark(group="normalize-national")
+def test_digitz_parse_national_to_e164(benchmark, national_strings) -> None:
+    benchmark(
+        lambda: [
+            PhoneNumber.parse(number, region=region).to_e164()
+            for number, region in national_strings
+        ]
+    )
+
+
+@pytest.mark.benchmark(group="normalize-national")
+def test_digitz_normalize_national(benchmark, national_strings) -> None:
+    benchmark(
+        lambda: [
+            normalize(number, region=region) for number, region in national_strings
+        ]
+    )
+
+
+@pytest.mark.benchmark(group="normalize-one-region")
+def test_digitz_parse_one_region_to_e164(benchmark) -> None:
+    benchmark(
+        lambda: [
+            PhoneNumber.parse(number, region="US").to_e164() for number in US_STRINGS
+        ]
+    )
+
+
+@pytest.mark.benchmark(group="normalize-one-region")
+def test_digitz_normalize_many_one_region(benchmark) -> None:
+    benchmark(normalize_many, US_STRINGS, region="US")
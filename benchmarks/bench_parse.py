@@ -0,0 +1,70 @@
+import phonenumbers as pn
+import pytest
+
+from digitz import Parser, PhoneNumber
+
+US_STRINGS = [f"(201) 555-{index:04d}" for index in range(1000)]
+
+
+@pytest.mark.benchmark(group="parse-e164")
+def test_digitz_parse_e164(benchmark, e164_strings) -> None:
+    benchmark(lambda: [PhoneNumber.parse(number) for number in e164_strings])
+
+
+@pytest.mark.benchmark(group="parse-e164")
+def test_phonenumbers_parse_e164(benchmark, e164_strings) -> None:
+    benchmark(lambda: [pn.parse(number) for number in e164_strings])
+
+
+@pytest.mark.benchmark(group="parse-national")
+def test_digitz_parse_national(benchmark, national_strings) -> None:
+    benchmark(
+        lambda: [
+            PhoneNumber.parse(number, region=region)
+            for number, region in national_strings
+        ]
+    )
+
+
+@pytest.mark.benchmark(group="parse-national")
+def test_digitz_try_parse_national(benchmark, national_strings) -> None:
+    benchmark(
+        lambda: [
+            PhoneNumber.try_parse(number, region=region)
+            for number, region in national_strings
+        ]
+    )
+
+
+@pytest.mark.benchmark(group="parse-national")
+def test_digitz_parse_many_national(benchmark, national_strings) -> None:
+    benchmark(PhoneNumber.parse_many, national_strings)
+
+
+@pytest.mark.benchmark(group="parse-national")
+def test_digitz_parser_national(benchmark, national_strings) -> None:
+    parsers = {region: Parser(region) for _, region in national_strings}
+    benchmark(
+        lambda: [parsers[region].parse(number) for number, region in national_strings]
+    )
+
+
+@pytest.mark.benchmark(group="parse-national")
+def test_phonenumbers_parse_national(benchmark, national_strings) -> None:
+    benchmark(lambda: [pn.parse(number, region) for number, region in national_strings])
+
+
+@pytest.mark.benchmark(group="parse-one-region")
+def test_digitz_parse_one_region(benchmark) -> None:
+    benchmark(lambda: [PhoneNumber.parse(number, region="US") for number in US_STRINGS])
+
+
+@pytest.mark.benchmark(group="parse-one-region")
+def test_digitz_parser_one_region(benchmark) -> None:
+    parser = Parser("US")
+    benchmark(lambda: [parser.parse(number) for number in US_STRINGS])
+
+
+@pytest.mark.benchmark(group="parse-one-region")
+def test_digitz_parser_parse_many_one_region(benchmark) -> None:
+    benchmark(Parser("US").parse_many, US_STRINGS)
@@ -0,0 +1,23 @@
+import pickle
+
+import pytest
+
+
+@pytest.mark.benchmark(group="pickle-dumps")
+def test_digitz_pickle_dumps(benchmark, digitz_numbers) -> None:
+    benchmark(pickle.dumps, digitz_numbers)
+
+
+@pytest.mark.benchmark(group="pickle-dumps")
+def test_phonenumbers_pickle_dumps(benchmark, pn_numbers) -> None:
+    benchmark(pickle.dumps, pn_numbers)
+
+
+@pytest.mark.benchmark(group="pickle-loads")
+def test_digitz_pickle_loads(benchmark, digitz_numbers) -> None:
+    benchmark(pickle.loads, pickle.dumps(digitz_numbers))
+
+
+@pytest.mark.benchmark(group="pickle-loads")
+def test_phonenumbers_pickle_loads(benchmark, pn_numbers) -> None:
+    benchmark(pickle.loads, pickle.dumps(pn_numbers))
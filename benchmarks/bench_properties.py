@@ -0,0 +1,64 @@
+import phonenumbers as pn
+from phonenumbers.timezone import time_zones_for_number
+import pytest
+
+from conftest import fresh_copies
+
+# The phonenumbers equivalent of each cached property.
+PROPERTIES = {
+    "national_destination_code_length": pn.length_of_national_destination_code,
+    "national_significant_number": pn.national_significant_number,
+    "region_code": pn.region_code_for_number,
+    "is_geographical": pn.is_number_geographical,
+    "is_nanpa_country": lambda numobj: pn.is_nanpa_country(
+        pn.region_code_for_number(numobj)
+    ),
+    "is_possible": pn.is_possible_number,
+    "is_valid": pn.is_valid_number,
+    "number_type": pn.number_type,
+    "timezones": time_zones_for_number,
+}
+
+
+@pytest.mark.parametrize("name", PROPERTIES)
+def test_digitz_property_cold(benchmark, digitz_numbers, name) -> None:
+    benchmark.group = f"property-{name}"
+    benchmark.pedantic(
+        lambda numbers: [getattr(number, name) for number in numbers],
+        setup=lambda: ((fresh_copies(digitz_numbers),), {}),
+        rounds=20,
+    )
+
+
+@pytest.mark.parametrize("name", PROPERTIES)
+def test_digitz_property_warm(benchmark, digitz_numbers, name) -> None:
+    benchmark.group = f"property-{name}"
+    for number in digitz_numbers:
+        getattr(number, name)
+    benchmark(lambda: [getattr(number, name) for number in digitz_numbers])
+
+
+@pytest.mark.parametrize("name", PROPERTIES)
+def test_phonenumbers_property(benchmark, pn_numbers, name) -> None:
+    benchmark.group = f"property-{name}"
+    function = PROPERTIES[name]
+    benchmark(lambda: [function(numobj) for numobj in pn_numbers])
+
+
+@pytest.mark.benchmark(group="analyze")
+def test_digitz_analyze(benchmark, digitz_numbers) -> None:
+    benchmark.pedantic(
+        lambda numbers: [number.analyze() for number in numbers],
+        setup=lambda: ((fresh_copies(digitz_numbers),), {}),
+        rounds=20,
+    )
+
+
+@pytest.mark.benchmark(group="analyze")
+def test_digitz_analyze_properties(benchmark, digitz_numbers) -> None:
+    names = ["region_code", "is_valid", "number_type", "is_possible"]
+    benchmark.pedantic(
+        lambda numbers: [[getattr(n, name) for name in names] for n in numbers],
+        setup=lambda: ((fresh_copies(digitz_numbers),), {}),
+        rounds=20,
+    )
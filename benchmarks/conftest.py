@@ -0,0 +1,57 @@
+"""Corpora shared by the benchmarks.
+
+The corpora hold the example number of every region for every phone number
+type, so that the benchmarks cover the metadata of all regions instead of a
+handful of NANPA numbers.
+"""
+import phonenumbers as pn
+import pytest
+
+from digitz import PhoneNumber
+from digitz.enums import PhoneNumberFormat, PhoneNumberType
+
+
+def _example_numbers() -> list[tuple[pn.PhoneNumber, str]]:
+    numbers = []
+    for region in sorted(pn.SUPPORTED_REGIONS):
+        for number_type in PhoneNumberType:
+            if number_type == PhoneNumberType.UNKNOWN:
+                continue
+            numobj = pn.example_number_for_type(region, number_type)
+            if numobj is not None:
+                numbers.append((numobj, region))
+    return numbers
+
+
+EXAMPLE_NUMBERS = _example_numbers()
+
+
+def fresh_copies(numbers: list[PhoneNumber]) -> list[PhoneNumber]:
+    """Returns copies of phone numbers without any cached properties."""
+    return [PhoneNumber._from_fields(*number.to_tuple()) for number in numbers]
+
+
+@pytest.fixture(scope="session")
+def e164_strings() -> list[str]:
+    return [
+        pn.format_number(numobj, PhoneNumberFormat.E164)
+        for numobj, _ in EXAMPLE_NUMBERS
+    ]
+
+
+@pytest.fixture(scope="session")
+def national_strings() -> list[tuple[str, str]]:
+    return [
+        (pn.format_number(numobj, PhoneNumberFormat.NATIONAL), region)
+        for numobj, region in EXAMPLE_NUMBERS
+    ]
+
+
+@pytest.fixture(scope="session")
+def pn_numbers() -> list[pn.PhoneNumber]:
+    return [numobj for numobj, _ in EXAMPLE_NUMBERS]
+
+
+@pytest.fixture(scope="session")
+def digitz_numbers() -> list[PhoneNumber]:
+    return [PhoneNumber._from_numobj(numobj) for numobj, _ in EXAMPLE_NUMBERS]
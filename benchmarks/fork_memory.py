@@ -0,0 +1,115 @@
+"""Measures the private memory of forked worker processes with and without preloading.
+
+For each mode, a fresh parent process prepares itself, forks the workers and
+each worker parses, formats and looks up the example numbers of every region
+and then runs a garbage collection, like a long-running worker eventually
+does. The private memory of a worker is the memory it does not share with
+the parent or the other workers (Private_Clean + Private_Dirty in
+/proc/<pid>/smaps_rollup). Requires Linux.
+
+Modes:
+    lazy: The parent does not load anything before forking.
+    warmup: The parent calls digitz.warmup() before forking.
+    preload: The parent calls digitz.preload_for_fork() before forking.
+
+Run with: python benchmarks/fork_memory.py [--workers 4] [--modes lazy preload]
+"""
+
+import argparse
+import gc
+import os
+import subprocess
+import sys
+
+MODES = ("lazy", "warmup", "preload")
+
+
+def memory() -> dict[str, int]:
+    """Returns the private and proportional memory of this process, in bytes."""
+    values = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            name, _, rest = line.partition(":")
+            if name in ("Pss", "Private_Clean", "Private_Dirty"):
+                values[name] = int(rest.split()[0]) * 1024
+    return {
+        "private": values["Private_Clean"] + values["Private_Dirty"],
+        "pss": values["Pss"],
+    }
+
+
+def workload() -> None:
+    import phonenumbers as pn
+
+    from digitz import PhoneNumber, PhoneNumberType
+
+    for region in sorted(pn.SUPPORTED_REGIONS):
+        for number_type in (PhoneNumberType.FIXED_LINE, PhoneNumberType.MOBILE):
+            numobj = pn.example_number_for_type(region, number_type)
+            if numobj is None:
+                continue
+            num = PhoneNumber.parse(pn.format_number(numobj, pn.PhoneNumberFormat.E164))
+            num.to_national()
+            num.number_type
+            num.timezones
+            num.get_carrier_name("en")
+            num.get_description("en")
+    gc.collect()
+
+
+def run_mode(mode: str, workers: int) -> None:
+    """Runs one mode in this process and prints the memory of each worker."""
+    import digitz
+
+    if mode == "warmup":
+        digitz.warmup()
+    elif mode == "preload":
+        digitz.preload_for_fork()
+
+    pipes = []
+    for _ in range(workers):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            workload()
+            usage = memory()
+            os.write(write_fd, f"{usage['private']} {usage['pss']}".encode())
+            os._exit(0)
+        os.close(write_fd)
+        pipes.append((pid, read_fd))
+
+    for pid, read_fd in pipes:
+        with os.fdopen(read_fd) as f:
+            print(f.read())
+        os.waitpid(pid, 0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode is not None:
+        run_mode(args.mode, args.workers)
+        return
+
+    print(f"{'mode':>8} {'private/worker':>15} {'PSS/worker':>12}")
+    for mode in args.modes:
+        # Each mode runs in a fresh parent process.
+        output = subprocess.run(
+            [sys.executable, __file__, "--mode", mode, f"--workers={args.workers}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        usages = [tuple(map(int, line.split())) for line in output.splitlines()]
+        private = sum(usage[0] for usage in usages) / len(usages)
+        pss = sum(usage[1] for usage in usages) / len(usages)
+        print(f"{mode:>8} {private / 2**20:>12.1f} MB {pss / 2**20:>9.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
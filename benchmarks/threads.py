@@ -0,0 +1,89 @@
+"""Measures the throughput of parsing and formatting as the number of threads grows.
+
+On a free-threaded build of Python the throughput should grow with the number
+of threads up to the number of cores, while with the GIL it stays flat.
+
+Run with: python benchmarks/threads.py [--threads 1 2 4 8] [--size 100000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from typing import Callable
+
+from digitz import PhoneNumber
+
+
+def build_corpus(size: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        f"({rng.randint(201, 989)}) {rng.randint(200, 999)}-{rng.randint(0, 9999):04d}"
+        for _ in range(size)
+    ]
+
+
+def parse(strings: list[str]) -> None:
+    for string in strings:
+        PhoneNumber.parse(string, region="US")
+
+
+def parse_and_format(strings: list[str]) -> None:
+    for string in strings:
+        num = PhoneNumber.parse(string, region="US")
+        num.to_e164()
+        num.to_national()
+        num.number_type
+
+
+def run(func: Callable[[list[str]], None], corpus: list[str], threads: int) -> float:
+    """Returns the seconds it takes the threads to process the corpus together."""
+    parts = [corpus[index::threads] for index in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    def target(part: list[str]) -> None:
+        barrier.wait()
+        func(part)
+
+    workers = [threading.Thread(target=target, args=(part,)) for part in parts]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    cpus = os.cpu_count() or 1
+    default_threads = sorted({2**power for power in range(cpus.bit_length())} | {cpus})
+    parser.add_argument("--threads", type=int, nargs="+", default=default_threads)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    gil = "enabled" if getattr(sys, "_is_gil_enabled", lambda: True)() else "disabled"
+    print(f"Python {sys.version.split()[0]}, GIL {gil}, {cpus} CPUs")
+
+    corpus = build_corpus(args.size)
+    # Loads the metadata before the first measurement.
+    parse_and_format(corpus[:100])
+
+    for func in (parse, parse_and_format):
+        baseline = None
+        for threads in args.threads:
+            best = min(run(func, corpus, threads) for _ in range(args.repeat))
+            throughput = args.size / best
+            baseline = baseline or throughput
+            print(
+                f"{func.__name__:>16} {threads:>3} threads: "
+                f"{throughput:>10,.0f} numbers/s ({throughput / baseline:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Compares PhoneNumber.parse() and PhoneNumber.try_parse() on a corpus of
+mostly invalid strings.
+
+Run with: python benchmarks/try_parse.py [--invalid-ratio 0.7] [--size 100000]
+"""
+
+import argparse
+import random
+import string
+import time
+
+from digitz import NumberParseException, PhoneNumber
+
+
+def build_corpus(size: int, invalid_ratio: float, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        if rng.random() >= invalid_ratio:
+            corpus.append(f"({rng.randint(201, 989)}) 555-{rng.randint(0, 9999):04d}")
+            continue
+        kind = rng.randrange(4)
+        if kind == 0:
+            corpus.append("".join(rng.choices(string.ascii_letters, k=8)))
+        elif kind == 1:
+            corpus.append(f"{rng.choice(['n/a', 'none', '-', 'unknown', ''])}")
+        elif kind == 2:
+            corpus.append(str(rng.randint(0, 9)))
+        else:
+            corpus.append(f"john.doe{rng.randint(0, 999)}@example.com")
+    return corpus
+
+
+def with_parse(corpus: list[str]) -> int:
+    valid = 0
+    for number in corpus:
+        try:
+            PhoneNumber.parse(number, region="US")
+        except NumberParseException:
+            continue
+        valid += 1
+    return valid
+
+
+def with_try_parse(corpus: list[str]) -> int:
+    valid = 0
+    for number in corpus:
+        if PhoneNumber.try_parse(number, region="US"):
+            valid += 1
+    return valid
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--invalid-ratio", type=float, default=0.7)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.size, args.invalid_ratio)
+    funcs = (with_parse, with_try_parse)
+    timings = {func.__name__: float("inf") for func in funcs}
+    valid = {}
+    # The runs are interleaved, so that drift affects both functions alike.
+    for _ in range(args.repeat):
+        for func in funcs:
+            start = time.perf_counter()
+            valid[func.__name__] = func(corpus)
+            elapsed = time.perf_counter() - start
+            timings[func.__name__] = min(timings[func.__name__], elapsed)
+
+    for name, best in timings.items():
+        print(
+            f"{name:>15}: {best:.3f}s "
+            f"({args.size / best:,.0f} strings/s, {valid[name]} valid)"
+        )
+
+    speedup = timings["with_parse"] / timings["with_try_parse"]
+    print(f"try_parse is {speedup:.2f}x as fast at {args.invalid_ratio:.0%} invalid")
+
+
+if __name__ == "__main__":
+    main()
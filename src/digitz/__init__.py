@@ -1,18 +1,72 @@
-from phonenumbers import NumberParseException
+from importlib import import_module
+
 from .enums import (
     CountryCodeSource,
     NumberParseErrorType,
     PhoneNumberFormat,
     PhoneNumberType,
 )
-from .phonenumbers import PhoneNumber
+
+# Avoids importing typing, which alone takes longer than the rest of digitz.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from phonenumbers import NumberParseException
+    from .deduplication import dedupe
+    from .instrumentation import stats
+    from .parser import Parser, normalize, normalize_many
+    from .phonenumbers import NumberInfo, ParseFailure, PhoneNumber
+    from .preload import preload_for_fork, warmup
+# Type checkers only recognize the name TYPE_CHECKING, so it is deleted instead
+# of renamed to keep it out of the public namespace.
+del TYPE_CHECKING
 
 
 __all__ = [
     "CountryCodeSource",
+    "NumberInfo",
     "NumberParseErrorType",
     "NumberParseException",
+    "ParseFailure",
+    "Parser",
     "PhoneNumber",
     "PhoneNumberFormat",
     "PhoneNumberType",
+    "dedupe",
+    "normalize",
+    "normalize_many",
+    "preload_for_fork",
+    "stats",
+    "warmup",
 ]
+
+
+# Importing phonenumbers dominates the import time of digitz, so the names
+# that depend on it are only imported when they are first accessed.
+_LAZY_IMPORTS = {
+    "NumberInfo": "digitz.phonenumbers",
+    "NumberParseException": "phonenumbers",
+    "ParseFailure": "digitz.phonenumbers",
+    "Parser": "digitz.parser",
+    "PhoneNumber": "digitz.phonenumbers",
+    "dedupe": "digitz.deduplication",
+    "normalize": "digitz.parser",
+    "normalize_many": "digitz.parser",
+    "preload_for_fork": "digitz.preload",
+    "stats": "digitz.instrumentation",
+    "warmup": "digitz.preload",
+}
+
+
+def __getattr__(name: str) -> object:
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,10 @@
+# SPDX-FileCopyrightText: 2023-present Ryan Kroon <rykroon.tech@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import sys
+
+from digitz.cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+# SPDX-FileCopyrightText: 2023-present Ryan Kroon <rykroon.tech@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""Coroutines that run parsing and metadata lookups without blocking the event loop.
+
+The work is offloaded to an executor, which is the event loop's default
+executor unless one is set with `set_executor()`. Concurrent calls with the
+same arguments are coalesced into a single call.
+"""
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Hashable,
+    Iterable,
+    TypeVar,
+)
+from weakref import WeakKeyDictionary
+
+from zoneinfo import ZoneInfo
+
+from digitz.phonenumbers import ParseErrors, ParseFailure, PhoneNumber
+
+
+__all__ = [
+    "get_carrier_name",
+    "get_country_name",
+    "get_description",
+    "parse",
+    "parse_batches",
+    "parse_many",
+    "set_executor",
+    "timezones",
+]
+
+
+T = TypeVar("T")
+
+_executor: Executor | None = None
+
+# The calls in flight per event loop, as futures are bound to their loop.
+_inflight: "WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Hashable, Any]]" = (
+    WeakKeyDictionary()
+)
+
+
+def set_executor(executor: Executor | None) -> None:
+    """Sets the executor the work is offloaded to.
+
+    Parameters:
+        executor: The executor, or None to use the event loop's default executor.
+    """
+    global _executor
+    _executor = executor
+
+
+async def _run(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, partial(func, *args, **kwargs))
+
+
+async def _coalesce(
+    key: Hashable, func: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    loop = asyncio.get_running_loop()
+    inflight = _inflight.setdefault(loop, {})
+    future = inflight.get(key)
+    if future is None:
+        future = loop.run_in_executor(_executor, partial(func, *args, **kwargs))
+        inflight[key] = future
+        future.add_done_callback(lambda _: inflight.pop(key, None))
+
+    # Shielded so that a cancelled caller does not cancel the other callers.
+    return await asyncio.shield(future)
+
+
+async def parse(
+    number: str,
+    /,
+    *,
+    region: str | None = None,
+    keep_raw_input: bool = False,
+) -> PhoneNumber:
+    """Attempts to parse a string and return a new PhoneNumber object.
+
+    Parameters:
+        number: The phone number to parse.
+        region: The region code the phone number is expected to be from.
+        keep_raw_input: Whether to keep the raw input of the phone number.
+
+    Raises:
+        NumberParseException: If the phone number cannot be parsed.
+
+    Returns:
+        A new PhoneNumber object.
+    """
+    return await _coalesce(
+        ("parse", number, region, keep_raw_input),
+        PhoneNumber.parse,
+        number,
+        region=region,
+        keep_raw_input=keep_raw_input,
+    )
+
+
+async def parse_many(
+    numbers: Iterable[str | tuple[str, str | None]],
+    /,
+    *,
+    region: str | None = None,
+    keep_raw_input: bool = False,
+    errors: ParseErrors = "raise",
+) -> list[Any]:
+    """Parses many strings and returns the results in input order.
+
+    See `PhoneNumber.parse_many()` for the meaning of the parameters.
+    """
+    return await _run(
+        PhoneNumber.parse_many,
+        list(numbers),
+        region=region,
+        keep_raw_input=keep_raw_input,
+        errors=errors,
+    )
+
+
+async def parse_batches(
+    numbers: Iterable[str] | AsyncIterable[str],
+    /,
+    *,
+    region: str | None = None,
+    keep_raw_input: bool = False,
+    errors: ParseErrors = "raise",
+    batch_size: int = 1000,
+) -> AsyncIterator[list[PhoneNumber | ParseFailure]]:
+    """Parses a stream of strings and yields the results one batch at a time.
+
+    Only one batch of input is held in memory at a time. See
+    `PhoneNumber.parse_many()` for the meaning of the other parameters.
+
+    Parameters:
+        numbers: The phone numbers to parse.
+        batch_size: The number of strings parsed per batch.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be greater than zero.")
+
+    if isinstance(numbers, AsyncIterable):
+        batch: list[str] = []
+        async for number in numbers:
+            batch.append(number)
+            if len(batch) == batch_size:
+                yield await parse_many(
+                    batch, region=region, keep_raw_input=keep_raw_input, errors=errors
+                )
+                batch = []
+        if batch:
+            yield await parse_many(
+                batch, region=region, keep_raw_input=keep_raw_input, errors=errors
+            )
+        return
+
+    iterator = iter(numbers)
+    while batch := list(islice(iterator, batch_size)):
+        yield await parse_many(
+            batch, region=region, keep_raw_input=keep_raw_input, errors=errors
+        )
+
+
+async def timezones(number: PhoneNumber, /) -> tuple[ZoneInfo, ...]:
+    """Returns the timezones of the phone number."""
+    return await _coalesce(("timezones", number), getattr, number, "timezones")
+
+
+async def get_carrier_name(number: PhoneNumber, /, lang: str) -> str:
+    """Returns the carrier name of the phone number.
+
+    Parameters:
+        number: The phone number.
+        lang: The language to use.
+    """
+    return await _coalesce(
+        ("get_carrier_name", number, lang), number.get_carrier_name, lang
+    )
+
+
+async def get_country_name(number: PhoneNumber, /, lang: str) -> str:
+    """Returns the country name of the phone number.
+
+    Parameters:
+        number: The phone number.
+        lang: The language to use.
+    """
+    return await _coalesce(
+        ("get_country_name", number, lang), number.get_country_name, lang
+    )
+
+
+async def get_description(number: PhoneNumber, /, lang: str) -> str:
+    """Returns the description of the phone number.
+
+    Parameters:
+        number: The phone number.
+        lang: The language to use.
+    """
+    return await _coalesce(
+        ("get_description", number, lang), number.get_description, lang
+    )
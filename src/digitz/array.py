@@ -0,0 +1,288 @@
+# SPDX-FileCopyrightText: 2023-present Ryan Kroon <rykroon.tech@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+from typing import Any, Callable, Iterable, Iterator, overload
+
+import phonenumbers as pn
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "PhoneNumberArray requires numpy, install it with 'pip install digitz[numpy]'."
+    ) from e
+
+from digitz.phonenumbers import PhoneNumber
+
+
+__all__ = ["PhoneNumberArray"]
+
+
+class PhoneNumberArray:
+    """
+    A columnar container of phone numbers backed by NumPy arrays.
+
+    Properties are computed for the whole array at once. Those that only
+    depend on the country code and the length of the national significant
+    number are computed once per combination of the two, the others once per
+    distinct number.
+
+    The raw input, country code source and preferred domestic carrier code of
+    a phone number are not stored. The Italian leading zero and the number of
+    leading zeros are stored as a single count of the zeros that the national
+    significant number starts with. A phone number therefore comes back with
+    number_of_leading_zeros None instead of 1, and without an Italian leading
+    zero where it had a count of 0 or number_of_leading_zeros without an
+    Italian leading zero. Such a phone number has the same national
+    significant number and formats the same, but it is not equal to the
+    original.
+
+    Parameters:
+        country_code: The country codes of the phone numbers.
+        national_number: The national numbers of the phone numbers.
+        leading_zeros: The number of leading zeros of the national significant numbers.
+        extension: The extensions of the phone numbers.
+    """
+
+    def __init__(
+        self,
+        country_code: Any,
+        national_number: Any,
+        leading_zeros: Any = None,
+        extension: Any = None,
+    ) -> None:
+        self.country_code = np.asarray(country_code, dtype=np.uint16)
+        self.national_number = np.asarray(national_number, dtype=np.uint64)
+
+        size = len(self.country_code)
+        if leading_zeros is None:
+            self.leading_zeros = np.zeros(size, dtype=np.uint8)
+        else:
+            self.leading_zeros = np.asarray(leading_zeros, dtype=np.uint8)
+
+        if extension is None:
+            self.extension = np.full(size, None, dtype=object)
+        else:
+            self.extension = np.asarray(extension, dtype=object)
+
+        columns = (
+            self.country_code,
+            self.national_number,
+            self.leading_zeros,
+            self.extension,
+        )
+        if any(column.ndim != 1 or len(column) != size for column in columns):
+            raise ValueError("All columns must be one dimensional and of equal length.")
+
+    @classmethod
+    def from_phone_numbers(
+        cls, numbers: Iterable[pn.PhoneNumber], /
+    ) -> "PhoneNumberArray":
+        """Returns a new PhoneNumberArray from phone number objects.
+
+        Parameters:
+            numbers: The phone numbers.
+
+        Returns:
+            A new PhoneNumberArray object.
+        """
+        country_codes = []
+        national_numbers = []
+        leading_zeros = []
+        extensions = []
+        for numobj in numbers:
+            country_codes.append(numobj.country_code or 0)
+            national_numbers.append(numobj.national_number or 0)
+            if not numobj.italian_leading_zero:
+                leading_zeros.append(0)
+            elif numobj.number_of_leading_zeros is None:
+                leading_zeros.append(1)
+            else:
+                leading_zeros.append(numobj.number_of_leading_zeros)
+            extensions.append(numobj.extension)
+
+        return cls(country_codes, national_numbers, leading_zeros, extensions)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, /) -> "PhoneNumberArray":
+        """Returns a new PhoneNumberArray from phone numbers encoded with
+        `digitz.codec.encode_many()`.
+
+        Parameters:
+            data: The encoded phone numbers.
+
+        Raises:
+            ValueError: If the data is not encoded phone numbers of a supported version.
+
+        Returns:
+            A new PhoneNumberArray object.
+        """
+        from digitz.codec import decode_many
+
+        return cls.from_phone_numbers(decode_many(data))
+
+    def to_phone_numbers(self) -> list[PhoneNumber]:
+        """Returns the phone numbers as a list of PhoneNumber objects."""
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self.country_code)
+
+    def __iter__(self) -> Iterator[PhoneNumber]:
+        for index in range(len(self)):
+            yield self._phone_number(index)
+
+    @overload
+    def __getitem__(self, key: int) -> PhoneNumber: ...
+
+    @overload
+    def __getitem__(self, key: Any) -> "PhoneNumberArray": ...
+
+    def __getitem__(self, key: Any) -> "PhoneNumber | PhoneNumberArray":
+        """Returns a PhoneNumber for an integer, or a new PhoneNumberArray
+        for a slice, an index array or a boolean mask."""
+        if isinstance(key, (int, np.integer)):
+            if not -len(self) <= key < len(self):
+                raise IndexError("PhoneNumberArray index out of range")
+            return self._phone_number(int(key) % len(self))
+
+        return PhoneNumberArray(
+            self.country_code[key],
+            self.national_number[key],
+            self.leading_zeros[key],
+            self.extension[key],
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_e164().tolist()!r})"
+
+    def _phone_number(self, index: int) -> PhoneNumber:
+        leading_zeros = int(self.leading_zeros[index])
+        return PhoneNumber(
+            country_code=int(self.country_code[index]),
+            national_number=int(self.national_number[index]),
+            extension=self.extension[index],
+            italian_leading_zero=leading_zeros > 0,
+            number_of_leading_zeros=leading_zeros if leading_zeros > 1 else None,
+        )
+
+    def _map_unique(self, func: Callable[[pn.PhoneNumber], Any], dtype: Any) -> Any:
+        """Applies func once per distinct number and broadcasts the results."""
+        if len(self) == 0:
+            return np.empty(0, dtype=dtype)
+
+        keys = np.stack(
+            [
+                self.country_code.astype(np.uint64),
+                self.national_number,
+                self.leading_zeros.astype(np.uint64),
+            ],
+            axis=1,
+        )
+        unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        results = np.empty(len(unique_keys), dtype=dtype)
+        for index, (country_code, national_number, leading_zeros) in enumerate(
+            unique_keys.tolist()
+        ):
+            numobj = pn.PhoneNumber(
+                country_code=country_code,
+                national_number=national_number,
+                italian_leading_zero=leading_zeros > 0,
+                number_of_leading_zeros=leading_zeros if leading_zeros > 1 else None,
+            )
+            results[index] = func(numobj)
+        return results[inverse.reshape(-1)]
+
+    # ~~~ national number related properties ~~~
+    def national_significant_number(self) -> Any:
+        """Returns the national significant numbers."""
+        zeros = np.char.multiply("0", self.leading_zeros.astype(np.int64))
+        return np.char.add(zeros, self.national_number.astype(str))
+
+    def nsn(self) -> Any:
+        """An alias for the national_significant_number method."""
+        return self.national_significant_number()
+
+    def national_destination_code(self) -> Any:
+        """Returns the national destination codes."""
+        nsn = self.national_significant_number()
+        lengths = self._map_unique(pn.length_of_national_destination_code, np.int64)
+        return np.array(
+            [number[:length] for number, length in zip(nsn.tolist(), lengths.tolist())],
+            dtype=nsn.dtype,
+        )
+
+    def ndc(self) -> Any:
+        """An alias for the national_destination_code method."""
+        return self.national_destination_code()
+
+    # ~~~ region related properties ~~~
+    def region_code(self) -> Any:
+        """Returns the region codes, or None where there is no region."""
+        results = np.full(len(self), None, dtype=object)
+        for country_code, indices in self._country_code_groups():
+            regions = pn.COUNTRY_CODE_TO_REGION_CODE.get(country_code)
+            if regions is None:
+                continue
+            if len(regions) == 1:
+                results[indices] = regions[0]
+            else:
+                results[indices] = self[indices]._map_unique(
+                    pn.region_code_for_number, object
+                )
+        return results
+
+    # ~~~ phone number validity properties ~~~
+    def is_possible(self) -> Any:
+        """Returns a boolean array that is True where the phone number is possible."""
+        if len(self) == 0:
+            return np.empty(0, dtype=bool)
+
+        nsn_lengths = np.char.str_len(self.national_number.astype(str))
+        nsn_lengths = nsn_lengths.astype(np.int64) + self.leading_zeros
+        keys = np.stack([self.country_code.astype(np.int64), nsn_lengths], axis=1)
+        unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+
+        # The result only depends on the country code and the length of the
+        # national significant number, so any number of that length will do.
+        results = np.array(
+            [
+                pn.is_possible_number(
+                    pn.PhoneNumber(
+                        country_code=country_code,
+                        national_number=10 ** (nsn_length - 1),
+                    )
+                )
+                for country_code, nsn_length in unique_keys.tolist()
+            ],
+            dtype=bool,
+        )
+        return results[inverse.reshape(-1)]
+
+    # ~~~ Number type properties ~~~
+    def number_type(self) -> Any:
+        """Returns the PhoneNumberType values of the phone numbers."""
+        return self._map_unique(pn.number_type, np.uint8)
+
+    # ~~~ Formatting methods ~~~
+    def to_e164(self) -> Any:
+        """Returns the E.164 representations of the phone numbers."""
+        country_codes = np.char.add("+", self.country_code.astype(str))
+        return np.char.add(country_codes, self.national_significant_number())
+
+    # ~~~ Grouping ~~~
+    def _country_code_groups(self) -> Iterator[tuple[int, Any]]:
+        order = np.argsort(self.country_code, kind="stable")
+        country_codes, starts = np.unique(self.country_code[order], return_index=True)
+        for country_code, indices in zip(
+            country_codes.tolist(), np.split(order, starts[1:])
+        ):
+            yield country_code, indices
+
+    def groupby_country_code(self) -> Iterator[tuple[int, "PhoneNumberArray"]]:
+        """Yields each country code together with the phone numbers that have it.
+
+        Within a group the phone numbers keep their original order.
+        """
+        for country_code, indices in self._country_code_groups():
+            yield country_code, self[indices]
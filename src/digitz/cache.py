@@ -0,0 +1,312 @@
+# SPDX-FileCopyrightText: 2023-present Ryan Kroon <rykroon.tech@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+from collections import OrderedDict
+from functools import wraps
+from inspect import signature
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Generic, Hashable, NamedTuple, TypeVar, overload
+
+from digitz import instrumentation
+
+__all__ = [
+    "CacheInfo",
+    "ParseCache",
+    "cached_method",
+    "cached_property",
+    "clear_method_cache",
+    "clear_parse_cache",
+    "configure_method_cache",
+    "disable_parse_cache",
+    "enable_parse_cache",
+    "parse_cache_info",
+]
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cache.
+
+    Attributes:
+        hits: The number of lookups that found an entry.
+        misses: The number of lookups that did not find an entry.
+        evictions: The number of entries removed to make room or because they expired.
+        maxsize: The maximum number of entries.
+        currsize: The current number of entries.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class _Shard:
+    """One LRU shard of a ParseCache, with its own lock and statistics."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.data: OrderedDict[Hashable, tuple[Any, float | None]] = OrderedDict()
+        self.lock = Lock()
+
+
+class ParseCache:
+    """A bounded, thread-safe LRU cache with an optional time to live.
+
+    The entries are spread over shards by the hash of their key, and each
+    shard has its own lock, so that threads looking up different keys rarely
+    wait for each other. Each shard evicts its own least recently used entry.
+
+    Parameters:
+        maxsize: The maximum number of entries.
+        ttl: The number of seconds an entry stays valid, or None to never expire.
+        shards: The number of shards, or None for one shard per 1024 entries,
+            up to 16.
+    """
+
+    def __init__(
+        self, maxsize: int = 4096, ttl: float | None = None, shards: int | None = None
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than zero.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than zero.")
+        if shards is None:
+            shards = max(1, min(16, maxsize // 1024))
+        elif not 0 < shards <= maxsize:
+            raise ValueError("shards must be between one and maxsize.")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._shards = tuple(
+            _Shard(maxsize // shards + (index < maxsize % shards))
+            for index in range(shards)
+        )
+
+    def _shard(self, key: Hashable) -> _Shard:
+        shards = self._shards
+        return shards[hash(key) % len(shards)]
+
+    @property
+    def hits(self) -> int:
+        """The number of lookups that found an entry."""
+        return sum(shard.hits for shard in self._shards)
+
+    @property
+    def misses(self) -> int:
+        """The number of lookups that did not find an entry."""
+        return sum(shard.misses for shard in self._shards)
+
+    @property
+    def evictions(self) -> int:
+        """The number of entries removed to make room or because they expired."""
+        return sum(shard.evictions for shard in self._shards)
+
+    def __len__(self) -> int:
+        return sum(len(shard.data) for shard in self._shards)
+
+    def get(self, key: Hashable) -> Any:
+        """Returns the value stored for the key, or None if there is none."""
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.data.get(key)
+            if entry is None:
+                shard.misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= monotonic():
+                del shard.data[key]
+                shard.evictions += 1
+                shard.misses += 1
+                return None
+
+            shard.data.move_to_end(key)
+            shard.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Stores the value for the key, evicting the least recently used entry if full."""
+        expires_at = None if self.ttl is None else monotonic() + self.ttl
+        shard = self._shard(key)
+        with shard.lock:
+            shard.data[key] = (value, expires_at)
+            shard.data.move_to_end(key)
+            if len(shard.data) > shard.maxsize:
+                shard.data.popitem(last=False)
+                shard.evictions += 1
+
+    def clear(self) -> None:
+        """Removes all entries and resets the statistics."""
+        for shard in self._shards:
+            with shard.lock:
+                shard.data.clear()
+                shard.hits = shard.misses = shard.evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Returns the statistics of the cache."""
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self)
+        )
+
+
+parse_cache: ParseCache | None = None
+
+
+def enable_parse_cache(
+    maxsize: int = 4096, ttl: float | None = None, shards: int | None = None
+) -> None:
+    """Enables the process-wide cache in front of PhoneNumber.parse().
+
+    Successful results are shared PhoneNumber instances, which is safe because
+    PhoneNumber is immutable. Failures are cached too and re-raised as a
+    NumberParseException with the original error type.
+
+    Parameters:
+        maxsize: The maximum number of entries.
+        ttl: The number of seconds an entry stays valid, or None to never expire.
+        shards: The number of shards, or None for one shard per 1024 entries,
+            up to 16.
+    """
+    global parse_cache
+    parse_cache = ParseCache(maxsize=maxsize, ttl=ttl, shards=shards)
+
+
+def disable_parse_cache() -> None:
+    """Disables and discards the process-wide parse cache."""
+    global parse_cache
+    parse_cache = None
+
+
+def clear_parse_cache() -> None:
+    """Removes all entries from the process-wide parse cache."""
+    if parse_cache is not None:
+        parse_cache.clear()
+
+
+def parse_cache_info() -> CacheInfo | None:
+    """Returns the statistics of the parse cache, or None if it is disabled."""
+    if parse_cache is None:
+        return None
+    return parse_cache.info()
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+T = TypeVar("T")
+
+method_cache_enabled = True
+method_cache_maxsize = 32
+
+
+def configure_method_cache(
+    *, enabled: bool | None = None, maxsize: int | None = None
+) -> None:
+    """Configures the caching of methods decorated with cached_method.
+
+    Parameters:
+        enabled: Whether results are cached.
+        maxsize: The maximum number of cached results per instance.
+    """
+    global method_cache_enabled, method_cache_maxsize
+    if maxsize is not None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than zero.")
+        method_cache_maxsize = maxsize
+    if enabled is not None:
+        method_cache_enabled = enabled
+
+
+def clear_method_cache(obj: Any) -> None:
+    """Removes the cached method results of an instance."""
+    obj.__dict__.pop("_method_cache", None)
+
+
+def cached_method(method: F) -> F:
+    """Caches the results of a method in the instance it is called on.
+
+    Like functools.cached_property, the results are stored in the instance's
+    __dict__, so they are released together with the instance and the
+    instance itself is never hashed. Calls with the same arguments share a
+    result, whether the arguments are passed by position, by keyword or left
+    to their defaults.
+    """
+    name = method.__name__
+    method_signature = signature(method)
+    # The number of parameters after self.
+    parameter_count = len(method_signature.parameters) - 1
+
+    @wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if not method_cache_enabled:
+            return method(self, *args, **kwargs)
+
+        if kwargs or len(args) != parameter_count:
+            bound = method_signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            args = bound.args[1:]
+            kwargs = bound.kwargs
+        key = (name, *args, *kwargs.items()) if kwargs else (name, *args)
+        try:
+            result = self.__dict__["_method_cache"][key]
+        except KeyError:
+            pass
+        else:
+            recorder = instrumentation.recorder
+            if recorder is not None:
+                recorder.record_method_cache(True)
+            return result
+
+        recorder = instrumentation.recorder
+        if recorder is not None:
+            recorder.record_method_cache(False)
+        result = method(self, *args, **kwargs)
+        results = self.__dict__.setdefault("_method_cache", {})
+        if len(results) >= method_cache_maxsize:
+            # Another thread may be evicting the same entry.
+            try:
+                del results[next(iter(results))]
+            except (KeyError, RuntimeError, StopIteration):
+                pass
+        results[key] = result
+        return result
+
+    return wrapper  # type: ignore[return-value]
+
+
+class cached_property(Generic[T]):
+    """Like functools.cached_property, without a lock.
+
+    Before Python 3.12, functools.cached_property holds one lock per property
+    for all instances of the class while it computes a value, so threads that
+    compute the same property of different instances wait for each other.
+    The cached properties of digitz are pure functions of an immutable
+    instance, so when threads race to compute the same value, each stores an
+    equal result and the last one wins.
+    """
+
+    def __init__(self, func: Callable[[Any], T]) -> None:
+        self.func = func
+        self.attrname = func.__name__
+        self.__doc__ = func.__doc__
+        self.__module__ = func.__module__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attrname = name
+
+    @overload
+    def __get__(
+        self, instance: None, owner: type | None = None
+    ) -> "cached_property[T]": ...
+
+    @overload
+    def __get__(self, instance: object, owner: type | None = None) -> T: ...
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        value = instance.__dict__[self.attrname] = self.func(instance)
+        return value
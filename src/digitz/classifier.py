@@ -0,0 +1,214 @@
+# SPDX-FileCopyrightText: 2023-present Ryan Kroon <rykroon.tech@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""A compiled classifier of phone number types.
+
+phonenumbers determines the type of a phone number by matching its national
+significant number against the pattern of each type of its region in turn,
+compiling or looking up every pattern on the way. Instead, the patterns of
+the types that a national significant number of a given length can have are
+combined into one regular expression per region and length, with a group per
+type in the order phonenumbers checks them, so that the type is determined by
+a single match. The regular expressions are compiled the first time a region
+and length is classified.
+"""
+import re
+
+import phonenumbers as pn
+
+from digitz.enums import PhoneNumberType
+
+
+__all__ = ["number_type"]
+
+
+# The number types in the order pn.number_type() checks them. Fixed line
+# numbers that are mobile numbers too are fixed line or mobile numbers.
+_TYPES = (
+    ("premium_rate", PhoneNumberType.PREMIUM_RATE),
+    ("toll_free", PhoneNumberType.TOLL_FREE),
+    ("shared_cost", PhoneNumberType.SHARED_COST),
+    ("voip", PhoneNumberType.VOIP),
+    ("personal_number", PhoneNumberType.PERSONAL_NUMBER),
+    ("pager", PhoneNumberType.PAGER),
+    ("uan", PhoneNumberType.UAN),
+    ("voicemail", PhoneNumberType.VOICEMAIL),
+    ("fixed_line", PhoneNumberType.FIXED_LINE),
+    ("mobile", PhoneNumberType.MOBILE),
+)
+
+
+def _pattern_for_length(desc: pn.PhoneNumberDesc | None, length: int) -> str | None:
+    """Returns the pattern of a description if numbers of the length can match it."""
+    if desc is None or not desc.national_number_pattern:
+        return None
+    if desc.possible_length and length not in desc.possible_length:
+        return None
+    return desc.national_number_pattern
+
+
+# The combined pattern of a region and length, the number type of each of its
+# groups and the mobile pattern, if fixed line numbers can be mobile numbers.
+_Table = tuple[
+    re.Pattern[str] | None, dict[str, PhoneNumberType], re.Pattern[str] | None
+]
+
+
+class _RegionClassifier:
+    """Classifies the national significant numbers of one region."""
+
+    def __init__(self, metadata: pn.PhoneMetadata) -> None:
+        self._metadata = metadata
+        self._tables: dict[int, _Table] = {}
+
+    def _compile(self, length: int) -> _Table:
+        metadata = self._metadata
+        general = _pattern_for_length(metadata.general_desc, length)
+        if general is None:
+            return None, {}, None
+
+        same_mobile = metadata.same_mobile_and_fixed_line_pattern
+        alternatives = []
+        types = {}
+        for index, (name, number_type) in enumerate(_TYPES):
+            if number_type == PhoneNumberType.MOBILE and same_mobile:
+                continue
+            pattern = _pattern_for_length(getattr(metadata, name), length)
+            if pattern is not None:
+                alternatives.append(f"(?P<t{index}>{pattern})")
+                types[f"t{index}"] = number_type
+
+        if not alternatives:
+            return None, {}, None
+
+        # The lookahead requires the general pattern to match the whole number.
+        combined = re.compile(f"(?=(?:{general})\\Z)(?:{'|'.join(alternatives)})")
+        mobile = None
+        if not same_mobile:
+            mobile_pattern = _pattern_for_length(metadata.mobile, length)
+            if mobile_pattern is not None:
+                mobile = re.compile(mobile_pattern)
+        return combined, types, mobile
+
+    def classify(self, nsn: str) -> PhoneNumberType:
+        """Returns the type of a national significant number of the region."""
+        length = len(nsn)
+        try:
+            combined, types, mobile = self._tables[length]
+        except KeyError:
+            combined, types, mobile = self._tables.setdefault(
+                length, self._compile(length)
+            )
+
+        if combined is None:
+            return PhoneNumberType.UNKNOWN
+        match = combined.fullmatch(nsn)
+        if match is None:
+            return PhoneNumberType.UNKNOWN
+
+        number_type = types[match.lastgroup]  # type: ignore[index]
+        if number_type == PhoneNumberType.FIXED_LINE:
+            if self._metadata.same_mobile_and_fixed_line_pattern or (
+                mobile is not None and mobile.fullmatch(nsn)
+            ):
+                return PhoneNumberType.FIXED_LINE_OR_MOBILE
+        return number_type
+
+    def compile_all(self, max_length: int) -> None:
+        """Compiles the combined patterns of all lengths up to max_length."""
+        for length in range(1, max_length + 1):
+            if length not in self._tables:
+                self._tables.setdefault(length, self._compile(length))
+
+
+_classifiers: dict[tuple[str, int | None], _RegionClassifier] = {}
+
+
+def _classifier(metadata: pn.PhoneMetadata) -> _RegionClassifier:
+    # Non-geographical entities share the region code "001".
+    key = metadata.id, metadata.country_code
+    try:
+        return _classifiers[key]
+    except KeyError:
+        return _classifiers.setdefault(key, _RegionClassifier(metadata))
+
+
+def _classify(nsn: str, metadata: pn.PhoneMetadata) -> PhoneNumberType:
+    return _classifier(metadata).classify(nsn)
+
+
+# The metadata of each region of a country code, with its compiled leading
+# digits pattern, and the metadata of its main region.
+_CountryMetadata = tuple[
+    tuple[tuple[str, pn.PhoneMetadata | None, re.Pattern[str] | None], ...],
+    pn.PhoneMetadata | None,
+]
+
+_country_metadata: dict[int, _CountryMetadata | None] = {}
+
+
+def _metadata_for_country_code(country_code: int) -> _CountryMetadata | None:
+    try:
+        return _country_metadata[country_code]
+    except KeyError:
+        pass
+
+    regions = pn.COUNTRY_CODE_TO_REGION_CODE.get(country_code)
+    if regions is None:
+        result = None
+    else:
+        entries = []
+        for region in regions:
+            metadata = pn.PhoneMetadata.metadata_for_region_or_calling_code(
+                country_code, region
+            )
+            leading_digits = None if metadata is None else metadata.leading_digits
+            pattern = None if leading_digits is None else re.compile(leading_digits)
+            entries.append((region, metadata, pattern))
+        result = tuple(entries), entries[0][1]
+
+    _country_metadata[country_code] = result
+    return result
+
+
+def _region_and_type(
+    nsn: str, country_metadata: _CountryMetadata
+) -> tuple[str | None, PhoneNumberType]:
+    # Mirrors pn.region_code_for_number() and pn.number_type(), which both
+    # match the number type patterns of the region.
+    entries, _ = country_metadata
+    if len(entries) == 1:
+        region, metadata, _ = entries[0]
+        if metadata is None:
+            return region, PhoneNumberType.UNKNOWN
+        return region, _classify(nsn, metadata)
+
+    for region, metadata, pattern in entries:
+        if metadata is None:
+            continue
+        if pattern is not None:
+            if pattern.match(nsn):
+                return region, _classify(nsn, metadata)
+        else:
+            number_type = _classify(nsn, metadata)
+            if number_type != PhoneNumberType.UNKNOWN:
+                return region, number_type
+    return None, PhoneNumberType.UNKNOWN
+
+
+def number_type(numobj: pn.PhoneNumber, /) -> PhoneNumberType:
+    """Returns the type of a phone number.
+
+    The result is the same as `pn.number_type()` returns.
+
+    Parameters:
+        numobj: The phone number.
+
+    Returns:
+        The type of the phone number, or PhoneNumberType.UNKNOWN if it is invalid.
+    """
+    country_metadata = _metadata_for_country_code(numobj.country_code)
+    if country_metadata is None:
+        return PhoneNumberType.UNKNOWN
+    nsn = pn.national_significant_number(numobj)
+    return _region_and_type(nsn, country_metadata)[1]
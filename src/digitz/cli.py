@@ -0,0 +1,283 @@
+# SPDX-FileCopyrightText: 2023-present Ryan Kroon <rykroon.tech@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import argparse
+import csv
+from itertools import islice
+import json
+import sys
+import time
+from typing import IO, Any, Callable, Iterator, Sequence
+
+from digitz.phonenumbers import ParseFailure, PhoneNumber
+
+
+__all__ = ["main"]
+
+
+FORMATS = ("csv", "tsv", "ndjson")
+EXTENSIONS = {".csv": "csv", ".tsv": "tsv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+OUTPUT_FIELDS = ("e164", "national", "region", "type", "valid")
+REJECT_FIELDS = ("error_type", "error")
+
+Writer = Callable[[Any, Sequence[Any]], None]
+# A row, its phone number and the error type and message of a malformed row.
+Row = tuple[Any, str, tuple[str, str] | None]
+
+
+def _infer_format(path: str) -> str:
+    for extension, format in EXTENSIONS.items():
+        if path.endswith(extension):
+            return format
+    return "csv"
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than zero: {value}")
+    return number
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path == "-":
+        return sys.stdin if mode == "r" else sys.stdout
+    return open(path, mode, newline="", encoding="utf-8")
+
+
+def _normalized_fields(num: PhoneNumber) -> tuple[str, str, str, str, bool]:
+    return (
+        num.to_e164(),
+        num.to_national(),
+        num.region_code or "",
+        num.number_type.name,
+        num.is_valid,
+    )
+
+
+class _Table:
+    """Reads and writes rows of a delimited file, keeping the original columns."""
+
+    def __init__(self, input: IO[str], column: str, delimiter: str) -> None:
+        self.reader = csv.reader(input, delimiter=delimiter)
+        self.delimiter = delimiter
+        self.header = next(self.reader, [])
+        if column not in self.header:
+            raise ValueError(f"Column {column!r} not found in the header.")
+        self.index = self.header.index(column)
+
+    def rows(self) -> Iterator[Row]:
+        for row in self.reader:
+            yield row, row[self.index] if self.index < len(row) else "", None
+
+    def writer(self, output: IO[str], fields: Sequence[str]) -> Writer:
+        writer = csv.writer(output, delimiter=self.delimiter, lineterminator="\n")
+        writer.writerow([*self.header, *fields])
+
+        def write(row: list[str], values: Sequence[Any]) -> None:
+            writer.writerow([*row, *(_csv_value(value) for value in values)])
+
+        return write
+
+
+class _Records:
+    """Reads and writes newline delimited JSON objects."""
+
+    def __init__(self, input: IO[str], column: str) -> None:
+        self.input = input
+        self.column = column
+
+    def rows(self) -> Iterator[Row]:
+        for line in self.input:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield {"line": line.rstrip("\r\n")}, "", ("INVALID_JSON", str(e))
+                continue
+            if not isinstance(record, dict):
+                error = ("NOT_AN_OBJECT", "The line is not a JSON object.")
+                yield {"line": line.rstrip("\r\n")}, "", error
+                continue
+            yield record, str(record.get(self.column) or ""), None
+
+    def writer(self, output: IO[str], fields: Sequence[str]) -> Writer:
+        def write(record: dict[str, Any], values: Sequence[Any]) -> None:
+            output.write(json.dumps({**record, **dict(zip(fields, values))}))
+            output.write("\n")
+
+        return write
+
+
+def _csv_value(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def normalize(args: argparse.Namespace) -> int:
+    format = args.format or _infer_format(args.input)
+    input = _open(args.input, "r")
+    output = _open(args.output, "w")
+    rejects = None if args.rejects is None else _open(args.rejects, "w")
+    try:
+        return _normalize(args, format, input, output, rejects)
+    finally:
+        for file in (input, output, rejects):
+            if file is not None and file not in (sys.stdin, sys.stdout):
+                file.close()
+
+
+def _normalize(
+    args: argparse.Namespace,
+    format: str,
+    input: IO[str],
+    output: IO[str],
+    rejects: IO[str] | None,
+) -> int:
+    source: _Table | _Records
+    try:
+        if format == "ndjson":
+            source = _Records(input, args.column)
+        else:
+            source = _Table(input, args.column, "\t" if format == "tsv" else ",")
+    except ValueError as e:
+        print(f"digitz: error: {e}", file=sys.stderr)
+        return 2
+
+    write = source.writer(output, OUTPUT_FIELDS)
+    write_reject: Writer | None = None
+    if rejects is not None:
+        write_reject = source.writer(rejects, REJECT_FIELDS)
+
+    total = rejected = 0
+    start = time.perf_counter()
+    rows = source.rows()
+    # Only one chunk of rows is held in memory at a time.
+    while chunk := list(islice(rows, args.chunk_size)):
+        results = iter(
+            PhoneNumber.parse_many(
+                [number for _, number, error in chunk if error is None],
+                region=args.region,
+                errors="collect",
+            )
+        )
+        for row, _, error in chunk:
+            if error is None:
+                result = next(results)
+                if isinstance(result, ParseFailure):
+                    error = (result.error_type.name, result.message)
+            if error is not None:
+                rejected += 1
+                if write_reject is not None:
+                    write_reject(row, error)
+                else:
+                    write(row, (None,) * len(OUTPUT_FIELDS))
+            else:
+                write(row, _normalized_fields(result))
+
+        total += len(chunk)
+        output.flush()
+
+    if not args.quiet:
+        elapsed = time.perf_counter() - start
+        rate = total / elapsed if elapsed > 0 else 0.0
+        print(
+            f"Processed {total} rows ({rejected} rejected) "
+            f"in {elapsed:.2f}s ({rate:,.0f} rows/s)",
+            file=sys.stderr,
+        )
+
+    return 0
+
+
+def build_index(args: argparse.Namespace) -> int:
+    from digitz.prefixindex import build_prefix_index
+
+    start = time.perf_counter()
+    build_prefix_index(args.output)
+    if not args.quiet:
+        elapsed = time.perf_counter() - start
+        print(f"Built {args.output} in {elapsed:.2f}s", file=sys.stderr)
+    return 0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="digitz", description="Python phone numbers made easy."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    normalize_parser = subparsers.add_parser(
+        "normalize",
+        help="Add normalized phone number columns to a CSV, TSV or NDJSON file.",
+        description=(
+            "Streams the rows of a CSV, TSV or NDJSON file and adds the E.164 and "
+            "national formats, region, type and validity of a phone number column."
+        ),
+    )
+    normalize_parser.add_argument(
+        "input", nargs="?", default="-", help="The input file (default: stdin)."
+    )
+    normalize_parser.add_argument(
+        "-o", "--output", default="-", help="The output file (default: stdout)."
+    )
+    normalize_parser.add_argument(
+        "-c",
+        "--column",
+        default="phone",
+        help="The phone number column (default: phone).",
+    )
+    normalize_parser.add_argument(
+        "-r", "--region", default=None, help="The default region of the phone numbers."
+    )
+    normalize_parser.add_argument(
+        "-f",
+        "--format",
+        choices=FORMATS,
+        default=None,
+        help="The file format (default: inferred from the input file, else csv).",
+    )
+    normalize_parser.add_argument(
+        "--rejects",
+        default=None,
+        help=(
+            "A file for rows that cannot be parsed, with their error type. "
+            "Without it, such rows are kept in the output with empty columns."
+        ),
+    )
+    normalize_parser.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        default=1000,
+        help="The number of rows read and parsed at a time (default: 1000).",
+    )
+    normalize_parser.add_argument(
+        "-q", "--quiet", action="store_true", help="Do not report the throughput."
+    )
+    normalize_parser.set_defaults(func=normalize)
+
+    build_index_parser = subparsers.add_parser(
+        "build-index",
+        help="Compile the carrier, geocoder and country name data into an index file.",
+        description=(
+            "Compiles the carrier, geocoder and country name data of phonenumbers "
+            "into a binary index file that can be memory-mapped with "
+            "digitz.prefixindex.enable_prefix_index()."
+        ),
+    )
+    build_index_parser.add_argument("output", help="The index file to write.")
+    build_index_parser.add_argument(
+        "-q", "--quiet", action="store_true", help="Do not report the build time."
+    )
+    build_index_parser.set_defaults(func=build_index)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Runs the digitz command line interface."""
+    args = _build_parser().parse_args(argv)
+    return args.func(args)
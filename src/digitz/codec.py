@@ -0,0 +1,319 @@
+# SPDX-FileCopyrightText: 2023-present Ryan Kroon <rykroon.tech@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""A compact binary encoding of phone numbers.
+
+A single phone number is encoded as:
+
+- The version of the encoding, as one byte.
+- The flags, as one byte: whether the phone number has an Italian leading
+  zero, a number of leading zeros, an extension, a raw input or a preferred
+  domestic carrier code, and the index of its country code source.
+- The country code and the national number, as varints.
+- The number of leading zeros, as a varint, if present.
+- The extension, raw input and preferred domestic carrier code, each as a
+  varint length followed by UTF-8, if present.
+
+Many phone numbers are encoded into one buffer column by column, so that
+the fixed-size fields can be decoded in bulk:
+
+- A header with the magic bytes, the version and the number of phone numbers.
+- The country codes as uint16, the national numbers as uint64 and the flags
+  and numbers of leading zeros as uint8, each little-endian.
+- The strings of the phone numbers that have them, encoded as above.
+"""
+from array import array
+import struct
+import sys
+from typing import Iterable, Type, TypeVar
+
+import phonenumbers as pn
+
+from digitz.enums import CountryCodeSource
+from digitz.phonenumbers import PhoneNumber
+
+
+__all__ = ["decode", "decode_many", "encode", "encode_many"]
+
+
+VERSION = 1
+MAGIC = b"DGZB"
+_HEADER = struct.Struct("<4sB3xQ")
+
+_ITALIAN_LEADING_ZERO = 0x01
+_LEADING_ZEROS = 0x02
+_EXTENSION = 0x04
+_RAW_INPUT = 0x08
+_CARRIER_CODE = 0x10
+_SOURCE_SHIFT = 5
+
+_SOURCES = tuple(CountryCodeSource)
+_SOURCE_INDEXES = {source: index for index, source in enumerate(_SOURCES)}
+
+P = TypeVar("P", bound=PhoneNumber)
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data: bytes | memoryview, position: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        try:
+            byte = data[position]
+        except IndexError:
+            raise ValueError("Truncated phone number encoding.") from None
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def _write_string(buffer: bytearray, value: str) -> None:
+    encoded = value.encode("utf-8")
+    _write_varint(buffer, len(encoded))
+    buffer += encoded
+
+
+def _read_string(data: bytes | memoryview, position: int) -> tuple[str, int]:
+    length, position = _read_varint(data, position)
+    end = position + length
+    if end > len(data):
+        raise ValueError("Truncated phone number encoding.")
+    return str(data[position:end], "utf-8"), end
+
+
+def _flags(numobj: pn.PhoneNumber) -> int:
+    flags = _SOURCE_INDEXES[CountryCodeSource(numobj.country_code_source or 0)]
+    flags <<= _SOURCE_SHIFT
+    if numobj.italian_leading_zero:
+        flags |= _ITALIAN_LEADING_ZERO
+    if numobj.number_of_leading_zeros is not None:
+        flags |= _LEADING_ZEROS
+    if numobj.extension is not None:
+        flags |= _EXTENSION
+    if numobj.raw_input is not None:
+        flags |= _RAW_INPUT
+    if numobj.preferred_domestic_carrier_code is not None:
+        flags |= _CARRIER_CODE
+    return flags
+
+
+def _write_strings(buffer: bytearray, numobj: pn.PhoneNumber) -> None:
+    for value in (
+        numobj.extension,
+        numobj.raw_input,
+        numobj.preferred_domestic_carrier_code,
+    ):
+        if value is not None:
+            _write_string(buffer, value)
+
+
+def _read_strings(
+    data: bytes | memoryview, position: int, flags: int
+) -> tuple[list[str | None], int]:
+    values: list[str | None] = []
+    for flag in (_EXTENSION, _RAW_INPUT, _CARRIER_CODE):
+        if flags & flag:
+            value, position = _read_string(data, position)
+            values.append(value)
+        else:
+            values.append(None)
+    return values, position
+
+
+def encode(numobj: pn.PhoneNumber, /) -> bytes:
+    """Encodes a phone number.
+
+    Parameters:
+        numobj: The phone number.
+
+    Returns:
+        The encoded phone number.
+    """
+    flags = _flags(numobj)
+    buffer = bytearray((VERSION, flags))
+    _write_varint(buffer, numobj.country_code or 0)
+    _write_varint(buffer, numobj.national_number or 0)
+    if numobj.number_of_leading_zeros is not None:
+        _write_varint(buffer, numobj.number_of_leading_zeros)
+    _write_strings(buffer, numobj)
+    return bytes(buffer)
+
+
+def decode(data: bytes, /) -> PhoneNumber:
+    """Decodes a phone number encoded with `encode()`.
+
+    Parameters:
+        data: The encoded phone number.
+
+    Raises:
+        ValueError: If the data is not an encoded phone number of a supported version.
+
+    Returns:
+        A new PhoneNumber object.
+    """
+    return _decode(data, PhoneNumber)
+
+
+def _decode(data: bytes, cls: Type[P]) -> P:
+    if len(data) < 2 or data[0] != VERSION:
+        raise ValueError("Unsupported phone number encoding.")
+
+    flags = data[1]
+    country_code, position = _read_varint(data, 2)
+    national_number, position = _read_varint(data, position)
+    number_of_leading_zeros = None
+    if flags & _LEADING_ZEROS:
+        number_of_leading_zeros, position = _read_varint(data, position)
+    (extension, raw_input, carrier_code), position = _read_strings(
+        data, position, flags
+    )
+    if position != len(data):
+        raise ValueError("Trailing data after the phone number encoding.")
+    if flags >> _SOURCE_SHIFT >= len(_SOURCES):
+        raise ValueError("Unsupported phone number encoding.")
+
+    return cls._from_fields(
+        country_code,
+        national_number,
+        extension,
+        bool(flags & _ITALIAN_LEADING_ZERO),
+        number_of_leading_zeros,
+        raw_input,
+        _SOURCES[flags >> _SOURCE_SHIFT],
+        carrier_code,
+    )
+
+
+def _to_bytes(values: list[int], typecode: str) -> bytes:
+    column = array(typecode, values)
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column.tobytes()
+
+
+def _from_bytes(data: memoryview, typecode: str) -> list[int]:
+    column = array(typecode)
+    column.frombytes(data)
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column.tolist()
+
+
+def encode_many(numbers: Iterable[pn.PhoneNumber], /) -> bytes:
+    """Encodes many phone numbers into one buffer.
+
+    Parameters:
+        numbers: The phone numbers.
+
+    Raises:
+        ValueError: If a phone number has more than 255 leading zeros.
+
+    Returns:
+        The encoded phone numbers.
+    """
+    country_codes = []
+    national_numbers = []
+    flags = []
+    leading_zeros = []
+    strings = bytearray()
+    for numobj in numbers:
+        country_codes.append(numobj.country_code or 0)
+        national_numbers.append(numobj.national_number or 0)
+        number_flags = _flags(numobj)
+        flags.append(number_flags)
+        number_of_leading_zeros = numobj.number_of_leading_zeros or 0
+        if not 0 <= number_of_leading_zeros <= 0xFF:
+            raise ValueError(
+                "The number of leading zeros must be between 0 and 255, "
+                f"got {number_of_leading_zeros}."
+            )
+        leading_zeros.append(number_of_leading_zeros)
+        if number_flags & (_EXTENSION | _RAW_INPUT | _CARRIER_CODE):
+            _write_strings(strings, numobj)
+
+    return b"".join(
+        [
+            _HEADER.pack(MAGIC, VERSION, len(flags)),
+            _to_bytes(country_codes, "H"),
+            _to_bytes(national_numbers, "Q"),
+            bytes(flags),
+            bytes(leading_zeros),
+            strings,
+        ]
+    )
+
+
+def _read_header(data: bytes) -> int:
+    """Validates the header and returns the number of encoded phone numbers."""
+    if len(data) < _HEADER.size:
+        raise ValueError("Unsupported phone number encoding.")
+    magic, version, count = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Unsupported phone number encoding.")
+    if _HEADER.size + count * (2 + 8 + 1 + 1) > len(data):
+        raise ValueError("Truncated phone number encoding.")
+    return count
+
+
+def decode_many(data: bytes, /) -> list[PhoneNumber]:
+    """Decodes phone numbers encoded with `encode_many()`.
+
+    Parameters:
+        data: The encoded phone numbers.
+
+    Raises:
+        ValueError: If the data is not encoded phone numbers of a supported version.
+
+    Returns:
+        A list of new PhoneNumber objects, in the order they were encoded.
+    """
+    count = _read_header(data)
+    view = memoryview(data)
+    position = _HEADER.size
+
+    country_codes = _from_bytes(view[position : position + 2 * count], "H")
+    position += 2 * count
+    national_numbers = _from_bytes(view[position : position + 8 * count], "Q")
+    position += 8 * count
+    flags = data[position : position + count]
+    position += count
+    leading_zeros = data[position : position + count]
+    position += count
+    if count and max(flags) >> _SOURCE_SHIFT >= len(_SOURCES):
+        raise ValueError("Unsupported phone number encoding.")
+
+    from_fields = PhoneNumber._from_fields
+    sources = _SOURCES
+    strings_mask = _EXTENSION | _RAW_INPUT | _CARRIER_CODE
+    numbers = []
+    for index in range(count):
+        number_flags = flags[index]
+        if number_flags & strings_mask:
+            (extension, raw_input, carrier_code), position = _read_strings(
+                view, position, number_flags
+            )
+        else:
+            extension = raw_input = carrier_code = None
+        numbers.append(
+            from_fields(
+                country_codes[index],
+                national_numbers[index],
+                extension,
+                number_flags & _ITALIAN_LEADING_ZERO == _ITALIAN_LEADING_ZERO,
+                leading_zeros[index] if number_flags & _LEADING_ZEROS else None,
+                raw_input,
+                sources[number_flags >> _SOURCE_SHIFT],
+                carrier_code,
+            )
+        )
+
+    if position != len(data):
+        raise ValueError("Trailing data after the phone number encoding.")
+    return numbers
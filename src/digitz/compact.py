@@ -0,0 +1,331 @@
+# SPDX-FileCopyrightText: 2023-present Ryan Kroon <rykroon.tech@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+from dataclasses import FrozenInstanceError
+from typing import Any, Type, TypeVar
+
+import phonenumbers as pn
+
+from digitz.enums import CountryCodeSource, PhoneNumberFormat, PhoneNumberType
+from digitz.phonenumbers import PhoneNumber, PhoneNumberTuple
+
+
+__all__ = ["CompactPhoneNumber"]
+
+
+# Layout of the packed integer, from the least significant bit:
+#   5 bits  number of leading zeros + 1 (0 means None)
+#   1 bit   italian leading zero
+#   10 bits country code
+#   rest    national number
+_LEADING_ZEROS_BITS = 5
+_ITALIAN_LEADING_ZERO_SHIFT = 5
+_COUNTRY_CODE_SHIFT = 6
+_COUNTRY_CODE_BITS = 10
+_NATIONAL_NUMBER_SHIFT = 16
+
+_LEADING_ZEROS_MASK = (1 << _LEADING_ZEROS_BITS) - 1
+_COUNTRY_CODE_MASK = (1 << _COUNTRY_CODE_BITS) - 1
+
+CompactState = tuple[int, tuple[str | None, str | None, int, str | None] | None]
+
+Self = TypeVar("Self", bound="CompactPhoneNumber")
+
+
+def _pack(
+    country_code: int,
+    national_number: int,
+    italian_leading_zero: bool,
+    number_of_leading_zeros: int | None,
+) -> int:
+    if not 0 <= country_code <= _COUNTRY_CODE_MASK:
+        raise ValueError(f"Country code out of range: {country_code}")
+
+    if number_of_leading_zeros is None:
+        leading_zeros = 0
+    elif 0 <= number_of_leading_zeros < _LEADING_ZEROS_MASK:
+        leading_zeros = number_of_leading_zeros + 1
+    else:
+        raise ValueError(
+            f"Number of leading zeros out of range: {number_of_leading_zeros}"
+        )
+
+    return (
+        national_number << _NATIONAL_NUMBER_SHIFT
+        | country_code << _COUNTRY_CODE_SHIFT
+        | int(italian_leading_zero) << _ITALIAN_LEADING_ZERO_SHIFT
+        | leading_zeros
+    )
+
+
+class CompactPhoneNumber(pn.PhoneNumber):
+    """
+    A memory efficient, immutable representation of a phone number.
+
+    The country code, national number and leading zero information are packed
+    into a single integer and the rarely used fields are kept in a single
+    optional tuple. Nothing is cached, so derived properties are computed on
+    demand. Use `to_phone_number()` to get a `PhoneNumber` with the full,
+    cached API.
+
+    `phonenumbers.PhoneNumber` has no `__slots__`, so instances still have a
+    `__dict__` slot, but the dictionary itself is only created if something
+    accesses it. An instance takes about half the memory of a `PhoneNumber`
+    that has not computed anything yet, and a fraction of one whose cached
+    properties and methods are populated.
+
+    Instances can be passed to the `phonenumbers` functions just like
+    `PhoneNumber` objects.
+
+    Parameters:
+        country_code: The country code of the phone number.
+        national_number: The national number of the phone number.
+        extension: The extension of the phone number.
+        italian_leading_zero: Whether the phone number has an Italian leading zero.
+        number_of_leading_zeros: The number of leading zeros in the phone number.
+        raw_input: The raw input of the phone number.
+        country_code_source: The source of the country code.
+        preferred_domestic_carrier_code: The preferred domestic carrier code.
+    """
+
+    __slots__ = ("_packed", "_extra")
+
+    _packed: int
+    _extra: tuple[str | None, str | None, int, str | None] | None
+
+    def __init__(
+        self,
+        country_code: int,
+        national_number: int,
+        extension: str | None = None,
+        italian_leading_zero: bool = False,
+        number_of_leading_zeros: int | None = None,
+        raw_input: str | None = None,
+        country_code_source: CountryCodeSource = CountryCodeSource.UNSPECIFIED,
+        preferred_domestic_carrier_code: str | None = None,
+    ) -> None:
+        packed = _pack(
+            country_code,
+            national_number,
+            italian_leading_zero,
+            number_of_leading_zeros,
+        )
+        if (
+            extension is None
+            and raw_input is None
+            and country_code_source == CountryCodeSource.UNSPECIFIED
+            and preferred_domestic_carrier_code is None
+        ):
+            extra = None
+        else:
+            extra = (
+                extension,
+                raw_input,
+                int(country_code_source),
+                preferred_domestic_carrier_code,
+            )
+
+        object.__setattr__(self, "_packed", packed)
+        object.__setattr__(self, "_extra", extra)
+
+    @classmethod
+    def from_phone_number(cls: Type[Self], numobj: pn.PhoneNumber, /) -> Self:
+        """Returns a new CompactPhoneNumber from any phone number object.
+
+        Parameters:
+            numobj: The phone number to convert.
+
+        Returns:
+            A new CompactPhoneNumber object.
+        """
+        return cls(
+            country_code=numobj.country_code or 0,
+            national_number=numobj.national_number or 0,
+            extension=numobj.extension,
+            italian_leading_zero=bool(numobj.italian_leading_zero),
+            number_of_leading_zeros=numobj.number_of_leading_zeros,
+            raw_input=numobj.raw_input,
+            country_code_source=CountryCodeSource(numobj.country_code_source),
+            preferred_domestic_carrier_code=numobj.preferred_domestic_carrier_code,
+        )
+
+    @classmethod
+    def parse(
+        cls: Type[Self],
+        number: str,
+        /,
+        *,
+        region: str | None = None,
+        keep_raw_input: bool = False,
+    ) -> Self:
+        """Attempts to parse a string and return a new CompactPhoneNumber object.
+
+        Parameters:
+            number: The phone number to parse.
+            region: The region code the phone number is expected to be from.
+            keep_raw_input: Whether to keep the raw input of the phone number.
+
+        Raises:
+            NumberParseException: If the phone number cannot be parsed.
+
+        Returns:
+            A new CompactPhoneNumber object.
+        """
+        return cls.from_phone_number(
+            PhoneNumber.parse(number, region=region, keep_raw_input=keep_raw_input)
+        )
+
+    def to_phone_number(self) -> PhoneNumber:
+        """Returns the PhoneNumber equivalent of the phone number."""
+        return PhoneNumber(*self.to_tuple())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __getstate__(self) -> CompactState:  # type: ignore[override]
+        return (self._packed, self._extra)
+
+    def __setstate__(self, state: CompactState) -> None:
+        object.__setattr__(self, "_packed", state[0])
+        object.__setattr__(self, "_extra", state[1])
+
+    def __hash__(self) -> int:
+        # Equal to the hash of an equal PhoneNumber.
+        return hash(self.to_tuple())
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(country_code={self.country_code!r}, "
+            f"national_number={self.national_number!r}, "
+            f"extension={self.extension!r}, "
+            f"italian_leading_zero={self.italian_leading_zero!r}, "
+            f"number_of_leading_zeros={self.number_of_leading_zeros!r}, "
+            f"country_code_source={self.country_code_source!r}, "
+            f"preferred_domestic_carrier_code={self.preferred_domestic_carrier_code!r})"
+        )
+
+    def __str__(self) -> str:
+        """Returns the E.164 representation of the phone number."""
+        return self.to_e164()
+
+    # ~~~ fields ~~~
+    @property  # type: ignore[override]
+    def country_code(self) -> int:
+        """The country code of the phone number."""
+        return (self._packed >> _COUNTRY_CODE_SHIFT) & _COUNTRY_CODE_MASK
+
+    @property  # type: ignore[override]
+    def national_number(self) -> int:
+        """The national number of the phone number."""
+        return self._packed >> _NATIONAL_NUMBER_SHIFT
+
+    @property  # type: ignore[override]
+    def italian_leading_zero(self) -> bool:
+        """Whether the phone number has an Italian leading zero."""
+        return bool(self._packed >> _ITALIAN_LEADING_ZERO_SHIFT & 1)
+
+    @property  # type: ignore[override]
+    def number_of_leading_zeros(self) -> int | None:
+        """The number of leading zeros in the phone number."""
+        leading_zeros = self._packed & _LEADING_ZEROS_MASK
+        return None if leading_zeros == 0 else leading_zeros - 1
+
+    @property  # type: ignore[override]
+    def extension(self) -> str | None:
+        """The extension of the phone number."""
+        return None if self._extra is None else self._extra[0]
+
+    @property  # type: ignore[override]
+    def raw_input(self) -> str | None:
+        """The raw input of the phone number."""
+        return None if self._extra is None else self._extra[1]
+
+    @property  # type: ignore[override]
+    def country_code_source(self) -> CountryCodeSource:
+        """The source of the country code."""
+        if self._extra is None:
+            return CountryCodeSource.UNSPECIFIED
+        return CountryCodeSource(self._extra[2])
+
+    @property  # type: ignore[override]
+    def preferred_domestic_carrier_code(self) -> str | None:
+        """The preferred domestic carrier code."""
+        return None if self._extra is None else self._extra[3]
+
+    # ~~~ derived properties ~~~
+    @property
+    def national_significant_number(self) -> str:
+        """Returns the national significant number."""
+        return pn.national_significant_number(self)
+
+    @property
+    def nsn(self) -> str:
+        """An alias for the national_significant_number property."""
+        return self.national_significant_number
+
+    @property
+    def region_code(self) -> str | None:
+        """Returns the region code of the phone number."""
+        return pn.region_code_for_number(self)
+
+    @property
+    def is_possible(self) -> bool:
+        """Returns True if the phone number is possible."""
+        return pn.is_possible_number(self)
+
+    @property
+    def is_valid(self) -> bool:
+        """Returns True if the phone number is of a valid pattern."""
+        region_code = self.region_code
+        if region_code is None:
+            return False
+        return pn.is_valid_number_for_region(self, region_code)
+
+    @property
+    def number_type(self) -> PhoneNumberType:
+        """Returns the type of a valid phone number."""
+        return PhoneNumberType(pn.number_type(self))
+
+    # ~~~ Formatting methods ~~~
+    def format(self, format: PhoneNumberFormat) -> str:
+        """Returns the string representation of the phone number in the specified format.
+
+        Parameters:
+            format: The format to use.
+
+        Returns:
+            The string representation of the phone number.
+        """
+        return pn.format_number(self, format)
+
+    def to_e164(self) -> str:
+        """Returns the E.164 representation of the phone number."""
+        return self.format(PhoneNumberFormat.E164)
+
+    def to_international(self) -> str:
+        """Returns the international representation of the phone number."""
+        return self.format(PhoneNumberFormat.INTERNATIONAL)
+
+    def to_national(self) -> str:
+        """Returns the national representation of the phone number."""
+        return self.format(PhoneNumberFormat.NATIONAL)
+
+    def to_rfc3966(self) -> str:
+        """Returns the RFC3966 representation of the phone number."""
+        return self.format(PhoneNumberFormat.RFC3966)
+
+    def to_tuple(self) -> PhoneNumberTuple:
+        """Returns a tuple representation of the phone number."""
+        return (
+            self.country_code,
+            self.national_number,
+            self.extension,
+            self.italian_leading_zero,
+            self.number_of_leading_zeros,
+            self.raw_input,
+            self.country_code_source,
+            self.preferred_domestic_carrier_code,
+        )
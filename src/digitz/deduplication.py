@@ -0,0 +1,356 @@
+# SPDX-FileCopyrightText: 2023-present Ryan Kroon <rykroon.tech@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import os
+import pickle
+import sqlite3
+import tempfile
+from typing import Hashable, Iterable, Iterator, Literal, overload
+
+import phonenumbers as pn
+
+from digitz.enums import MatchType
+from digitz.match import TAIL_LENGTH
+from digitz.phonenumbers import PhoneNumber
+
+
+__all__ = ["dedupe"]
+
+
+Group = tuple[pn.PhoneNumber, list[pn.PhoneNumber]]
+
+
+class _MemoryStore:
+    """Keeps the first occurrence and the members of each group in memory."""
+
+    def __init__(self, keep_members: bool) -> None:
+        self._firsts: dict[Hashable, list[tuple[int, pn.PhoneNumber]]] = {}
+        self._groups: list[Group] = []
+        self._keep_members = keep_members
+
+    def candidates(self, keys: list[Hashable]) -> list[tuple[int, pn.PhoneNumber]]:
+        if len(keys) == 1:
+            return self._firsts.get(keys[0], [])
+        firsts = {}
+        for key in keys:
+            firsts.update(self._firsts.get(key, ()))
+        return sorted(firsts.items())
+
+    def firsts(self) -> Iterator[tuple[int, pn.PhoneNumber]]:
+        for group_id, (first, _) in enumerate(self._groups):
+            yield group_id, first
+
+    def add_group(self, keys: list[Hashable], numobj: pn.PhoneNumber) -> None:
+        group_id = len(self._groups)
+        for key in keys:
+            self.add_key(key, group_id, numobj)
+        self._groups.append((numobj, [numobj] if self._keep_members else []))
+
+    def add_key(self, key: Hashable, group_id: int, numobj: pn.PhoneNumber) -> None:
+        self._firsts.setdefault(key, []).append((group_id, numobj))
+
+    def add_member(self, group_id: int, numobj: pn.PhoneNumber) -> None:
+        if self._keep_members:
+            self._groups[group_id][1].append(numobj)
+
+    def groups(self) -> Iterator[Group]:
+        yield from self._groups
+
+    def close(self) -> None:
+        self._firsts.clear()
+        self._groups.clear()
+
+
+class _DiskStore:
+    """Keeps the first occurrence and the members of each group in a temporary
+    SQLite database, for inputs with more distinct numbers than fit in memory."""
+
+    def __init__(self, keep_members: bool, directory: str | None) -> None:
+        fd, self._path = tempfile.mkstemp(
+            prefix="digitz-dedupe-", suffix=".sqlite3", dir=directory
+        )
+        os.close(fd)
+        self._connection = sqlite3.connect(self._path)
+        self._connection.executescript(
+            """
+            PRAGMA journal_mode = OFF;
+            PRAGMA synchronous = OFF;
+            CREATE TABLE firsts (key BLOB NOT NULL, group_id INTEGER, number BLOB);
+            CREATE INDEX firsts_key ON firsts (key);
+            CREATE TABLE members (group_id INTEGER, number BLOB);
+            """
+        )
+        self._group_count = 0
+        self._keep_members = keep_members
+
+    def candidates(self, keys: list[Hashable]) -> list[tuple[int, pn.PhoneNumber]]:
+        placeholders = ", ".join("?" * len(keys))
+        rows = self._connection.execute(
+            f"SELECT group_id, number FROM firsts WHERE key IN ({placeholders}) "
+            "GROUP BY group_id ORDER BY group_id",
+            [pickle.dumps(key) for key in keys],
+        )
+        return [(group_id, pickle.loads(number)) for group_id, number in rows]
+
+    def firsts(self) -> Iterator[tuple[int, pn.PhoneNumber]]:
+        # Read in batches, so that keys can be added while iterating.
+        group_id = -1
+        while rows := self._connection.execute(
+            "SELECT group_id, number FROM firsts WHERE group_id > ? "
+            "GROUP BY group_id ORDER BY group_id LIMIT 1000",
+            (group_id,),
+        ).fetchall():
+            for group_id, number in rows:
+                yield group_id, pickle.loads(number)
+
+    def add_group(self, keys: list[Hashable], numobj: pn.PhoneNumber) -> None:
+        group_id = self._group_count
+        self._group_count += 1
+        for key in keys:
+            self.add_key(key, group_id, numobj)
+        self.add_member(group_id, numobj)
+
+    def add_key(self, key: Hashable, group_id: int, numobj: pn.PhoneNumber) -> None:
+        self._connection.execute(
+            "INSERT INTO firsts VALUES (?, ?, ?)",
+            (pickle.dumps(key), group_id, pickle.dumps(numobj)),
+        )
+
+    def add_member(self, group_id: int, numobj: pn.PhoneNumber) -> None:
+        if self._keep_members:
+            self._connection.execute(
+                "INSERT INTO members VALUES (?, ?)", (group_id, pickle.dumps(numobj))
+            )
+
+    def groups(self) -> Iterator[Group]:
+        rows = self._connection.execute(
+            "SELECT group_id, number FROM members ORDER BY group_id, rowid"
+        )
+        current_id = None
+        members: list[pn.PhoneNumber] = []
+        for group_id, number in rows:
+            if group_id != current_id and members:
+                yield members[0], members
+                members = []
+            current_id = group_id
+            members.append(pickle.loads(number))
+        if members:
+            yield members[0], members
+
+    def close(self) -> None:
+        self._connection.close()
+        os.remove(self._path)
+
+
+Store = _MemoryStore | _DiskStore
+
+
+class _KeyBlocks:
+    """Finds the groups that a phone number may match by a key that phone
+    numbers matching at the given level always share, so only the first
+    occurrences of groups with the same key are compared."""
+
+    def __init__(self, store: Store, level: MatchType) -> None:
+        self._store = store
+        self._level = level
+
+    def _key(self, numobj: pn.PhoneNumber) -> Hashable:
+        if self._level == MatchType.EXACT_MATCH:
+            return numobj.country_code, numobj.national_number
+        return numobj.national_number
+
+    def candidates(self, numobj: pn.PhoneNumber) -> list[tuple[int, pn.PhoneNumber]]:
+        return self._store.candidates([self._key(numobj)])
+
+    def add_group(self, numobj: pn.PhoneNumber) -> None:
+        self._store.add_group([self._key(numobj)], numobj)
+
+
+class _TailBlocks:
+    """Finds the groups that a phone number may short NSN match by the
+    trailing digits of the national numbers, like `digitz.match._TailIndex`.
+
+    First occurrences with a national number of at least TAIL_LENGTH digits
+    are keyed by their last TAIL_LENGTH digits, shorter ones by their whole
+    national number. A shorter national number to look up needs keys of its
+    own length, which are added to all groups the first time it is needed and
+    to every group added after that.
+    """
+
+    def __init__(self, store: Store) -> None:
+        self._store = store
+        self._short_lengths: set[int] = set()
+        self._indexed_lengths: set[int] = set()
+
+    def _index_length(self, length: int) -> None:
+        for group_id, first in self._store.firsts():
+            digits = str(first.national_number)
+            if len(digits) >= length:
+                self._store.add_key((length, digits[-length:]), group_id, first)
+        self._indexed_lengths.add(length)
+
+    def candidates(self, numobj: pn.PhoneNumber) -> list[tuple[int, pn.PhoneNumber]]:
+        digits = str(numobj.national_number)
+        keys: list[Hashable]
+        if len(digits) >= TAIL_LENGTH:
+            keys = [digits[-TAIL_LENGTH:]]
+        else:
+            if len(digits) not in self._indexed_lengths:
+                self._index_length(len(digits))
+            keys = [(len(digits), digits)]
+
+        # The groups with a shorter national number are keyed by it.
+        for length in self._short_lengths:
+            if length < len(digits):
+                keys.append(digits[-length:])
+        return self._store.candidates(keys)
+
+    def add_group(self, numobj: pn.PhoneNumber) -> None:
+        digits = str(numobj.national_number)
+        if len(digits) < TAIL_LENGTH:
+            self._short_lengths.add(len(digits))
+        keys: list[Hashable] = [digits[-TAIL_LENGTH:]]
+        for length in self._indexed_lengths:
+            if length <= len(digits):
+                keys.append((length, digits[-length:]))
+        self._store.add_group(keys, numobj)
+
+
+def _core_fields(numobj: pn.PhoneNumber) -> tuple:
+    leading_zeros = numobj.number_of_leading_zeros if numobj.italian_leading_zero else 0
+    return (
+        numobj.country_code,
+        numobj.national_number,
+        numobj.extension,
+        bool(numobj.italian_leading_zero),
+        leading_zeros,
+    )
+
+
+def _matches(numobj: pn.PhoneNumber, other: pn.PhoneNumber, level: MatchType) -> bool:
+    # Phone numbers with the same fields are an exact match, which is by far
+    # the most common kind of duplicate and cheap to check.
+    if numobj.country_code and _core_fields(numobj) == _core_fields(other):
+        return True
+    return pn.is_number_match(numobj, other) >= level
+
+
+@overload
+def dedupe(
+    numbers: Iterable[str | pn.PhoneNumber],
+    /,
+    *,
+    region: str | None = None,
+    level: MatchType = MatchType.EXACT_MATCH,
+    members: Literal[False] = False,
+    errors: Literal["raise", "skip"] = "raise",
+    spill: bool = False,
+    spill_dir: str | None = None,
+) -> Iterator[pn.PhoneNumber]: ...
+
+
+@overload
+def dedupe(
+    numbers: Iterable[str | pn.PhoneNumber],
+    /,
+    *,
+    region: str | None = None,
+    level: MatchType = MatchType.EXACT_MATCH,
+    members: Literal[True],
+    errors: Literal["raise", "skip"] = "raise",
+    spill: bool = False,
+    spill_dir: str | None = None,
+) -> Iterator[Group]: ...
+
+
+def dedupe(
+    numbers: Iterable[str | pn.PhoneNumber],
+    /,
+    *,
+    region: str | None = None,
+    level: MatchType = MatchType.EXACT_MATCH,
+    members: bool = False,
+    errors: Literal["raise", "skip"] = "raise",
+    spill: bool = False,
+    spill_dir: str | None = None,
+) -> Iterator[pn.PhoneNumber] | Iterator[Group]:
+    """Removes the duplicates from a stream of phone numbers.
+
+    A phone number is a duplicate if it matches the first occurrence of an
+    earlier group at least as well as `level`, as determined by
+    `PhoneNumber.match()`. With `MatchType.NSN_MATCH`, a phone number without
+    a country code is a duplicate of the same phone number with one, and with
+    `MatchType.SHORT_NSN_MATCH`, phone numbers that only differ in their
+    extension or Italian leading zero, or where one national number is a
+    suffix of the other, are duplicates too.
+
+    Only the first occurrence of each group is held, so memory use grows with
+    the number of distinct phone numbers rather than the size of the input.
+
+    Parameters:
+        numbers: The strings to parse, or phone numbers.
+        region: The region code to parse the strings with.
+        level: The weakest match type between duplicates.
+        members: Whether to yield each group with its members, once the input
+            is exhausted, instead of each first occurrence as soon as it is seen.
+        errors: Whether to raise on strings that cannot be parsed, or skip them.
+        spill: Whether to keep the groups in a temporary database on disk
+            instead of in memory, for inputs that do not fit in memory.
+        spill_dir: The directory of the temporary database.
+
+    Raises:
+        ValueError: If level or errors is invalid.
+        NumberParseException: If a string cannot be parsed and errors is "raise".
+
+    Returns:
+        An iterator of the first occurrences, or of (first occurrence, members)
+        tuples if members is True.
+    """
+    if level < MatchType.SHORT_NSN_MATCH:
+        raise ValueError("level must be SHORT_NSN_MATCH or stronger.")
+    if errors not in ("raise", "skip"):
+        raise ValueError(f"Invalid value for errors: {errors!r}")
+
+    return _dedupe(numbers, region, level, members, errors, spill, spill_dir)
+
+
+def _dedupe(
+    numbers: Iterable[str | pn.PhoneNumber],
+    region: str | None,
+    level: MatchType,
+    members: bool,
+    errors: Literal["raise", "skip"],
+    spill: bool,
+    spill_dir: str | None,
+) -> Iterator[pn.PhoneNumber] | Iterator[Group]:
+    store: Store = _DiskStore(members, spill_dir) if spill else _MemoryStore(members)
+    blocks: _KeyBlocks | _TailBlocks
+    if level == MatchType.SHORT_NSN_MATCH:
+        blocks = _TailBlocks(store)
+    else:
+        blocks = _KeyBlocks(store, level)
+    try:
+        for number in numbers:
+            if isinstance(number, str):
+                try:
+                    numobj: pn.PhoneNumber = PhoneNumber.parse(number, region=region)
+                except pn.NumberParseException:
+                    if errors == "raise":
+                        raise
+                    continue
+            else:
+                numobj = number
+
+            for group_id, first in blocks.candidates(numobj):
+                if _matches(numobj, first, level):
+                    store.add_member(group_id, numobj)
+                    break
+            else:
+                blocks.add_group(numobj)
+                if not members:
+                    yield numobj
+
+        if members:
+            yield from store.groups()
+    finally:
+        store.close()
@@ -1,5 +1,4 @@
 from enum import IntEnum
-import phonenumbers as pn
 
 
 __all__ = [
@@ -8,6 +7,7 @@ __all__ = [
     "NumberParseErrorType",
     "PhoneNumberFormat",
     "PhoneNumberType",
+    "ValidationResult",
 ]
 
 
@@ -22,11 +22,11 @@ class CountryCodeSource(IntEnum):
         FROM_DEFAULT_COUNTRY: Country code was extracted from number with a default country code.
     """
 
-    UNSPECIFIED = pn.CountryCodeSource.UNSPECIFIED
-    FROM_NUMBER_WITH_PLUS_SIGN = pn.CountryCodeSource.FROM_NUMBER_WITH_PLUS_SIGN
-    FROM_NUMBER_WITH_IDD = pn.CountryCodeSource.FROM_NUMBER_WITH_IDD
-    FROM_NUMBER_WITHOUT_PLUS_SIGN = pn.CountryCodeSource.FROM_NUMBER_WITHOUT_PLUS_SIGN
-    FROM_DEFAULT_COUNTRY = pn.CountryCodeSource.FROM_DEFAULT_COUNTRY
+    UNSPECIFIED = 0
+    FROM_NUMBER_WITH_PLUS_SIGN = 1
+    FROM_NUMBER_WITH_IDD = 5
+    FROM_NUMBER_WITHOUT_PLUS_SIGN = 10
+    FROM_DEFAULT_COUNTRY = 20
 
 
 class MatchType(IntEnum):
@@ -40,11 +40,11 @@ class MatchType(IntEnum):
         SHORT_NSN_MATCH: Short national significant number match.
     """
 
-    EXACT_MATCH = pn.MatchType.EXACT_MATCH
-    NOT_A_NUMBER = pn.MatchType.NOT_A_NUMBER
-    NO_MATCH = pn.MatchType.NO_MATCH
-    NSN_MATCH = pn.MatchType.NSN_MATCH
-    SHORT_NSN_MATCH = pn.MatchType.SHORT_NSN_MATCH
+    EXACT_MATCH = 4
+    NOT_A_NUMBER = 0
+    NO_MATCH = 1
+    NSN_MATCH = 3
+    SHORT_NSN_MATCH = 2
 
 
 class NumberParseErrorType(IntEnum):
@@ -58,11 +58,11 @@ class NumberParseErrorType(IntEnum):
         TOO_LONG: Number is too long.
     """
 
-    INVALID_COUNTRY_CODE = pn.NumberParseException.INVALID_COUNTRY_CODE
-    NOT_A_NUMBER = pn.NumberParseException.NOT_A_NUMBER
-    TOO_SHORT_AFTER_IDD = pn.NumberParseException.TOO_SHORT_AFTER_IDD
-    TOO_SHORT_NSN = pn.NumberParseException.TOO_SHORT_NSN
-    TOO_LONG = pn.NumberParseException.TOO_LONG
+    INVALID_COUNTRY_CODE = 0
+    NOT_A_NUMBER = 1
+    TOO_SHORT_AFTER_IDD = 2
+    TOO_SHORT_NSN = 3
+    TOO_LONG = 4
 
 
 class PhoneNumberFormat(IntEnum):
@@ -75,10 +75,10 @@ class PhoneNumberFormat(IntEnum):
         RFC3966: RFC 3966 format.
     """
 
-    E164 = pn.PhoneNumberFormat.E164
-    INTERNATIONAL = pn.PhoneNumberFormat.INTERNATIONAL
-    NATIONAL = pn.PhoneNumberFormat.NATIONAL
-    RFC3966 = pn.PhoneNumberFormat.RFC3966
+    E164 = 0
+    INTERNATIONAL = 1
+    NATIONAL = 2
+    RFC3966 = 3
 
 
 class PhoneNumberType(IntEnum):
@@ -99,15 +99,35 @@ class PhoneNumberType(IntEnum):
         UNKNOWN: Unknown.
     """
 
-    FIXED_LINE = pn.PhoneNumberType.FIXED_LINE
-    MOBILE = pn.PhoneNumberType.MOBILE
-    FIXED_LINE_OR_MOBILE = pn.PhoneNumberType.FIXED_LINE_OR_MOBILE
-    TOLL_FREE = pn.PhoneNumberType.TOLL_FREE
-    PREMIUM_RATE = pn.PhoneNumberType.PREMIUM_RATE
-    SHARED_COST = pn.PhoneNumberType.SHARED_COST
-    VOIP = pn.PhoneNumberType.VOIP
-    PERSONAL_NUMBER = pn.PhoneNumberType.PERSONAL_NUMBER
-    PAGER = pn.PhoneNumberType.PAGER
-    UAN = pn.PhoneNumberType.UAN
-    VOICEMAIL = pn.PhoneNumberType.VOICEMAIL
-    UNKNOWN = pn.PhoneNumberType.UNKNOWN
+    FIXED_LINE = 0
+    MOBILE = 1
+    FIXED_LINE_OR_MOBILE = 2
+    TOLL_FREE = 3
+    PREMIUM_RATE = 4
+    SHARED_COST = 5
+    VOIP = 6
+    PERSONAL_NUMBER = 7
+    PAGER = 8
+    UAN = 9
+    VOICEMAIL = 10
+    UNKNOWN = 99
+
+
+class ValidationResult(IntEnum):
+    """Enum for the results of checking whether a phone number is possible.
+
+    Attributes:
+        IS_POSSIBLE: The length matches that of valid numbers of the region.
+        IS_POSSIBLE_LOCAL_ONLY: The length matches that of local numbers of the region only.
+        INVALID_COUNTRY_CODE: The country code is invalid.
+        TOO_SHORT: The number is shorter than all valid numbers of the region.
+        INVALID_LENGTH: The length does not match that of any valid numbers of the region.
+        TOO_LONG: The number is longer than all valid numbers of the region.
+    """
+
+    IS_POSSIBLE = 0
+    IS_POSSIBLE_LOCAL_ONLY = 4
+    INVALID_COUNTRY_CODE = 1
+    TOO_SHORT = 2
+    INVALID_LENGTH = 5
+    TOO_LONG = 3
@@ -0,0 +1,418 @@
+# SPDX-FileCopyrightText: 2023-present Ryan Kroon <rykroon.tech@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""Opt-in instrumentation of parsing, formatting and lookups.
+
+While instrumentation is enabled, the calls of `PhoneNumber.parse()`,
+`PhoneNumber.try_parse()`, `PhoneNumber.format()` (and with it every `to_*`
+method) and the lookup methods are counted and timed, the parse errors are
+counted by error type, the hits and misses of the method cache are counted and
+the time it takes to load the metadata of each region is recorded. `stats()`
+returns a snapshot of what has been recorded, and hooks receive every event as
+it happens, e.g. to export it to a metrics system.
+
+While instrumentation is disabled, the original methods are in place, so
+only the method cache pays for a check of a module global.
+"""
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Iterator, NamedTuple, TypeVar
+
+import phonenumbers as pn
+
+from digitz.enums import NumberParseErrorType
+
+
+__all__ = [
+    "CacheStats",
+    "Histogram",
+    "Hook",
+    "OperationStats",
+    "Stats",
+    "add_hook",
+    "disable_instrumentation",
+    "enable_instrumentation",
+    "instrumentation_enabled",
+    "remove_hook",
+    "reset_stats",
+    "stats",
+]
+
+
+# The upper bounds of the latency buckets, in seconds. The last bucket holds
+# the calls that took longer than the last bound.
+LATENCY_BOUNDS = (
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    2.5e-4,
+    5e-4,
+    1e-3,
+    2.5e-3,
+    5e-3,
+    1e-2,
+    2.5e-2,
+    5e-2,
+    1e-1,
+)
+
+
+class Histogram(NamedTuple):
+    """A latency histogram.
+
+    Attributes:
+        bounds: The upper bounds of the buckets, in seconds.
+        counts: The number of calls in each bucket, with one more bucket than
+            bounds for the calls that took longer than the last bound.
+        total: The total time of all calls, in seconds.
+    """
+
+    bounds: tuple[float, ...]
+    counts: tuple[int, ...]
+    total: float
+
+
+class OperationStats(NamedTuple):
+    """The statistics of an operation.
+
+    Attributes:
+        calls: The number of calls.
+        errors: The number of calls that failed, by parse error type.
+        latency: The latency histogram of the calls.
+    """
+
+    calls: int
+    errors: dict[NumberParseErrorType, int]
+    latency: Histogram
+
+
+class CacheStats(NamedTuple):
+    """The hits and misses of a cache.
+
+    Attributes:
+        hits: The number of lookups that found an entry.
+        misses: The number of lookups that did not find an entry.
+    """
+
+    hits: int
+    misses: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """The share of lookups that found an entry, or 0.0 if there were none."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class Stats(NamedTuple):
+    """A snapshot of the recorded statistics.
+
+    Attributes:
+        enabled: Whether instrumentation is enabled.
+        operations: The statistics of each operation that was called.
+        method_cache: The hits and misses of the method cache.
+        parse_cache: The hits and misses of the parse cache, if it is enabled.
+        metadata_loads: The seconds it took to load the metadata of each region
+            or non-geographical country code, in the order they were loaded.
+    """
+
+    enabled: bool
+    operations: dict[str, OperationStats]
+    method_cache: CacheStats
+    parse_cache: CacheStats | None
+    metadata_loads: dict[str, float]
+
+
+class Hook:
+    """Receives the events recorded while instrumentation is enabled.
+
+    Subclasses override the methods of the events they are interested in.
+    The methods are called in the thread of the event, so they should be fast.
+    """
+
+    def on_call(
+        self, operation: str, seconds: float, error: NumberParseErrorType | None
+    ) -> None:
+        """Called after each call of an instrumented operation."""
+
+    def on_method_cache(self, hit: bool) -> None:
+        """Called after each lookup in the method cache."""
+
+    def on_metadata_load(self, region: str, seconds: float) -> None:
+        """Called after the metadata of a region has been loaded."""
+
+
+class _Operation:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors: dict[NumberParseErrorType, int] = {}
+        self.counts = [0] * (len(LATENCY_BOUNDS) + 1)
+        self.total = 0.0
+
+
+class _Recorder:
+    """Records the events while instrumentation is enabled."""
+
+    def __init__(self, hooks: tuple[Hook, ...]) -> None:
+        self.hooks = hooks
+        self.operations: dict[str, _Operation] = {}
+        self.method_cache_hits = 0
+        self.method_cache_misses = 0
+        self.metadata_loads: dict[str, float] = {}
+        self._lock = Lock()
+
+    def record_call(
+        self, operation: str, seconds: float, error: NumberParseErrorType | None
+    ) -> None:
+        with self._lock:
+            stats = self.operations.get(operation)
+            if stats is None:
+                stats = self.operations[operation] = _Operation()
+            stats.calls += 1
+            stats.counts[bisect_left(LATENCY_BOUNDS, seconds)] += 1
+            stats.total += seconds
+            if error is not None:
+                stats.errors[error] = stats.errors.get(error, 0) + 1
+        for hook in self.hooks:
+            hook.on_call(operation, seconds, error)
+
+    def record_method_cache(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.method_cache_hits += 1
+            else:
+                self.method_cache_misses += 1
+        for hook in self.hooks:
+            hook.on_method_cache(hit)
+
+    def record_metadata_load(self, region: str, seconds: float) -> None:
+        with self._lock:
+            self.metadata_loads[region] = seconds
+        for hook in self.hooks:
+            hook.on_metadata_load(region, seconds)
+
+
+# The recorder while instrumentation is enabled, or None.
+recorder: _Recorder | None = None
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _timed(func: F, operation: str) -> F:
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        current = recorder
+        if current is None:
+            return func(*args, **kwargs)
+
+        start = perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except pn.NumberParseException as e:
+            error = NumberParseErrorType(e.error_type)
+            current.record_call(operation, perf_counter() - start, error)
+            raise
+
+        seconds = perf_counter() - start
+        current.record_call(operation, seconds, getattr(result, "error_type", None))
+        return result
+
+    return wrapper  # type: ignore[return-value]
+
+
+# The class, name, original and instrumented version of each instrumented method.
+_methods: list[tuple[type, str, Any, Any]] = []
+
+
+class _InstrumentedMethod:
+    """Registers a method to be replaced by its instrumented version while
+    instrumentation is enabled, and puts the original method in its place."""
+
+    def __init__(self, method: Any, operation: str) -> None:
+        self.method = method
+        self.operation = operation
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        if isinstance(self.method, classmethod):
+            timed: Any = classmethod(_timed(self.method.__func__, self.operation))
+        else:
+            timed = _timed(self.method, self.operation)
+        _methods.append((owner, name, self.method, timed))
+        setattr(owner, name, self.method if recorder is None else timed)
+
+
+def instrumented(operation: str) -> Callable[[F], F]:
+    """Counts and times the calls of a method while instrumentation is enabled.
+
+    The method is only replaced by its instrumented version while
+    instrumentation is enabled, so it costs nothing otherwise. A call fails if
+    it raises a NumberParseException or returns a result with an error_type,
+    such as a ParseFailure.
+    """
+
+    def decorator(method: F) -> F:
+        return _InstrumentedMethod(method, operation)  # type: ignore[return-value]
+
+    return decorator
+
+
+class _TimedLoader:
+    """Wraps a metadata loader of phonenumbers to time the first load."""
+
+    def __init__(self, loader: Callable[[Any], None]) -> None:
+        self.loader = loader
+
+    def __call__(self, region: Any) -> None:
+        start = perf_counter()
+        self.loader(region)
+        current = recorder
+        if current is not None:
+            current.record_metadata_load(str(region), perf_counter() - start)
+
+
+def _loader_tables() -> tuple[dict, ...]:
+    # The loaders are private to phonenumbers. Versions of phonenumbers
+    # without them still work, only the metadata loads are not timed.
+    tables = []
+    for name in ("_region_available", "_country_code_available"):
+        table = getattr(pn.PhoneMetadata, name, None)
+        if isinstance(table, dict):
+            tables.append(table)
+    return tuple(tables)
+
+
+def _wrap_loaders() -> None:
+    for table in _loader_tables():
+        for region, loader in list(table.items()):
+            if callable(loader) and not isinstance(loader, _TimedLoader):
+                table[region] = _TimedLoader(loader)
+
+
+def _unwrap_loaders() -> None:
+    for table in _loader_tables():
+        for region, loader in list(table.items()):
+            if isinstance(loader, _TimedLoader):
+                table[region] = loader.loader
+
+
+def enable_instrumentation(*hooks: Hook) -> None:
+    """Enables instrumentation and starts recording from scratch.
+
+    Only the metadata of regions that has not been loaded yet can be timed.
+
+    Parameters:
+        hooks: The hooks that receive the recorded events.
+    """
+    global recorder
+    try:
+        _wrap_loaders()
+        recorder = _Recorder(hooks)
+        for owner, name, _, timed in _methods:
+            setattr(owner, name, timed)
+    except BaseException:
+        disable_instrumentation()
+        raise
+
+
+def disable_instrumentation() -> None:
+    """Disables instrumentation and discards the recorded statistics."""
+    global recorder
+    recorder = None
+    for owner, name, method, _ in _methods:
+        setattr(owner, name, method)
+    _unwrap_loaders()
+
+
+@contextmanager
+def instrumentation_enabled(*hooks: Hook) -> Iterator[None]:
+    """Enables instrumentation for the duration of a with block.
+
+    When the block exits, also with an exception, instrumentation is disabled
+    again, or the statistics and hooks from before the block are restored if
+    it was already enabled.
+
+    Parameters:
+        hooks: The hooks that receive the recorded events.
+    """
+    global recorder
+    previous = recorder
+    enable_instrumentation(*hooks)
+    try:
+        yield
+    finally:
+        if previous is None:
+            disable_instrumentation()
+        else:
+            recorder = previous
+
+
+def reset_stats() -> None:
+    """Discards the recorded statistics, keeping instrumentation and the hooks enabled."""
+    global recorder
+    if recorder is not None:
+        recorder = _Recorder(recorder.hooks)
+
+
+def add_hook(hook: Hook) -> None:
+    """Adds a hook that receives the recorded events.
+
+    Raises:
+        RuntimeError: If instrumentation is disabled.
+    """
+    if recorder is None:
+        raise RuntimeError("Instrumentation is disabled.")
+    recorder.hooks = (*recorder.hooks, hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    """Removes a hook added with `add_hook()` or `enable_instrumentation()`."""
+    if recorder is not None:
+        recorder.hooks = tuple(h for h in recorder.hooks if h is not hook)
+
+
+def stats() -> Stats:
+    """Returns a snapshot of the recorded statistics.
+
+    Returns:
+        A Stats object, which is empty if instrumentation is disabled.
+    """
+    from digitz import cache
+
+    parse_cache_info = cache.parse_cache_info()
+    parse_cache = (
+        None
+        if parse_cache_info is None
+        else CacheStats(parse_cache_info.hits, parse_cache_info.misses)
+    )
+
+    current = recorder
+    if current is None:
+        return Stats(False, {}, CacheStats(0, 0), parse_cache, {})
+
+    with current._lock:
+        operations = {
+            name: OperationStats(
+                calls=operation.calls,
+                errors=dict(operation.errors),
+                latency=Histogram(
+                    LATENCY_BOUNDS, tuple(operation.counts), operation.total
+                ),
+            )
+            for name, operation in current.operations.items()
+        }
+        return Stats(
+            enabled=True,
+            operations=operations,
+            method_cache=CacheStats(
+                current.method_cache_hits, current.method_cache_misses
+            ),
+            parse_cache=parse_cache,
+            metadata_loads=dict(current.metadata_loads),
+        )
@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: 2023-present Ryan Kroon <rykroon.tech@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""Matching of two collections of phone numbers against each other.
+
+Comparing every phone number of one collection with every phone number of
+another does not scale, so `join()` first derives a blocking key for each
+phone number and only compares phone numbers that share a key. The key is
+chosen so that no pair that matches at least `min_match` is missed:
+
+- An exact match needs the same country code and national number.
+- An NSN match needs the same national number.
+- A short NSN match needs one national number to be a suffix of the other,
+  so the last digits of the national numbers have to be the same.
+"""
+from collections import defaultdict
+from typing import Callable, Hashable, Iterable, Iterator, TypeVar
+
+import phonenumbers as pn
+
+from digitz.enums import MatchType
+
+
+__all__ = ["join"]
+
+
+N = TypeVar("N", bound=pn.PhoneNumber)
+M = TypeVar("M", bound=pn.PhoneNumber)
+
+# The number of trailing digits of the national number used as blocking key
+# for short NSN matches.
+TAIL_LENGTH = 7
+
+
+def _exact_key(numobj: pn.PhoneNumber) -> Hashable:
+    return numobj.country_code, numobj.national_number
+
+
+def _nsn_key(numobj: pn.PhoneNumber) -> Hashable:
+    return numobj.national_number
+
+
+class _TailIndex:
+    """Indexes phone numbers by the trailing digits of their national number.
+
+    Phone numbers with a national number of at least TAIL_LENGTH digits are
+    keyed by their last TAIL_LENGTH digits, shorter ones by their whole
+    national number. A shorter national number to look up needs an index of
+    its own length, which is built the first time it is needed.
+    """
+
+    def __init__(self, numbers: list[M]) -> None:
+        self._numbers = numbers
+        self._index: dict[str, list[M]] = defaultdict(list)
+        self._short_lengths: set[int] = set()
+        self._short_indexes: dict[int, dict[str, list[M]]] = {}
+        for numobj in numbers:
+            digits = str(numobj.national_number)
+            if len(digits) < TAIL_LENGTH:
+                self._short_lengths.add(len(digits))
+            self._index[digits[-TAIL_LENGTH:]].append(numobj)
+
+    def _short_index(self, length: int) -> dict[str, list[M]]:
+        index = self._short_indexes.get(length)
+        if index is None:
+            index = defaultdict(list)
+            for numobj in self._numbers:
+                digits = str(numobj.national_number)
+                if len(digits) >= length:
+                    index[digits[-length:]].append(numobj)
+            self._short_indexes[length] = index
+        return index
+
+    def candidates(self, numobj: pn.PhoneNumber) -> Iterator[M]:
+        digits = str(numobj.national_number)
+        if len(digits) >= TAIL_LENGTH:
+            yield from self._index.get(digits[-TAIL_LENGTH:], ())
+        else:
+            yield from self._short_index(len(digits)).get(digits, ())
+
+        # The phone numbers with a shorter national number are keyed by it.
+        for length in self._short_lengths:
+            if length < len(digits):
+                yield from self._index.get(digits[-length:], ())
+
+
+class _KeyIndex:
+    """Indexes phone numbers by a key that matching phone numbers share."""
+
+    def __init__(self, numbers: list[M], key: Callable[[pn.PhoneNumber], Hashable]):
+        self._key = key
+        self._index: dict[Hashable, list[M]] = defaultdict(list)
+        for numobj in numbers:
+            self._index[key(numobj)].append(numobj)
+
+    def candidates(self, numobj: pn.PhoneNumber) -> Iterator[M]:
+        yield from self._index.get(self._key(numobj), ())
+
+
+def join(
+    left: Iterable[N],
+    right: Iterable[M],
+    /,
+    *,
+    min_match: MatchType = MatchType.NSN_MATCH,
+) -> Iterator[tuple[N, M, MatchType]]:
+    """Yields the pairs of phone numbers of two collections that match.
+
+    The right collection is held in memory as a hash index, while the left
+    collection is streamed, so the smaller collection should be on the right.
+    The pairs are yielded in the order of the left collection, and the match
+    type of each pair is the same as `PhoneNumber.match()` returns.
+
+    Parameters:
+        left: The phone numbers to look up.
+        right: The phone numbers to look up the left phone numbers in.
+        min_match: The weakest match type to yield.
+
+    Raises:
+        ValueError: If min_match is not a match type of an actual match.
+
+    Returns:
+        An iterator of (left, right, match type) triples.
+    """
+    if min_match < MatchType.SHORT_NSN_MATCH:
+        raise ValueError("min_match must be SHORT_NSN_MATCH or stronger.")
+
+    return _join(left, right, min_match)
+
+
+def _join(
+    left: Iterable[N], right: Iterable[M], min_match: MatchType
+) -> Iterator[tuple[N, M, MatchType]]:
+    right_numbers = list(right)
+    index: _KeyIndex | _TailIndex
+    if min_match == MatchType.EXACT_MATCH:
+        index = _KeyIndex(right_numbers, _exact_key)
+    elif min_match == MatchType.NSN_MATCH:
+        index = _KeyIndex(right_numbers, _nsn_key)
+    else:
+        index = _TailIndex(right_numbers)
+
+    for left_number in left:
+        for right_number in index.candidates(left_number):
+            match_type = MatchType(pn.is_number_match(left_number, right_number))
+            if match_type >= min_match:
+                yield left_number, right_number, match_type
@@ -0,0 +1,197 @@
+# SPDX-FileCopyrightText: 2023-present Ryan Kroon <rykroon.tech@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""Parsing of large inputs across a pool of worker processes.
+
+Parsing is CPU-bound Python code, so a single process is limited to one core.
+`normalize()` splits its input into chunks and parses them in a process pool
+whose workers load the metadata of every region up front. Each worker sends
+its phone numbers back with `digitz.codec.encode_many()` instead of pickling
+every dataclass, together with the failures and the requested properties.
+"""
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from multiprocessing.context import BaseContext
+import os
+from typing import Any, Iterable, Iterator
+
+from digitz.codec import decode_many, encode_many
+from digitz.enums import NumberParseErrorType
+from digitz.phonenumbers import ParseErrors, ParseFailure, PhoneNumber
+
+
+__all__ = ["PROPERTIES", "normalize"]
+
+
+# The cached properties that can be computed in the workers.
+PROPERTIES = frozenset(
+    {
+        "is_geographical",
+        "is_possible",
+        "is_valid",
+        "national_destination_code_length",
+        "national_significant_number",
+        "number_type",
+        "region_code",
+    }
+)
+
+# The encoded phone numbers of a chunk, the position, error type and message of
+# each failure, and the values of the requested properties of each phone number.
+_ChunkResult = tuple[bytes, list[tuple[int, int, str]], list[tuple[Any, ...]]]
+
+
+def _initialize_worker() -> None:
+    from digitz.preload import warmup
+
+    warmup(carrier=False, geocoder=False, timezones=False)
+
+
+def _normalize_chunk(
+    numbers: list[str],
+    region: str | None,
+    keep_raw_input: bool,
+    properties: tuple[str, ...],
+) -> _ChunkResult:
+    parsed = []
+    failures = []
+    values = []
+    for position, number in enumerate(numbers):
+        result = PhoneNumber.try_parse(
+            number, region=region, keep_raw_input=keep_raw_input
+        )
+        if isinstance(result, ParseFailure):
+            failures.append((position, int(result.error_type), result.message))
+            continue
+        parsed.append(result)
+        if properties:
+            values.append(tuple([getattr(result, name) for name in properties]))
+    return encode_many(parsed), failures, values
+
+
+def _chunk_results(
+    numbers: list[str], result: _ChunkResult, properties: tuple[str, ...]
+) -> Iterator[PhoneNumber | ParseFailure]:
+    data, failures, values = result
+    parsed = decode_many(data)
+    if properties:
+        for number, number_values in zip(parsed, values):
+            number.__dict__.update(zip(properties, number_values))
+
+    parsed_iter = iter(parsed)
+    failure_iter = iter(failures)
+    failure = next(failure_iter, None)
+    for position, number in enumerate(numbers):
+        if failure is not None and failure[0] == position:
+            yield ParseFailure(number, NumberParseErrorType(failure[1]), failure[2])
+            failure = next(failure_iter, None)
+        else:
+            yield next(parsed_iter)
+
+
+def normalize(
+    numbers: Iterable[str],
+    /,
+    *,
+    region: str | None = None,
+    keep_raw_input: bool = False,
+    errors: ParseErrors = "raise",
+    properties: Iterable[str] = (),
+    workers: int | None = None,
+    chunksize: int = 1000,
+    mp_context: BaseContext | None = None,
+) -> Iterator[PhoneNumber | ParseFailure]:
+    """Parses many strings in a pool of worker processes and yields the results in input order.
+
+    The input is consumed lazily, one chunk per worker process at a time, and
+    at most two chunks per worker are in flight, so memory use does not grow
+    with the size of the input.
+
+    Parameters:
+        numbers: The phone numbers to parse.
+        region: The region code the phone numbers are expected to be from.
+        keep_raw_input: Whether to keep the raw input of the phone numbers.
+        errors: How to handle strings that cannot be parsed: "raise" raises a
+            NumberParseException, "skip" leaves them out of the results and
+            "collect" yields a ParseFailure in their place.
+        properties: The cached properties to compute in the worker processes,
+            out of PROPERTIES.
+        workers: The number of worker processes, or None for the number of CPUs.
+        chunksize: The number of strings sent to a worker process at a time.
+        mp_context: The multiprocessing context to start the worker processes with.
+
+    Raises:
+        ValueError: If errors, properties, workers or chunksize is invalid.
+        NumberParseException: If a string cannot be parsed and errors is "raise".
+
+    Returns:
+        An iterator of PhoneNumber objects (and ParseFailure objects if errors is "collect").
+    """
+    if errors not in ("raise", "skip", "collect"):
+        raise ValueError(f"Invalid value for errors: {errors!r}")
+    property_names = tuple(properties)
+    invalid = set(property_names) - PROPERTIES
+    if invalid:
+        raise ValueError(f"Invalid properties: {', '.join(sorted(invalid))}")
+    if workers is not None and workers <= 0:
+        raise ValueError("workers must be greater than zero.")
+    if chunksize <= 0:
+        raise ValueError("chunksize must be greater than zero.")
+
+    return _normalize(
+        numbers,
+        region,
+        keep_raw_input,
+        errors,
+        property_names,
+        workers,
+        chunksize,
+        mp_context,
+    )
+
+
+def _normalize(
+    numbers: Iterable[str],
+    region: str | None,
+    keep_raw_input: bool,
+    errors: ParseErrors,
+    properties: tuple[str, ...],
+    workers: int | None,
+    chunksize: int,
+    mp_context: BaseContext | None,
+) -> Iterator[PhoneNumber | ParseFailure]:
+    if workers is None:
+        workers = os.cpu_count() or 1
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=_initialize_worker,
+    )
+    try:
+        max_inflight = 2 * workers
+        iterator = iter(numbers)
+        inflight: deque[tuple[list[str], Future[_ChunkResult]]] = deque()
+        while True:
+            while len(inflight) < max_inflight:
+                chunk = list(islice(iterator, chunksize))
+                if not chunk:
+                    break
+                future = executor.submit(
+                    _normalize_chunk, chunk, region, keep_raw_input, properties
+                )
+                inflight.append((chunk, future))
+
+            if not inflight:
+                return
+
+            chunk, future = inflight.popleft()
+            for result in _chunk_results(chunk, future.result(), properties):
+                if isinstance(result, ParseFailure):
+                    if errors == "raise":
+                        raise result.to_exception()
+                    if errors == "skip":
+                        continue
+                yield result
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,485 @@
+# SPDX-FileCopyrightText: 2023-present Ryan Kroon <rykroon.tech@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""A parser bound to a default region.
+
+`PhoneNumber.parse()` looks up the metadata of the default region, compiles
+or looks up its international and national prefix patterns and normalizes
+the digits of the string one character at a time on every call. A Parser
+resolves the metadata and compiles the patterns of its region once, and
+parses strings that only consist of ASCII digits and common punctuation,
+such as "(201) 555-0123", directly. Every other string, including strings
+with an extension, an international prefix or a plus sign, and every string
+that cannot be parsed, goes through `PhoneNumber.parse()`, so the results
+are always the same.
+
+`normalize()` and `normalize_many()` go straight from strings to formatted
+strings, e.g. in E.164, with a Parser per region.
+"""
+import re
+from typing import Iterable, Literal, overload
+
+import phonenumbers as pn
+
+from digitz import cache
+from digitz.enums import CountryCodeSource, PhoneNumberFormat, ValidationResult
+from digitz.instrumentation import instrumented
+from digitz.phonenumbers import (
+    _MAX_INPUT_STRING_LENGTH,
+    _MAX_LENGTH_FOR_NSN,
+    _MIN_LENGTH_FOR_NSN,
+    ParseErrors,
+    ParseFailure,
+    PhoneNumber,
+    _split_e164,
+    _test_number_length,
+)
+
+__all__ = ["Parser", "normalize", "normalize_many"]
+
+
+# Strings that pn.parse() reduces to their digits: no letters, extensions,
+# plus signs, phone contexts or non-ASCII characters.
+_SIMPLE_NUMBER_PATTERN = re.compile(r"[0-9 ().\-]+")
+_PUNCTUATION = str.maketrans("", "", " ().-")
+# pn.parse() only accepts strings with at least three digits and punctuation.
+_MIN_DIGITS = 3
+
+# The lengths after which pn.parse() keeps the national prefix.
+_KEEP_NATIONAL_PREFIX = (
+    ValidationResult.TOO_SHORT,
+    ValidationResult.IS_POSSIBLE_LOCAL_ONLY,
+    ValidationResult.INVALID_LENGTH,
+)
+
+
+def _compile(pattern: str | None) -> re.Pattern[str] | None:
+    return re.compile(pattern) if pattern else None
+
+
+class _Region:
+    """The compiled national prefix and general pattern of a region."""
+
+    __slots__ = ("metadata", "general", "national_prefix", "transform_rule")
+
+    def __init__(self, metadata: pn.PhoneMetadata) -> None:
+        self.metadata = metadata
+        general_desc = metadata.general_desc
+        self.general = _compile(
+            None if general_desc is None else general_desc.national_number_pattern
+        )
+        self.national_prefix = _compile(metadata.national_prefix_for_parsing)
+        self.transform_rule = metadata.national_prefix_transform_rule or None
+
+    def matches(self, digits: str) -> bool:
+        return self.general is not None and self.general.fullmatch(digits) is not None
+
+    def strip_national_prefix(self, digits: str) -> tuple[str | None, str]:
+        """Returns the carrier code and the digits without the national prefix.
+
+        Mirrors pn's _maybe_strip_national_prefix_carrier_code().
+        """
+        pattern = self.national_prefix
+        if pattern is None or not digits:
+            return "", digits
+        match = pattern.match(digits)
+        if match is None:
+            return "", digits
+
+        groups = match.groups()
+        if self.transform_rule is None or groups[-1] is None:
+            stripped = digits[match.end() :]
+            carrier_code = match.group(1) if groups else ""
+        else:
+            stripped = pattern.sub(self.transform_rule, digits, count=1)
+            carrier_code = match.group(1) if len(groups) > 1 else ""
+
+        if self.matches(digits) and not self.matches(stripped):
+            return "", digits
+        return carrier_code, stripped
+
+
+class Parser:
+    """Parses phone numbers with a default region.
+
+    A Parser is immutable and can be shared between threads, e.g. in a
+    registry with one Parser per tenant.
+
+    Like `PhoneNumber.parse()`, a Parser without a region, or with a region
+    code that is not in `phonenumbers.SUPPORTED_REGIONS`, such as "gb", only
+    parses strings with a plus sign. Such a Parser parses every string with
+    `PhoneNumber.parse()`.
+
+    Parameters:
+        region: The region code the phone numbers are expected to be from.
+        keep_raw_input: Whether to keep the raw input of the phone numbers.
+    """
+
+    __slots__ = (
+        "_region_code",
+        "_keep_raw_input",
+        "_simple",
+        "_country_code",
+        "_idd",
+        "_region",
+        "_country_region",
+    )
+
+    def __init__(self, region: str | None, *, keep_raw_input: bool = False) -> None:
+        self._region_code = region
+        self._keep_raw_input = keep_raw_input
+
+        # pn.parse() looks the region code up in pn.SUPPORTED_REGIONS as is,
+        # so strings of other regions, e.g. lower case ones, need the full parser.
+        self._simple = region in pn.SUPPORTED_REGIONS
+        if not self._simple:
+            return
+
+        metadata = pn.PhoneMetadata.metadata_for_region(region)
+        self._country_code = metadata.country_code
+        self._idd = _compile(metadata.international_prefix)
+        self._region = _Region(metadata)
+
+        # pn.parse() switches to the metadata of the main region of the
+        # country code once it strips the country code from a number.
+        main_region = pn.region_code_for_country_code(metadata.country_code)
+        if main_region == region:
+            self._country_region = self._region
+        else:
+            self._country_region = _Region(
+                pn.PhoneMetadata.metadata_for_region_or_calling_code(
+                    metadata.country_code, main_region
+                )
+            )
+
+    def __repr__(self) -> str:
+        return (
+            f"Parser(region={self._region_code!r}, "
+            f"keep_raw_input={self._keep_raw_input!r})"
+        )
+
+    @property
+    def region(self) -> str | None:
+        """The region code the phone numbers are expected to be from."""
+        return self._region_code
+
+    @property
+    def keep_raw_input(self) -> bool:
+        """Whether the raw input of the phone numbers is kept."""
+        return self._keep_raw_input
+
+    def _split_simple(
+        self, number: str
+    ) -> tuple[str, CountryCodeSource, str | None] | None:
+        """Splits a string of digits and punctuation the way pn.parse() does.
+
+        Returns the national significant number, the country code source and
+        the carrier code, or None if the string needs the full parser.
+        """
+        if not self._simple or len(number) > _MAX_INPUT_STRING_LENGTH:
+            return None
+        if _SIMPLE_NUMBER_PATTERN.fullmatch(number) is None:
+            return None
+        digits = number.translate(_PUNCTUATION)
+        if not _MIN_DIGITS <= len(digits) <= _MAX_LENGTH_FOR_NSN:
+            return None
+        if self._idd is not None and self._idd.match(digits):
+            return None
+
+        # Mirrors pn._maybe_extract_country_code() for numbers without a plus sign.
+        region = self._region
+        source = CountryCodeSource.FROM_DEFAULT_COUNTRY
+        country_code = str(self._country_code)
+        if digits.startswith(country_code):
+            _, potential = region.strip_national_prefix(digits[len(country_code) :])
+            if (not region.matches(digits) and region.matches(potential)) or (
+                _test_number_length(digits, region.metadata)
+                == ValidationResult.TOO_LONG
+            ):
+                source = CountryCodeSource.FROM_NUMBER_WITHOUT_PLUS_SIGN
+                digits = potential
+                region = self._country_region
+                if len(digits) < _MIN_LENGTH_FOR_NSN:
+                    return None
+
+        carrier_code, potential = region.strip_national_prefix(digits)
+        if _test_number_length(potential, region.metadata) in _KEEP_NATIONAL_PREFIX:
+            carrier_code = None
+        else:
+            digits = potential
+        if not _MIN_LENGTH_FOR_NSN <= len(digits) <= _MAX_LENGTH_FOR_NSN:
+            return None
+        return digits, source, carrier_code
+
+    def _parse_simple(self, number: str) -> PhoneNumber | None:
+        split = self._split_simple(number)
+        if split is None:
+            return None
+        digits, source, carrier_code = split
+
+        italian_leading_zero = False
+        number_of_leading_zeros = None
+        if digits[0] == "0":
+            italian_leading_zero = True
+            zeros = len(digits) - len(digits.lstrip("0"))
+            zeros = min(zeros, len(digits) - 1)
+            if zeros != 1:
+                number_of_leading_zeros = zeros
+
+        if not self._keep_raw_input:
+            return PhoneNumber._from_fields(
+                self._country_code,
+                int(digits),
+                None,
+                italian_leading_zero,
+                number_of_leading_zeros,
+            )
+        return PhoneNumber._from_fields(
+            self._country_code,
+            int(digits),
+            None,
+            italian_leading_zero,
+            number_of_leading_zeros,
+            number,
+            source,
+            carrier_code or None,
+        )
+
+    def _parse(self, number: str) -> PhoneNumber:
+        # Strings with a plus sign take the E.164 fast path of PhoneNumber.
+        if number[:1] != "+":
+            result = self._parse_simple(number)
+            if result is not None:
+                return result
+        return PhoneNumber._parse(number, self._region_code, self._keep_raw_input)
+
+    def _try_parse(self, number: str) -> PhoneNumber | ParseFailure:
+        if number[:1] != "+":
+            result = self._parse_simple(number)
+            if result is not None:
+                return result
+        return PhoneNumber._try_parse(number, self._region_code, self._keep_raw_input)
+
+    @instrumented("parse")
+    def parse(self, number: str, /) -> PhoneNumber:
+        """Attempts to parse a string and return a new PhoneNumber object.
+
+        The result is the same as `PhoneNumber.parse()` returns with the
+        region and keep_raw_input of the parser.
+
+        Parameters:
+            number: The phone number to parse.
+
+        Raises:
+            NumberParseException: If the phone number cannot be parsed.
+
+        Returns:
+            A new PhoneNumber object.
+        """
+        parse_cache = cache.parse_cache
+        if parse_cache is None:
+            return self._parse(number)
+
+        key = (PhoneNumber, number, self._region_code, self._keep_raw_input)
+        result = parse_cache.get(key)
+        if result is None:
+            try:
+                result = self._parse(number)
+            except pn.NumberParseException as e:
+                parse_cache.put(key, ParseFailure.from_exception(number, e))
+                raise e
+            parse_cache.put(key, result)
+
+        elif isinstance(result, ParseFailure):
+            raise result.to_exception()
+
+        return result
+
+    @instrumented("try_parse")
+    def try_parse(self, number: str, /) -> PhoneNumber | ParseFailure:
+        """Attempts to parse a string without raising an exception.
+
+        The result is the same as `PhoneNumber.try_parse()` returns with the
+        region and keep_raw_input of the parser.
+
+        Parameters:
+            number: The phone number to parse.
+
+        Returns:
+            A new PhoneNumber object, or a ParseFailure if the string cannot be parsed.
+        """
+        parse_cache = cache.parse_cache
+        if parse_cache is None:
+            return self._try_parse(number)
+
+        key = (PhoneNumber, number, self._region_code, self._keep_raw_input)
+        result = parse_cache.get(key)
+        if result is None:
+            result = self._try_parse(number)
+            parse_cache.put(key, result)
+        return result
+
+    @overload
+    def parse_many(
+        self, numbers: Iterable[str], /, *, errors: Literal["raise", "skip"] = "raise"
+    ) -> list[PhoneNumber]: ...
+
+    @overload
+    def parse_many(
+        self, numbers: Iterable[str], /, *, errors: Literal["collect"]
+    ) -> list[PhoneNumber | ParseFailure]: ...
+
+    def parse_many(
+        self, numbers: Iterable[str], /, *, errors: ParseErrors = "raise"
+    ) -> list[PhoneNumber] | list[PhoneNumber | ParseFailure]:
+        """Parses many strings and returns the results in input order.
+
+        Parameters:
+            numbers: The phone numbers to parse.
+            errors: What to do with strings that cannot be parsed. "raise" raises
+                the first NumberParseException, "skip" leaves the string out of
+                the results and "collect" puts a ParseFailure in its place.
+
+        Raises:
+            ValueError: If errors is invalid.
+            NumberParseException: If a phone number cannot be parsed and errors is "raise".
+
+        Returns:
+            A list of PhoneNumber objects (and ParseFailure objects if errors is "collect").
+        """
+        if errors not in ("raise", "skip", "collect"):
+            raise ValueError(f"Invalid value for errors: {errors!r}")
+
+        try_parse = self.try_parse
+        results = []
+        for number in numbers:
+            result = try_parse(number)
+            if isinstance(result, ParseFailure):
+                if errors == "raise":
+                    raise result.to_exception()
+                if errors == "skip":
+                    continue
+            results.append(result)
+        return results
+
+    @instrumented("normalize")
+    def _normalize(self, number: str, format: PhoneNumberFormat) -> str | ParseFailure:
+        # Returns the ParseFailure, so that instrumentation counts it as an error.
+        if format == PhoneNumberFormat.E164:
+            if number[:1] == "+":
+                # A strict E.164 string that splits is its own E.164 format.
+                if _split_e164(number) is not None:
+                    return number
+            else:
+                split = self._split_simple(number)
+                if split is not None:
+                    return f"+{self._country_code}{split[0]}"
+
+        result = self._try_parse(number)
+        if isinstance(result, ParseFailure):
+            return result
+        return pn.format_number(result, format)
+
+    def normalize(
+        self, number: str, /, format: PhoneNumberFormat = PhoneNumberFormat.E164
+    ) -> str | None:
+        """Parses a string and returns the phone number in the specified format.
+
+        The result is the same as `parse(number).format(format)` returns, but
+        strings that can be formatted in E.164 without the full parser are
+        formatted without creating a PhoneNumber object.
+
+        Parameters:
+            number: The phone number to parse.
+            format: The format to use.
+
+        Returns:
+            The formatted phone number, or None if the string cannot be parsed.
+        """
+        result = self._normalize(number, format)
+        if isinstance(result, ParseFailure):
+            return None
+        return result
+
+    def normalize_many(
+        self,
+        numbers: Iterable[str],
+        /,
+        format: PhoneNumberFormat = PhoneNumberFormat.E164,
+    ) -> list[str | None]:
+        """Parses many strings and returns the phone numbers in the specified format.
+
+        Parameters:
+            numbers: The phone numbers to parse.
+            format: The format to use.
+
+        Returns:
+            A list with the formatted phone number of each string, or None
+            for the strings that cannot be parsed, in input order.
+        """
+        normalize = self.normalize
+        return [normalize(number, format) for number in numbers]
+
+
+# The parsers that were used by normalize() and PhoneNumber.parse_many(), by
+# region code and keep_raw_input.
+_parsers: dict[tuple[str | None, bool], Parser] = {}
+
+
+def _parser(region: str | None, keep_raw_input: bool = False) -> Parser:
+    key = (region, keep_raw_input)
+    try:
+        return _parsers[key]
+    except KeyError:
+        pass
+
+    parser = Parser(region, keep_raw_input=keep_raw_input)
+    # Only None and the supported regions are kept, so that the dict stays small.
+    if region is None or region in pn.SUPPORTED_REGIONS:
+        parser = _parsers.setdefault(key, parser)
+    return parser
+
+
+def normalize(
+    number: str,
+    /,
+    *,
+    region: str | None = None,
+    format: PhoneNumberFormat = PhoneNumberFormat.E164,
+) -> str | None:
+    """Parses a string and returns the phone number in the specified format.
+
+    The result is the same as `PhoneNumber.parse(number, region=region).format(format)`
+    returns, or None instead of a NumberParseException. The Parser of each
+    region is created once and reused.
+
+    Parameters:
+        number: The phone number to parse.
+        region: The region code the phone number is expected to be from.
+        format: The format to use.
+
+    Returns:
+        The formatted phone number, or None if the string cannot be parsed.
+    """
+    return _parser(region).normalize(number, format)
+
+
+def normalize_many(
+    numbers: Iterable[str],
+    /,
+    *,
+    region: str | None = None,
+    format: PhoneNumberFormat = PhoneNumberFormat.E164,
+) -> list[str | None]:
+    """Parses many strings and returns the phone numbers in the specified format.
+
+    Parameters:
+        numbers: The phone numbers to parse.
+        region: The region code the phone numbers are expected to be from.
+        format: The format to use.
+
+    Returns:
+        A list with the formatted phone number of each string, or None for the
+        strings that cannot be parsed, in input order.
+    """
+    return _parser(region).normalize_many(numbers, format)
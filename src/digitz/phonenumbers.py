@@ -2,19 +2,24 @@
 #
 # SPDX-License-Identifier: MIT
 from dataclasses import dataclass, field
-from functools import lru_cache, cached_property
-from typing import Any, Type, TypeVar
+from functools import partial
+import re
+from typing import Any, Callable, Iterable, Literal, Type, TypeVar, overload
 
 import phonenumbers as pn
 from zoneinfo import ZoneInfo
 
+from digitz import cache
+from digitz.classifier import _metadata_for_country_code, _region_and_type
 from digitz.enums import (
     CountryCodeSource,
     MatchType,
     NumberParseErrorType,
     PhoneNumberFormat,
     PhoneNumberType,
+    ValidationResult,
 )
+from digitz.instrumentation import instrumented
 
 PhoneNumberTuple = tuple[
     int,
@@ -37,6 +42,177 @@ MISSING = _MISSING_TYPE()
 
 Self = TypeVar("Self", bound="PhoneNumber")
 
+ParseErrors = Literal["raise", "skip", "collect"]
+
+# A plus sign followed by a country code and a national significant number.
+_E164_PATTERN = re.compile(r"\+[1-9][0-9]{2,19}")
+_NON_DIGITS_PATTERN = re.compile(r"\D+")
+_MIN_LENGTH_FOR_NSN = 2
+_MAX_LENGTH_FOR_NSN = 17
+
+_COUNTRY_CODES = {str(code): code for code in pn.COUNTRY_CODE_TO_REGION_CODE}
+
+_national_prefix_patterns: dict[int, re.Pattern[str] | None] = {}
+
+
+def _test_general_length(national_number: str, metadata: pn.PhoneMetadata) -> int:
+    """Returns the ValidationResult of the length of a national number of
+    unknown type, using only the public metadata of its region.
+
+    Equivalent to the private _test_number_length() of phonenumbers for
+    numbers of unknown type, for versions of phonenumbers without it.
+    """
+    desc = metadata.general_desc
+    if desc is None:
+        return ValidationResult.INVALID_LENGTH
+
+    length = len(national_number)
+    if length in desc.possible_length_local_only:
+        return ValidationResult.IS_POSSIBLE_LOCAL_ONLY
+    possible_lengths = desc.possible_length
+    if length in possible_lengths:
+        return ValidationResult.IS_POSSIBLE
+    if length < possible_lengths[0]:
+        return ValidationResult.TOO_SHORT
+    if length > possible_lengths[-1]:
+        return ValidationResult.TOO_LONG
+    return ValidationResult.INVALID_LENGTH
+
+
+try:
+    from phonenumbers.phonenumberutil import _test_number_length
+except ImportError:  # pragma: no cover
+    _test_number_length = _test_general_length  # type: ignore[assignment]
+
+
+def _national_prefix_pattern(country_code: int) -> re.Pattern[str] | None:
+    try:
+        return _national_prefix_patterns[country_code]
+    except KeyError:
+        pass
+
+    metadata = pn.PhoneMetadata.metadata_for_region_or_calling_code(
+        country_code, pn.region_code_for_country_code(country_code)
+    )
+    prefix = None if metadata is None else metadata.national_prefix_for_parsing
+    pattern = re.compile(prefix) if prefix else None
+    _national_prefix_patterns[country_code] = pattern
+    return pattern
+
+
+def _split_e164(number: str) -> tuple[int, str] | None:
+    """Splits a strict E.164 string into its country code and national significant number.
+
+    Returns None if the string is not strict E.164 or if it is ambiguous and
+    needs the full parser, e.g. it starts with a national prefix or leading zeros.
+    """
+    if _E164_PATTERN.fullmatch(number) is None:
+        return None
+
+    # Country codes are prefix-free, so the first match is the only one.
+    for length in (2, 3, 4):
+        country_code = _COUNTRY_CODES.get(number[1:length])
+        if country_code is not None:
+            break
+    else:
+        return None
+
+    nsn = number[length:]
+    if not _MIN_LENGTH_FOR_NSN <= len(nsn) <= _MAX_LENGTH_FOR_NSN or nsn[0] == "0":
+        return None
+
+    pattern = _national_prefix_pattern(country_code)
+    if pattern is not None and pattern.match(nsn):
+        return None
+
+    return country_code, nsn
+
+
+@dataclass(frozen=True)
+class ParseFailure:
+    """
+    A dataclass representing a string that could not be parsed.
+
+    Parameters:
+        number: The string that could not be parsed.
+        error_type: The reason the string could not be parsed.
+        message: The error message.
+    """
+
+    number: str
+    error_type: NumberParseErrorType
+    message: str
+
+    @classmethod
+    def from_exception(
+        cls, number: str, exc: pn.NumberParseException
+    ) -> "ParseFailure":
+        """Returns a new ParseFailure from a NumberParseException."""
+        return cls(
+            number=number,
+            error_type=NumberParseErrorType(exc.error_type),
+            message=exc.args[0],
+        )
+
+    def __bool__(self) -> bool:
+        return False
+
+    def to_exception(self) -> pn.NumberParseException:
+        """Returns the NumberParseException equivalent of the failure."""
+        return pn.NumberParseException(self.error_type, self.message)
+
+
+@dataclass(frozen=True)
+class NumberInfo:
+    """
+    A dataclass representing the analysis of a phone number.
+
+    Parameters:
+        region_code: The region code of the phone number.
+        is_valid: Whether the phone number is of a valid pattern.
+        number_type: The type of the phone number.
+        is_possible: Whether the phone number is possible.
+        validation_result: The reason the phone number is possible or not.
+        national_destination_code_length: The length of the national destination code.
+        national_significant_number: The national significant number.
+    """
+
+    region_code: str | None
+    is_valid: bool
+    number_type: PhoneNumberType
+    is_possible: bool
+    validation_result: ValidationResult
+    national_destination_code_length: int
+    national_significant_number: str
+
+
+_MAX_INPUT_STRING_LENGTH = 250
+# pn.parse() only accepts strings with at least two decimal digits.
+_TWO_DIGITS_PATTERN = re.compile(r"\d.*?\d", re.DOTALL)
+
+
+def _screen(number: str) -> ParseFailure | None:
+    """Returns the failure of a string that pn.parse() rejects up front, if any.
+
+    Mirrors the cheapest checks at the start of pn.parse(), which reject most
+    garbage, so that such strings fail without raising and catching an exception.
+    """
+    if len(number) > _MAX_INPUT_STRING_LENGTH:
+        return ParseFailure(
+            number,
+            NumberParseErrorType.TOO_LONG,
+            "The string supplied was too long to parse.",
+        )
+
+    if ";phone-context=" not in number and not _TWO_DIGITS_PATTERN.search(number):
+        return ParseFailure(
+            number,
+            NumberParseErrorType.NOT_A_NUMBER,
+            "The string supplied did not seem to be a phone number.",
+        )
+
+    return None
+
 
 @dataclass(frozen=True)
 class PhoneNumber(pn.PhoneNumber):
@@ -63,6 +239,7 @@ class PhoneNumber(pn.PhoneNumber):
     country_code_source: CountryCodeSource = CountryCodeSource.UNSPECIFIED
     preferred_domestic_carrier_code: str | None = None
 
+    @instrumented("parse")
     @classmethod
     def parse(
         cls: Type[Self],
@@ -85,6 +262,34 @@ class PhoneNumber(pn.PhoneNumber):
         Returns:
             A new PhoneNumber object.
         """
+        parse_cache = cache.parse_cache
+        if parse_cache is None:
+            return cls._parse(number, region, keep_raw_input)
+
+        key = (cls, number, region, keep_raw_input)
+        result = parse_cache.get(key)
+        if result is None:
+            try:
+                result = cls._parse(number, region, keep_raw_input)
+            except pn.NumberParseException as e:
+                parse_cache.put(key, ParseFailure.from_exception(number, e))
+                raise e
+            parse_cache.put(key, result)
+
+        elif isinstance(result, ParseFailure):
+            raise result.to_exception()
+
+        return result
+
+    @classmethod
+    def _parse(
+        cls: Type[Self], number: str, region: str | None, keep_raw_input: bool
+    ) -> Self:
+        if number[:1] == "+":
+            split = _split_e164(number)
+            if split is not None:
+                return cls._from_e164_split(split, number, keep_raw_input)
+
         try:
             numobj = pn.parse(number, region=region, keep_raw_input=keep_raw_input)
 
@@ -92,16 +297,200 @@ class PhoneNumber(pn.PhoneNumber):
             e.error_type = NumberParseErrorType(e.error_type)
             raise e
 
-        return cls(
-            country_code=numobj.country_code or 0,
-            national_number=numobj.national_number or 0,
-            extension=numobj.extension,
-            italian_leading_zero=bool(numobj.italian_leading_zero),
-            number_of_leading_zeros=numobj.number_of_leading_zeros,
-            raw_input=numobj.raw_input,
-            country_code_source=CountryCodeSource(numobj.country_code_source),
-            preferred_domestic_carrier_code=numobj.preferred_domestic_carrier_code,
-        )
+        return cls._from_numobj(numobj)
+
+    @instrumented("try_parse")
+    @classmethod
+    def try_parse(
+        cls: Type[Self],
+        number: str,
+        /,
+        *,
+        region: str | None = None,
+        keep_raw_input: bool = False,
+    ) -> Self | ParseFailure:
+        """Attempts to parse a string without raising an exception.
+
+        Most strings that cannot be parsed are rejected before parsing them,
+        which is considerably faster than raising and catching a
+        NumberParseException when many strings are invalid.
+
+        Parameters:
+            number: The phone number to parse.
+            region: The region code the phone number is expected to be from.
+            keep_raw_input: Whether to keep the raw input of the phone number.
+
+        Returns:
+            A new PhoneNumber object, or a ParseFailure if the string cannot be parsed.
+        """
+        parse_cache = cache.parse_cache
+        if parse_cache is None:
+            return cls._try_parse(number, region, keep_raw_input)
+
+        key = (cls, number, region, keep_raw_input)
+        result = parse_cache.get(key)
+        if result is None:
+            result = cls._try_parse(number, region, keep_raw_input)
+            parse_cache.put(key, result)
+        return result
+
+    @classmethod
+    def _try_parse(
+        cls: Type[Self], number: str, region: str | None, keep_raw_input: bool
+    ) -> Self | ParseFailure:
+        if number[:1] == "+":
+            split = _split_e164(number)
+            if split is not None:
+                return cls._from_e164_split(split, number, keep_raw_input)
+
+        failure = _screen(number)
+        if failure is not None:
+            return failure
+
+        try:
+            numobj = pn.parse(number, region=region, keep_raw_input=keep_raw_input)
+        except pn.NumberParseException as e:
+            return ParseFailure.from_exception(number, e)
+
+        return cls._from_numobj(numobj)
+
+    @classmethod
+    def _from_e164_split(
+        cls: Type[Self], split: tuple[int, str], number: str, keep_raw_input: bool
+    ) -> Self:
+        country_code, nsn = split
+        if keep_raw_input:
+            return cls._from_fields(
+                country_code,
+                int(nsn),
+                raw_input=number,
+                country_code_source=CountryCodeSource.FROM_NUMBER_WITH_PLUS_SIGN,
+            )
+        return cls._from_fields(country_code, int(nsn))
+
+    @classmethod
+    def from_e164(
+        cls: Type[Self], number: str, /, *, keep_raw_input: bool = False
+    ) -> Self:
+        """Returns a new PhoneNumber object from a string in E.164 format.
+
+        Strings such as "+12015550123" are split into their country code and
+        national number without going through the full parser. Strings that are
+        ambiguous, e.g. that start with a national prefix, fall back to `parse()`.
+
+        Parameters:
+            number: The phone number in E.164 format.
+            keep_raw_input: Whether to keep the raw input of the phone number.
+
+        Raises:
+            NumberParseException: If the string is not in E.164 format or cannot be parsed.
+
+        Returns:
+            A new PhoneNumber object.
+        """
+        if _E164_PATTERN.fullmatch(number) is None:
+            raise pn.NumberParseException(
+                NumberParseErrorType.NOT_A_NUMBER,
+                "The string supplied is not in E.164 format.",
+            )
+
+        split = _split_e164(number)
+        if split is None:
+            return cls.parse(number, keep_raw_input=keep_raw_input)
+
+        return cls._from_e164_split(split, number, keep_raw_input)
+
+    @overload
+    @classmethod
+    def parse_many(
+        cls: Type[Self],
+        numbers: Iterable[str | tuple[str, str | None]],
+        /,
+        *,
+        region: str | None = None,
+        keep_raw_input: bool = False,
+        errors: Literal["raise", "skip"] = "raise",
+    ) -> list[Self]: ...
+
+    @overload
+    @classmethod
+    def parse_many(
+        cls: Type[Self],
+        numbers: Iterable[str | tuple[str, str | None]],
+        /,
+        *,
+        region: str | None = None,
+        keep_raw_input: bool = False,
+        errors: Literal["collect"],
+    ) -> list[Self | ParseFailure]: ...
+
+    @classmethod
+    def parse_many(
+        cls: Type[Self],
+        numbers: Iterable[str | tuple[str, str | None]],
+        /,
+        *,
+        region: str | None = None,
+        keep_raw_input: bool = False,
+        errors: ParseErrors = "raise",
+    ) -> list[Self] | list[Self | ParseFailure]:
+        """Parses many strings and returns the results in input order.
+
+        The strings are grouped by region and the strings of each region are
+        parsed by one `digitz.Parser`, so the metadata of each region is
+        resolved once instead of once per string.
+
+        Parameters:
+            numbers: The phone numbers to parse. An item may also be a
+                (number, region) pair to override the default region.
+            region: The default region code the phone numbers are expected to be from.
+            keep_raw_input: Whether to keep the raw input of the phone numbers.
+            errors: What to do with strings that cannot be parsed. "raise" raises
+                the first NumberParseException, "skip" leaves the string out of
+                the results and "collect" puts a ParseFailure in its place.
+
+        Raises:
+            NumberParseException: If a phone number cannot be parsed and errors is "raise".
+
+        Returns:
+            A list of PhoneNumber objects (and ParseFailure objects if errors is "collect").
+        """
+        if errors not in ("raise", "skip", "collect"):
+            raise ValueError(f"Invalid value for errors: {errors!r}")
+
+        from digitz.parser import _parser
+
+        strings = []
+        groups: dict[str | None, list[int]] = {}
+        for index, item in enumerate(numbers):
+            if isinstance(item, tuple):
+                number, item_region = item
+            else:
+                number, item_region = item, region
+            strings.append(number)
+            groups.setdefault(item_region, []).append(index)
+
+        results: list[Any] = [None] * len(strings)
+        try_parse: Callable[[str], Any]
+        for item_region, indexes in groups.items():
+            # A Parser creates PhoneNumber objects, not objects of subclasses.
+            if cls is PhoneNumber:
+                try_parse = _parser(item_region, keep_raw_input).try_parse
+            else:
+                try_parse = partial(
+                    cls.try_parse, region=item_region, keep_raw_input=keep_raw_input
+                )
+            for index in indexes:
+                results[index] = try_parse(strings[index])
+
+        if errors == "raise":
+            # The first failure in input order, not in the order of the groups.
+            for result in results:
+                if isinstance(result, ParseFailure):
+                    raise result.to_exception()
+        elif errors == "skip":
+            return [result for result in results if result]
+        return results
 
     @classmethod
     def example_number(
@@ -122,7 +511,57 @@ class PhoneNumber(pn.PhoneNumber):
         if numobj is None:
             return None
 
-        return cls(
+        return cls._from_numobj(numobj)
+
+    @classmethod
+    def from_bytes(cls: Type[Self], data: bytes, /) -> Self:
+        """Returns a new PhoneNumber object from its binary encoding.
+
+        Parameters:
+            data: A phone number encoded with `to_bytes()`.
+
+        Raises:
+            ValueError: If the data is not an encoded phone number of a supported version.
+
+        Returns:
+            A new PhoneNumber object.
+        """
+        from digitz.codec import _decode
+
+        return _decode(data, cls)
+
+    @classmethod
+    def _from_fields(
+        cls: Type[Self],
+        country_code: int,
+        national_number: int,
+        extension: str | None = None,
+        italian_leading_zero: bool = False,
+        number_of_leading_zeros: int | None = None,
+        raw_input: str | None = None,
+        country_code_source: CountryCodeSource = CountryCodeSource.UNSPECIFIED,
+        preferred_domestic_carrier_code: str | None = None,
+    ) -> Self:
+        # Skips the frozen dataclass __init__, which sets every field through
+        # object.__setattr__ and is several times slower.
+        self = object.__new__(cls)
+        self.__dict__.update(
+            {
+                "country_code": country_code,
+                "national_number": national_number,
+                "extension": extension,
+                "italian_leading_zero": italian_leading_zero,
+                "number_of_leading_zeros": number_of_leading_zeros,
+                "raw_input": raw_input,
+                "country_code_source": country_code_source,
+                "preferred_domestic_carrier_code": preferred_domestic_carrier_code,
+            }
+        )
+        return self
+
+    @classmethod
+    def _from_numobj(cls: Type[Self], numobj: pn.PhoneNumber) -> Self:
+        return cls._from_fields(
             country_code=numobj.country_code or 0,
             national_number=numobj.national_number or 0,
             extension=numobj.extension,
@@ -167,17 +606,17 @@ class PhoneNumber(pn.PhoneNumber):
         return self.to_e164()
 
     # ~~~ national number related properties ~~~
-    @cached_property
+    @cache.cached_property
     def national_destination_code_length(self) -> int:
         """Returns the length of the national destination code."""
-        return pn.length_of_national_destination_code(self)
+        return self._ndc_length(self.number_type)
 
     @property
     def ndc_length(self) -> int:
         """An alias for the national_destination_code_length property."""
         return self.national_destination_code_length
 
-    @cached_property
+    @cache.cached_property
     def national_significant_number(self) -> str:
         """Returns the national significant number."""
         return pn.national_significant_number(self)
@@ -203,17 +642,31 @@ class PhoneNumber(pn.PhoneNumber):
         return self.national_significant_number[self.national_destination_code_length :]
 
     # ~~~ region related properties ~~~
-    @cached_property
+    @cache.cached_property
+    def _region_and_number_type(self) -> tuple[str | None, PhoneNumberType]:
+        # The region of a country code shared by several regions is determined
+        # by matching the number type patterns of each region, so both are
+        # determined together.
+        country_metadata = _metadata_for_country_code(self.country_code)
+        if country_metadata is None:
+            return None, PhoneNumberType.UNKNOWN
+        return _region_and_type(self.national_significant_number, country_metadata)
+
+    @cache.cached_property
     def region_code(self) -> str | None:
         """Returns the region code of the phone number."""
-        return pn.region_code_for_number(self)
+        country_metadata = _metadata_for_country_code(self.country_code)
+        if country_metadata is not None and len(country_metadata[0]) == 1:
+            # The only region of the country code needs no number type.
+            return country_metadata[0][0][0]
+        return self._region_and_number_type[0]
 
-    @cached_property
+    @cache.cached_property
     def is_geographical(self) -> bool:
         """Returns True if the phone number has a geographical association."""
-        return pn.is_number_geographical(self)
+        return pn.is_number_type_geographical(self.number_type, self.country_code)
 
-    @cached_property
+    @cache.cached_property
     def is_nanpa_country(self) -> bool:
         """Returns True if the phone number is from a NANPA country."""
         if self.region_code is None:
@@ -221,23 +674,22 @@ class PhoneNumber(pn.PhoneNumber):
         return pn.is_nanpa_country(self.region_code)
 
     # ~~~ phone number validity properties ~~~
-    @cached_property
+    @cache.cached_property
     def is_possible(self) -> bool:
         """Returns True if the phone number is possible."""
         return pn.is_possible_number(self)
 
-    @cached_property
+    @cache.cached_property
     def is_valid(self) -> bool:
         """Returns True if the phone number is of a valid pattern."""
-        if self.region_code is None:
-            return False
-        return pn.is_valid_number_for_region(self, self.region_code)
+        region_code, number_type = self._region_and_number_type
+        return region_code is not None and number_type != PhoneNumberType.UNKNOWN
 
     # ~~~ Number type properties ~~~
-    @cached_property
+    @cache.cached_property
     def number_type(self) -> PhoneNumberType:
         """Returns the type of a valid phone number."""
-        return PhoneNumberType(pn.number_type(self))
+        return self._region_and_number_type[1]
 
     @property
     def is_fixed_line(self) -> bool:
@@ -294,12 +746,118 @@ class PhoneNumber(pn.PhoneNumber):
         """Returns whether the phone number type is a voicemail access number."""
         return self.number_type == PhoneNumberType.VOICEMAIL
 
-    @cached_property
+    @cache.cached_property
     def timezones(self) -> tuple[ZoneInfo, ...]:
-        """Returns the timezones of the phone number."""
-        from phonenumbers.timezone import time_zones_for_number
+        """Returns the timezones of the phone number.
+
+        Phone numbers with the same timezones share the same tuple, and an
+        empty tuple is returned if the timezones are unknown.
+        """
+        from digitz.timezones import _timezones
+
+        return _timezones(self.number_type, self.country_code, self.to_e164())
+
+    # ~~~ Analysis methods ~~~
+    def analyze(self) -> NumberInfo:
+        """Returns the region, validity, type and possibility of the phone number.
+
+        The properties are computed together, so that the number type patterns
+        of the region are only matched once instead of once for each property,
+        and the corresponding cached properties are filled in as well.
 
-        return tuple([ZoneInfo(zone) for zone in time_zones_for_number(self)])
+        Returns:
+            A NumberInfo object.
+        """
+        try:
+            return self.__dict__["_number_info"]
+        except KeyError:
+            pass
+
+        nsn = self.national_significant_number
+        region_code, number_type = self._region_and_number_type
+        country_metadata = _metadata_for_country_code(self.country_code)
+        if country_metadata is None:
+            validation_result = ValidationResult.INVALID_COUNTRY_CODE
+        else:
+            validation_result = ValidationResult(
+                _test_number_length(nsn, country_metadata[1])
+            )
+
+        info = NumberInfo(
+            region_code=region_code,
+            is_valid=region_code is not None and number_type != PhoneNumberType.UNKNOWN,
+            number_type=number_type,
+            is_possible=validation_result
+            in (ValidationResult.IS_POSSIBLE, ValidationResult.IS_POSSIBLE_LOCAL_ONLY),
+            validation_result=validation_result,
+            national_destination_code_length=self._ndc_length(number_type),
+            national_significant_number=nsn,
+        )
+        self._set_number_info(info)
+        return info
+
+    @classmethod
+    def analyze_many(cls, numbers: Iterable[pn.PhoneNumber], /) -> list[NumberInfo]:
+        """Analyzes many phone numbers, in input order.
+
+        Phone numbers that occur more than once are only analyzed once.
+
+        Parameters:
+            numbers: The phone numbers.
+
+        Returns:
+            A list with the NumberInfo of each phone number.
+        """
+        seen: dict[tuple, NumberInfo] = {}
+        results = []
+        for number in numbers:
+            key = (
+                number.country_code,
+                number.national_number,
+                number.italian_leading_zero,
+                number.number_of_leading_zeros,
+            )
+            info = seen.get(key)
+            if info is None:
+                if not isinstance(number, PhoneNumber):
+                    number = cls._from_numobj(number)
+                info = seen[key] = number.analyze()
+            elif isinstance(number, PhoneNumber):
+                number._set_number_info(info)
+            results.append(info)
+        return results
+
+    def _set_number_info(self, info: NumberInfo) -> None:
+        self.__dict__.update(
+            {
+                "_number_info": info,
+                "_region_and_number_type": (info.region_code, info.number_type),
+                "region_code": info.region_code,
+                "is_valid": info.is_valid,
+                "number_type": info.number_type,
+                "is_possible": info.is_possible,
+                "national_destination_code_length": (
+                    info.national_destination_code_length
+                ),
+                "national_significant_number": info.national_significant_number,
+            }
+        )
+
+    def _ndc_length(self, number_type: PhoneNumberType) -> int:
+        # Mirrors pn.length_of_national_destination_code(), which determines
+        # the number type once more.
+        numobj = self if self.extension is None else self.replace(extension=None)
+        groups = _NON_DIGITS_PATTERN.split(
+            numobj.format(PhoneNumberFormat.INTERNATIONAL)
+        )
+        if len(groups) <= 3:
+            return 0
+
+        if number_type == PhoneNumberType.MOBILE and pn.country_mobile_token(
+            self.country_code
+        ):
+            return len(groups[2]) + len(groups[3])
+        return len(groups[2])
 
     # ~~~ Match type methods ~~~
     def match(self, other: str | pn.PhoneNumber, /) -> MatchType:
@@ -338,7 +896,8 @@ class PhoneNumber(pn.PhoneNumber):
         )
 
     # ~~~ Carrier and country name methods ~~~
-    @lru_cache
+    @instrumented("get_carrier_name")
+    @cache.cached_method
     def get_carrier_name(self, lang: str) -> str:
         """Returns the carrier name of the phone number.
 
@@ -348,11 +907,17 @@ class PhoneNumber(pn.PhoneNumber):
         Returns:
             The carrier name of the phone number.
         """
+        from digitz import prefixindex
+
+        if prefixindex.prefix_index is not None:
+            return prefixindex.prefix_index.name_for_number(self, lang)
+
         from phonenumbers.carrier import name_for_number
 
         return name_for_number(self, lang=lang)
 
-    @lru_cache
+    @instrumented("get_country_name")
+    @cache.cached_method
     def get_country_name(self, lang: str) -> str:
         """Returns the country name of the phone number.
 
@@ -362,11 +927,17 @@ class PhoneNumber(pn.PhoneNumber):
         Returns:
             The country name of the phone number.
         """
+        from digitz import prefixindex
+
+        if prefixindex.prefix_index is not None:
+            return prefixindex.prefix_index.country_name_for_number(self, lang)
+
         from phonenumbers.geocoder import country_name_for_number
 
         return country_name_for_number(self, lang=lang)
 
-    @lru_cache
+    @instrumented("get_description")
+    @cache.cached_method
     def get_description(self, lang: str) -> str:
         """Returns the description of the phone number.
 
@@ -376,12 +947,18 @@ class PhoneNumber(pn.PhoneNumber):
         Returns:
             The description of the phone number.
         """
+        from digitz import prefixindex
+
+        if prefixindex.prefix_index is not None:
+            return prefixindex.prefix_index.description_for_number(self, lang)
+
         from phonenumbers.geocoder import description_for_number
 
         return description_for_number(self, lang=lang)
 
     # ~~~ Formatting methods ~~~
-    @lru_cache
+    @instrumented("format")
+    @cache.cached_method
     def format(self, format: PhoneNumberFormat) -> str:
         """Returns the string representation of the phone number in the specified format.
 
@@ -435,6 +1012,16 @@ class PhoneNumber(pn.PhoneNumber):
             self.preferred_domestic_carrier_code,
         )
 
+    def to_bytes(self) -> bytes:
+        """Returns a compact binary encoding of the phone number.
+
+        See `digitz.codec` for the layout and for encoding many phone numbers
+        into one buffer.
+        """
+        from digitz.codec import encode
+
+        return encode(self)
+
     def replace(
         self: Self,
         *,
@@ -0,0 +1,438 @@
+# SPDX-FileCopyrightText: 2023-present Ryan Kroon <rykroon.tech@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""A memory-mapped index of the carrier, geocoder and country name data.
+
+phonenumbers keeps this data in Python dictionaries, which cost hundreds of
+megabytes in every process that uses them. `build_prefix_index()` compiles
+the data into a single binary file once, and `enable_prefix_index()` maps that
+file into memory, so that the processes using it share the same pages of the
+page cache.
+
+The file consists of a header followed by native-endian arrays:
+
+- The offsets of the strings into the string data, followed by the string
+  data itself. The first string is the version of phonenumbers the file was
+  built from, followed by the language codes.
+- For each of the carrier, geocoder and country name sections, the sorted
+  keys, the start of the entries of each key and the language and name string
+  ids of the entries. The entries of a key are sorted by language.
+"""
+from array import array
+from bisect import bisect_left
+import mmap
+import os
+import struct
+import sys
+
+import phonenumbers as pn
+from phonenumbers.prefix import _find_lang
+
+from digitz.enums import PhoneNumberFormat, PhoneNumberType
+from digitz.phonenumbers import PhoneNumber
+
+
+__all__ = [
+    "PrefixIndex",
+    "build_prefix_index",
+    "disable_prefix_index",
+    "enable_prefix_index",
+]
+
+
+MAGIC = b"DGTZIDX1"
+_HEADER = struct.Struct("=8sc7x4Q6Q")
+
+_MOBILE_TYPES = (
+    PhoneNumberType.MOBILE,
+    PhoneNumberType.FIXED_LINE_OR_MOBILE,
+    PhoneNumberType.PAGER,
+)
+
+
+def _prefix_key(prefix: str) -> int:
+    # Prefixes start with a country code, so they never have a leading zero.
+    return int(prefix)
+
+
+def _region_key(region_code: str) -> int:
+    return int.from_bytes(region_code.encode("ascii"), "big")
+
+
+def _pad(size: int) -> int:
+    return -size % 8
+
+
+def build_prefix_index(path: str | os.PathLike[str]) -> None:
+    """Compiles the carrier, geocoder and country name data into an index file.
+
+    The file is specific to the installed version of phonenumbers and to the
+    byte order of the machine, and has to be rebuilt when either changes.
+
+    Parameters:
+        path: The path of the index file to write.
+    """
+    from phonenumbers.carrierdata import CARRIER_DATA, CARRIER_LONGEST_PREFIX
+    from phonenumbers.geodata import GEOCODE_DATA, GEOCODE_LONGEST_PREFIX
+    from phonenumbers.geodata.locale import LOCALE_DATA
+
+    datasets = (
+        (CARRIER_DATA, _prefix_key),
+        (GEOCODE_DATA, _prefix_key),
+        (LOCALE_DATA, _region_key),
+    )
+    langs = sorted({lang for data, _ in datasets for v in data.values() for lang in v})
+
+    strings = [pn.__version__, *langs]
+    string_ids = {string: index for index, string in enumerate(strings)}
+
+    def string_id(string: str) -> int:
+        index = string_ids.get(string)
+        if index is None:
+            index = string_ids[string] = len(strings)
+            strings.append(string)
+        return index
+
+    sections = []
+    for data, key in datasets:
+        keys = []
+        starts = [0]
+        entry_langs = []
+        entry_names = []
+        for item_key, names in sorted((key(k), v) for k, v in data.items()):
+            keys.append(item_key)
+            for lang in sorted(names):
+                entry_langs.append(string_ids[lang])
+                entry_names.append(string_id(names[lang]))
+            starts.append(len(entry_langs))
+        sections.append((keys, starts, entry_langs, entry_names))
+
+    encoded = [string.encode("utf-8") for string in strings]
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+
+    header = _HEADER.pack(
+        MAGIC,
+        sys.byteorder[0].encode("ascii"),
+        len(strings),
+        len(langs),
+        CARRIER_LONGEST_PREFIX,
+        GEOCODE_LONGEST_PREFIX,
+        *(len(section[0]) for section in sections),
+        *(len(section[2]) for section in sections),
+    )
+
+    tmp_path = f"{os.fspath(path)}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(array("Q", offsets).tobytes())
+        f.write(b"".join(encoded))
+        f.write(b"\0" * _pad(offsets[-1]))
+        for keys, starts, entry_langs, entry_names in sections:
+            f.write(array("Q", keys).tobytes())
+            f.write(array("Q", starts).tobytes())
+            for ids in (entry_langs, entry_names):
+                f.write(array("I", ids).tobytes())
+                f.write(b"\0" * _pad(len(ids) * 4))
+    os.replace(tmp_path, path)
+
+
+class _Section:
+    """The entries of one dataset, keyed by prefix or region code."""
+
+    def __init__(
+        self,
+        index: "PrefixIndex",
+        keys: memoryview,
+        starts: memoryview,
+        langs: memoryview,
+        names: memoryview,
+    ) -> None:
+        self._index = index
+        self._keys = keys
+        self._starts = starts
+        self._langs = langs
+        self._names = names
+
+    def _find(self, key: int) -> int | None:
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            return position
+        return None
+
+    def get(self, key: int) -> dict[str, str] | None:
+        """Returns the names of a key by language, or None if the key is absent."""
+        position = self._find(key)
+        if position is None:
+            return None
+        string = self._index._string
+        return {
+            string(self._langs[entry]): string(self._names[entry])
+            for entry in range(self._starts[position], self._starts[position + 1])
+        }
+
+    def get_name(self, key: int, lang: str) -> str:
+        """Returns the name of a key in a language, or an empty string."""
+        position = self._find(key)
+        lang_id = self._index._lang_ids.get(lang)
+        if position is None or lang_id is None:
+            return ""
+        start, end = self._starts[position], self._starts[position + 1]
+        entry = bisect_left(self._langs, lang_id, start, end)
+        if entry < end and self._langs[entry] == lang_id:
+            return self._index._string(self._names[entry])
+        return ""
+
+
+class PrefixIndex:
+    """
+    A memory-mapped index file built with `build_prefix_index()`.
+
+    The lookup methods return the same results as the functions of the same
+    name in `phonenumbers.carrier` and `phonenumbers.geocoder`.
+
+    Parameters:
+        path: The path of the index file.
+
+    Raises:
+        ValueError: If the file is not an index file, or was built for another
+            byte order or version of phonenumbers.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._open()
+        except Exception:
+            self.close()
+            raise
+
+    def _open(self) -> None:
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError("Not a prefix index file.")
+        (
+            magic,
+            byteorder,
+            num_strings,
+            num_langs,
+            self._carrier_longest_prefix,
+            self._geocode_longest_prefix,
+            *counts,
+        ) = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError("Not a prefix index file.")
+        if byteorder != sys.byteorder[0].encode("ascii"):
+            raise ValueError("The prefix index was built for another byte order.")
+
+        self._views: list[memoryview] = []
+        view = memoryview(self._mmap)
+        self._views.append(view)
+        position = _HEADER.size
+
+        def take(count: int, format: str) -> memoryview:
+            nonlocal position
+            size = count * struct.calcsize(format)
+            array = view[position : position + size].cast(format)
+            self._views.append(array)
+            position += size + _pad(size)
+            return array
+
+        self._offsets = take(num_strings + 1, "Q")
+        self._data = take(self._offsets[-1], "B")
+
+        self._carrier, self._geocoder, self._locale = (
+            _Section(
+                self,
+                take(num_keys, "Q"),
+                take(num_keys + 1, "Q"),
+                take(num_entries, "I"),
+                take(num_entries, "I"),
+            )
+            for num_keys, num_entries in zip(counts[:3], counts[3:])
+        )
+
+        version = self._string(0)
+        if version != pn.__version__:
+            raise ValueError(
+                f"The prefix index was built for phonenumbers {version}, "
+                f"rebuild it for phonenumbers {pn.__version__}."
+            )
+        self._lang_ids = {self._string(i): i for i in range(1, num_langs + 1)}
+
+    def _string(self, index: int) -> str:
+        return str(self._data[self._offsets[index] : self._offsets[index + 1]], "utf-8")
+
+    def close(self) -> None:
+        """Closes the index file."""
+        for view in reversed(getattr(self, "_views", ())):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def __enter__(self) -> "PrefixIndex":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    # ~~~ Lookups ~~~
+    def _prefix_description(
+        self,
+        section: _Section,
+        longest_prefix: int,
+        numobj: pn.PhoneNumber,
+        lang: str,
+        script: str | None,
+        region: str | None,
+    ) -> str:
+        # Mirrors phonenumbers.prefix._prefix_description_for_number().
+        digits = _e164(numobj)[1:]
+        for prefix_len in range(longest_prefix, 0, -1):
+            prefix = digits[:prefix_len]
+            names = section.get(_prefix_key(prefix))
+            if names is not None:
+                name = _find_lang(names, lang, script, region)
+                if name is not None:
+                    return name
+        return ""
+
+    def _region_display_name(self, region_code: str | None, lang: str) -> str:
+        if region_code is None:
+            return ""
+        key = _region_key(region_code)
+        name = self._locale.get_name(key, lang)
+        if name.startswith("*"):
+            name = self._locale.get_name(key, name[1:])
+        return name
+
+    def name_for_number(
+        self,
+        numobj: pn.PhoneNumber,
+        lang: str,
+        script: str | None = None,
+        region: str | None = None,
+    ) -> str:
+        """Returns the carrier name of a phone number, or an empty string.
+
+        Parameters:
+            numobj: The phone number.
+            lang: The language to use.
+            script: The script to use.
+            region: The region of the user.
+        """
+        if _number_type(numobj) not in _MOBILE_TYPES:
+            return ""
+        return self._prefix_description(
+            self._carrier, self._carrier_longest_prefix, numobj, lang, script, region
+        )
+
+    def country_name_for_number(
+        self,
+        numobj: pn.PhoneNumber,
+        lang: str,
+        script: str | None = None,
+        region: str | None = None,
+    ) -> str:
+        """Returns the name of the country of a phone number, or an empty string.
+
+        Parameters:
+            numobj: The phone number.
+            lang: The language to use.
+            script: The script to use.
+            region: The region of the user.
+        """
+        region_codes = pn.region_codes_for_country_code(numobj.country_code)
+        if len(region_codes) == 1:
+            return self._region_display_name(region_codes[0], lang)
+
+        region_where_number_is_valid = "ZZ"
+        for region_code in region_codes:
+            if pn.is_valid_number_for_region(numobj, region_code):
+                if region_where_number_is_valid != "ZZ":
+                    return ""
+                region_where_number_is_valid = region_code
+        return self._region_display_name(region_where_number_is_valid, lang)
+
+    def description_for_number(
+        self,
+        numobj: pn.PhoneNumber,
+        lang: str,
+        script: str | None = None,
+        region: str | None = None,
+    ) -> str:
+        """Returns the description of a phone number, or an empty string.
+
+        Parameters:
+            numobj: The phone number.
+            lang: The language to use.
+            script: The script to use.
+            region: The region of the user.
+        """
+        number_type = _number_type(numobj)
+        if number_type == PhoneNumberType.UNKNOWN:
+            return ""
+        if not pn.is_number_type_geographical(number_type, numobj.country_code):
+            return self.country_name_for_number(numobj, lang, script, region)
+
+        # Mirrors phonenumbers.geocoder.description_for_valid_number().
+        number_region = pn.region_code_for_number(numobj)
+        if region is not None and region != number_region:
+            return self._region_display_name(number_region, lang)
+
+        mobile_token = pn.country_mobile_token(numobj.country_code)
+        national_number = pn.national_significant_number(numobj)
+        if mobile_token != "" and national_number.startswith(mobile_token):
+            national_number = national_number[len(mobile_token) :]
+            region = pn.region_code_for_country_code(numobj.country_code)
+            try:
+                numobj = pn.parse(national_number, region)
+            except pn.NumberParseException:
+                pass
+
+        area_description = self._prefix_description(
+            self._geocoder, self._geocode_longest_prefix, numobj, lang, script, region
+        )
+        if area_description != "":
+            return area_description
+        return self.country_name_for_number(numobj, lang, script, region)
+
+
+def _number_type(numobj: pn.PhoneNumber) -> int:
+    if isinstance(numobj, PhoneNumber):
+        return numobj.number_type
+    return pn.number_type(numobj)
+
+
+def _e164(numobj: pn.PhoneNumber) -> str:
+    if isinstance(numobj, PhoneNumber):
+        return numobj.to_e164()
+    return pn.format_number(numobj, PhoneNumberFormat.E164)
+
+
+prefix_index: PrefixIndex | None = None
+
+
+def enable_prefix_index(path: str | os.PathLike[str]) -> PrefixIndex:
+    """Uses an index file for the carrier names, country names and descriptions
+    of phone numbers, instead of the data of phonenumbers.
+
+    Enable it before forking worker processes so that they share the mapping.
+    A previously enabled index is closed once it is no longer referenced.
+
+    Parameters:
+        path: The path of an index file built with `build_prefix_index()`.
+
+    Returns:
+        The opened index.
+    """
+    global prefix_index
+    prefix_index = PrefixIndex(path)
+    return prefix_index
+
+
+def disable_prefix_index() -> None:
+    """Goes back to using the data of phonenumbers."""
+    global prefix_index
+    prefix_index = None
@@ -0,0 +1,287 @@
+# SPDX-FileCopyrightText: 2023-present Ryan Kroon <rykroon.tech@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+from dataclasses import dataclass
+import gc
+import os
+import time
+from typing import Callable, Iterable
+
+import phonenumbers as pn
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from digitz.enums import PhoneNumberType
+
+
+__all__ = ["WarmupReport", "WarmupStep", "preload_for_fork", "warmup"]
+
+
+@dataclass(frozen=True)
+class WarmupStep:
+    """
+    A dataclass representing a step of a warm-up.
+
+    Parameters:
+        name: The name of the step.
+        seconds: The time the step took, in seconds.
+        memory: The growth of the resident set size during the step, in bytes,
+            or None if it cannot be measured on this platform.
+    """
+
+    name: str
+    seconds: float
+    memory: int | None
+
+
+@dataclass(frozen=True)
+class WarmupReport:
+    """
+    A dataclass representing the result of a warm-up.
+
+    Parameters:
+        steps: The steps of the warm-up, in the order they ran.
+    """
+
+    steps: tuple[WarmupStep, ...]
+
+    @property
+    def seconds(self) -> float:
+        """Returns the total time of the warm-up, in seconds."""
+        return sum(step.seconds for step in self.steps)
+
+    @property
+    def memory(self) -> int | None:
+        """Returns the total growth of the resident set size, in bytes."""
+        if any(step.memory is None for step in self.steps):
+            return None
+        return sum(step.memory or 0 for step in self.steps)
+
+
+def _example_numbers(regions: Iterable[str]) -> list[pn.PhoneNumber]:
+    numbers = []
+    for region in regions:
+        for number_type in (PhoneNumberType.FIXED_LINE, PhoneNumberType.MOBILE):
+            numobj = pn.example_number_for_type(region, number_type)
+            if numobj is not None:
+                numbers.append(numobj)
+    return numbers
+
+
+def _supported_regions(regions: Iterable[str] | None) -> list[str]:
+    if regions is None:
+        return sorted(pn.SUPPORTED_REGIONS)
+    return [region for region in regions if region in pn.SUPPORTED_REGIONS]
+
+
+def _warmup_regions(regions: list[str], include_non_geo: bool) -> list[pn.PhoneNumber]:
+    # Exercising example numbers also compiles the patterns of the metadata.
+    numbers = _example_numbers(regions)
+    for numobj in numbers:
+        pn.is_valid_number(numobj)
+        pn.number_type(numobj)
+        pn.format_number(numobj, pn.PhoneNumberFormat.INTERNATIONAL)
+
+    if include_non_geo:
+        for country_code in pn.COUNTRY_CODES_FOR_NON_GEO_REGIONS:
+            numobj = pn.example_number_for_non_geo_entity(country_code)
+            if numobj is not None:
+                pn.is_valid_number(numobj)
+
+    return numbers
+
+
+def _warmup_carrier(numbers: list[pn.PhoneNumber], langs: list[str]) -> None:
+    from phonenumbers.carrier import name_for_number
+
+    for numobj in numbers:
+        for lang in langs:
+            name_for_number(numobj, lang=lang)
+
+
+def _warmup_geocoder(numbers: list[pn.PhoneNumber], langs: list[str]) -> None:
+    from phonenumbers.geocoder import description_for_number
+
+    for numobj in numbers:
+        for lang in langs:
+            description_for_number(numobj, lang=lang)
+
+
+def _warmup_timezones(regions: list[str]) -> None:
+    from phonenumbers.timezone import TIMEZONE_DATA
+
+    country_codes = tuple(str(pn.country_code_for_region(region)) for region in regions)
+    zones = {
+        zone
+        for prefix, prefix_zones in TIMEZONE_DATA.items()
+        if prefix.startswith(country_codes)
+        for zone in prefix_zones
+    }
+    for zone in zones:
+        try:
+            ZoneInfo(zone)
+        except ZoneInfoNotFoundError:
+            pass
+
+
+def _build_indexes(regions: list[str], include_non_geo: bool) -> None:
+    from digitz.classifier import _classifier, _metadata_for_country_code
+    from digitz.phonenumbers import _MAX_LENGTH_FOR_NSN, _national_prefix_pattern
+
+    country_codes = {pn.country_code_for_region(region) for region in regions}
+    if include_non_geo:
+        country_codes.update(pn.COUNTRY_CODES_FOR_NON_GEO_REGIONS)
+    country_codes.discard(0)
+
+    for country_code in sorted(country_codes):
+        _national_prefix_pattern(country_code)
+        country_metadata = _metadata_for_country_code(country_code)
+        if country_metadata is None:
+            continue
+        for _, metadata, _ in country_metadata[0]:
+            if metadata is not None:
+                _classifier(metadata).compile_all(_MAX_LENGTH_FOR_NSN)
+
+
+def _build_timezone_index(regions: list[str], include_non_geo: bool) -> None:
+    from digitz.timezones import _index
+
+    if include_non_geo:
+        _index().resolve_all()
+    else:
+        country_codes = {pn.country_code_for_region(region) for region in regions}
+        _index().resolve_all(tuple(str(code) for code in country_codes))
+
+
+def _freeze() -> None:
+    gc.collect()
+    gc.freeze()
+
+
+def _resident_set_size() -> int | None:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _run_step(name: str, func: Callable[[], None]) -> WarmupStep:
+    rss_before = _resident_set_size()
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    rss_after = _resident_set_size()
+    if rss_before is None or rss_after is None:
+        return WarmupStep(name, seconds, None)
+    return WarmupStep(name, seconds, rss_after - rss_before)
+
+
+def warmup(
+    regions: Iterable[str] | None = None,
+    *,
+    carrier: bool = True,
+    geocoder: bool = True,
+    timezones: bool = True,
+    langs: Iterable[str] = ("en",),
+) -> WarmupReport:
+    """Loads phone number metadata ahead of time.
+
+    phonenumbers loads the metadata of a region the first time it is needed,
+    and the carrier, geocoder and timezone data the first time they are used.
+    Calling this function, e.g. before forking worker processes or in a
+    readiness probe, moves that cost out of the first requests.
+
+    Region codes are taken as given, like `PhoneNumber.parse()` and
+    `digitz.Parser` do, so codes that are not in `phonenumbers.SUPPORTED_REGIONS`,
+    such as "gb", have no metadata to load and are skipped.
+
+    Parameters:
+        regions: The region codes to load the metadata of, or None for all regions.
+        carrier: Whether to load the carrier data.
+        geocoder: Whether to load the geocoder data.
+        timezones: Whether to load the timezone data.
+        langs: The languages to look up carrier names and descriptions in.
+
+    Returns:
+        A report of how long each step took and how much memory it added.
+    """
+    region_list = _supported_regions(regions)
+    lang_list = list(langs)
+
+    # The example numbers of the regions are used to exercise the other data.
+    numbers: list[pn.PhoneNumber] = []
+    steps = [
+        _run_step(
+            "regions",
+            lambda: numbers.extend(_warmup_regions(region_list, regions is None)),
+        )
+    ]
+    if carrier:
+        steps.append(_run_step("carrier", lambda: _warmup_carrier(numbers, lang_list)))
+    if geocoder:
+        steps.append(
+            _run_step("geocoder", lambda: _warmup_geocoder(numbers, lang_list))
+        )
+    if timezones:
+        steps.append(_run_step("timezones", lambda: _warmup_timezones(region_list)))
+
+    return WarmupReport(tuple(steps))
+
+
+def preload_for_fork(
+    regions: Iterable[str] | None = None,
+    *,
+    carrier: bool = True,
+    geocoder: bool = True,
+    timezones: bool = True,
+    langs: Iterable[str] = ("en",),
+) -> WarmupReport:
+    """Prepares the parent of a pre-fork server to share phone number data with its workers.
+
+    In addition to the warm-up of `warmup()`, this builds the internal indexes
+    of digitz, i.e. the classifier of number types of each region and length
+    and the timezone index, and then moves every object allocated so far into
+    the permanent generation with `gc.freeze()`. The garbage collector of a
+    worker process then never touches these objects, so the memory pages
+    holding them stay shared copy-on-write with the parent instead of being
+    copied into every worker by its first collection. Reference count updates
+    still copy the pages of the objects a worker uses.
+
+    Call it in the parent process right before forking the workers. The
+    objects stay frozen until `gc.unfreeze()` is called.
+
+    Region codes are taken as given, like in `warmup()`.
+
+    Parameters:
+        regions: The region codes to load the metadata of, or None for all regions.
+        carrier: Whether to load the carrier data.
+        geocoder: Whether to load the geocoder data.
+        timezones: Whether to load the timezone data and build the timezone index.
+        langs: The languages to look up carrier names and descriptions in.
+
+    Returns:
+        A report of how long each step took and how much memory it added.
+    """
+    region_list = _supported_regions(regions)
+    report = warmup(
+        None if regions is None else region_list,
+        carrier=carrier,
+        geocoder=geocoder,
+        timezones=timezones,
+        langs=langs,
+    )
+    include_non_geo = regions is None
+
+    steps = [
+        *report.steps,
+        _run_step("indexes", lambda: _build_indexes(region_list, include_non_geo)),
+    ]
+    if timezones:
+        steps.append(
+            _run_step(
+                "timezone index",
+                lambda: _build_timezone_index(region_list, include_non_geo),
+            )
+        )
+    steps.append(_run_step("freeze", _freeze))
+    return WarmupReport(tuple(steps))
@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: 2023-present Ryan Kroon <rykroon.tech@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""Timezone lookups backed by a prefix index built once from the timezone data.
+
+Phone numbers with the same timezones share the same tuple of `ZoneInfo`
+objects, so enriching many phone numbers does not create a tuple per number.
+"""
+from functools import cache
+from threading import Lock
+from typing import Iterable
+
+import phonenumbers as pn
+from zoneinfo import ZoneInfo
+
+from digitz.enums import PhoneNumberFormat, PhoneNumberType
+from digitz.phonenumbers import PhoneNumber
+
+
+__all__ = ["timezones_for", "timezones_for_number"]
+
+
+class _TimezoneIndex:
+    """A longest-prefix-match index from E.164 digits to shared ZoneInfo tuples."""
+
+    def __init__(self, data: dict[str, tuple[str, ...]]) -> None:
+        self._names = data
+        # Only the prefix lengths that occur in the data are tried, longest first.
+        self._lengths = tuple(sorted({len(prefix) for prefix in data}, reverse=True))
+        self._zones: dict[str, tuple[ZoneInfo, ...]] = {}
+        self._interned: dict[tuple[str, ...], tuple[ZoneInfo, ...]] = {}
+        self._lock = Lock()
+
+    def _resolve(self, prefix: str) -> tuple[ZoneInfo, ...]:
+        names = self._names[prefix]
+        with self._lock:
+            zones = self._interned.get(names)
+            if zones is None:
+                zones = tuple([ZoneInfo(name) for name in names])
+                self._interned[names] = zones
+            self._zones[prefix] = zones
+        return zones
+
+    def resolve_all(self, prefixes: tuple[str, ...] = ("",)) -> None:
+        """Resolves the timezones of every prefix that starts with one of prefixes."""
+        for prefix in self._names:
+            if prefix.startswith(prefixes) and prefix not in self._zones:
+                self._resolve(prefix)
+
+    def lookup(self, digits: str) -> tuple[ZoneInfo, ...]:
+        """Returns the timezones of the longest prefix of digits, if any."""
+        for length in self._lengths:
+            prefix = digits[:length]
+            zones = self._zones.get(prefix)
+            if zones is not None:
+                return zones
+            if prefix in self._names:
+                return self._resolve(prefix)
+        return ()
+
+
+@cache
+def _index() -> _TimezoneIndex:
+    from phonenumbers.timezone import TIMEZONE_DATA
+
+    return _TimezoneIndex(TIMEZONE_DATA)
+
+
+def _timezones(number_type: int, country_code: int, e164: str) -> tuple[ZoneInfo, ...]:
+    # Mirrors phonenumbers.timezone.time_zones_for_number().
+    if number_type == PhoneNumberType.UNKNOWN:
+        return ()
+    if not pn.is_number_type_geographical(number_type, country_code):
+        return _index().lookup(str(country_code))
+    return _index().lookup(e164[1:])
+
+
+def timezones_for_number(number: pn.PhoneNumber, /) -> tuple[ZoneInfo, ...]:
+    """Returns the timezones of a phone number.
+
+    Parameters:
+        number: The phone number.
+
+    Returns:
+        The timezones of the phone number, or an empty tuple if they are unknown.
+    """
+    if isinstance(number, PhoneNumber):
+        return number.timezones
+    return _timezones(
+        pn.number_type(number),
+        number.country_code,
+        pn.format_number(number, PhoneNumberFormat.E164),
+    )
+
+
+def timezones_for(numbers: Iterable[pn.PhoneNumber], /) -> list[tuple[ZoneInfo, ...]]:
+    """Returns the timezones of many phone numbers, in input order.
+
+    Phone numbers that occur more than once are only looked up once.
+
+    Parameters:
+        numbers: The phone numbers.
+
+    Returns:
+        A list with the timezones of each phone number.
+    """
+    seen: dict[tuple, tuple[ZoneInfo, ...]] = {}
+    results = []
+    for number in numbers:
+        key = (
+            number.country_code,
+            number.national_number,
+            number.italian_leading_zero,
+            number.number_of_leading_zeros,
+        )
+        zones = seen.get(key)
+        if zones is None:
+            zones = seen[key] = timezones_for_number(number)
+        results.append(zones)
+    return results
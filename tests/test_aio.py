@@ -0,0 +1,122 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from typing import AsyncIterator, Iterator
+
+import phonenumbers as pn
+import pytest
+
+from digitz import NumberParseErrorType, ParseFailure, PhoneNumber, aio
+from .utils import USA_EXAMPLE_NUMBER, create_number_list
+
+PHONE_NUMBERS = create_number_list(regions=["US", "CA", "MX", "IT", "GB"])
+
+
+@pytest.fixture
+def executor() -> Iterator[ThreadPoolExecutor]:
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        aio.set_executor(executor)
+        yield executor
+    aio.set_executor(None)
+
+
+def test_parse(executor: ThreadPoolExecutor) -> None:
+    num = asyncio.run(aio.parse(USA_EXAMPLE_NUMBER))
+    assert num == PhoneNumber.parse(USA_EXAMPLE_NUMBER)
+
+
+def test_parse_error() -> None:
+    with pytest.raises(pn.NumberParseException) as exc_info:
+        asyncio.run(aio.parse("foo"))
+    assert exc_info.value.error_type == NumberParseErrorType.NOT_A_NUMBER
+
+
+def test_parse_coalesces_identical_calls(
+    executor: ThreadPoolExecutor, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = []
+    release = threading.Event()
+    parse = PhoneNumber.parse
+
+    def slow_parse(*args, **kwargs):  # type: ignore[no-untyped-def]
+        calls.append(args)
+        release.wait(timeout=5)
+        return parse(*args, **kwargs)
+
+    monkeypatch.setattr(PhoneNumber, "parse", slow_parse)
+
+    async def main() -> list[PhoneNumber]:
+        tasks = [asyncio.create_task(aio.parse(USA_EXAMPLE_NUMBER)) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_parse_many() -> None:
+    results = asyncio.run(aio.parse_many(["foo", *PHONE_NUMBERS], errors="collect"))
+    assert isinstance(results[0], ParseFailure)
+    assert results[1:] == [PhoneNumber.parse(number) for number in PHONE_NUMBERS]
+
+
+def test_parse_batches() -> None:
+    async def main() -> list[list]:
+        batches = aio.parse_batches(PHONE_NUMBERS, batch_size=2)
+        return [batch async for batch in batches]
+
+    batches = asyncio.run(main())
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert sum(batches, []) == [PhoneNumber.parse(number) for number in PHONE_NUMBERS]
+
+
+def test_parse_batches_async_iterable() -> None:
+    async def numbers() -> AsyncIterator[str]:
+        for number in PHONE_NUMBERS:
+            yield number
+
+    async def main() -> list[list]:
+        batches = aio.parse_batches(numbers(), batch_size=3)
+        return [batch async for batch in batches]
+
+    batches = asyncio.run(main())
+    assert [len(batch) for batch in batches] == [3, 2]
+
+
+def test_parse_batches_invalid_batch_size() -> None:
+    async def main() -> None:
+        async for _ in aio.parse_batches(PHONE_NUMBERS, batch_size=0):
+            pass  # pragma: no cover
+
+    with pytest.raises(ValueError):
+        asyncio.run(main())
+
+
+@pytest.mark.parametrize("phonenumber", PHONE_NUMBERS)
+def test_enrichment(phonenumber: str) -> None:
+    num = PhoneNumber.parse(phonenumber)
+
+    async def main() -> tuple:
+        results = await asyncio.gather(
+            aio.timezones(num),
+            aio.get_carrier_name(num, lang="en"),
+            aio.get_country_name(num, lang="en"),
+            aio.get_description(num, lang="en"),
+        )
+        return tuple(results)
+
+    assert asyncio.run(main()) == (
+        num.timezones,
+        num.get_carrier_name(lang="en"),
+        num.get_country_name(lang="en"),
+        num.get_description(lang="en"),
+    )
+
+
+def test_enrichment_shares_the_method_cache() -> None:
+    num = PhoneNumber.parse(USA_EXAMPLE_NUMBER)
+    num.get_country_name("en")
+    asyncio.run(aio.get_country_name(num, lang="en"))
+    assert list(num.__dict__["_method_cache"]) == [("get_country_name", "en")]
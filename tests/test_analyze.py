@@ -0,0 +1,81 @@
+import phonenumbers as pn
+import pytest
+
+from digitz import NumberInfo, PhoneNumber
+from digitz.enums import PhoneNumberType, ValidationResult
+
+
+def _numbers() -> list[PhoneNumber]:
+    numbers = []
+    for region in sorted(pn.SUPPORTED_REGIONS):
+        for number_type in PhoneNumberType:
+            numobj = pn.example_number_for_type(region, number_type)
+            if numobj is not None:
+                numbers.append(PhoneNumber._from_numobj(numobj))
+        numobj = pn.invalid_example_number(region)
+        if numobj is not None:
+            numbers.append(PhoneNumber._from_numobj(numobj))
+    for country_code in sorted(pn.COUNTRY_CODES_FOR_NON_GEO_REGIONS):
+        numobj = pn.example_number_for_non_geo_entity(country_code)
+        if numobj is not None:
+            numbers.append(PhoneNumber._from_numobj(numobj))
+    numbers += [
+        PhoneNumber.parse("+12015550123 ext. 1234"),
+        PhoneNumber.parse("+390612345678"),
+        PhoneNumber.parse("+5491187654321"),
+        PhoneNumber._from_fields(1, 12),
+        PhoneNumber._from_fields(1, 123456789012345),
+        PhoneNumber._from_fields(999, 12345678),
+    ]
+    return numbers
+
+
+NUMBERS = _numbers()
+
+
+@pytest.mark.parametrize("number", NUMBERS, ids=str)
+def test_same_as_phonenumbers(number: PhoneNumber) -> None:
+    numobj = pn.PhoneNumber()
+    numobj.merge_from(number)
+    region_code = pn.region_code_for_number(numobj)
+
+    assert number.analyze() == NumberInfo(
+        region_code=region_code,
+        is_valid=pn.is_valid_number_for_region(numobj, region_code),
+        number_type=PhoneNumberType(pn.number_type(numobj)),
+        is_possible=pn.is_possible_number(numobj),
+        validation_result=ValidationResult(pn.is_possible_number_with_reason(numobj)),
+        national_destination_code_length=pn.length_of_national_destination_code(numobj),
+        national_significant_number=pn.national_significant_number(numobj),
+    )
+
+
+def test_fills_cached_properties() -> None:
+    number = PhoneNumber.parse("+12015550123")
+    info = number.analyze()
+    assert number.analyze() is info
+
+    for name in (
+        "region_code",
+        "is_valid",
+        "number_type",
+        "is_possible",
+        "national_destination_code_length",
+        "national_significant_number",
+    ):
+        assert name in number.__dict__
+        assert getattr(number, name) == getattr(info, name)
+
+
+def test_analyze_many() -> None:
+    numbers = [
+        PhoneNumber.parse("+12015550123"),
+        PhoneNumber.parse("+442083661177"),
+        PhoneNumber.parse("+12015550123"),
+    ]
+    numobj = pn.parse("+442083661177")
+
+    results = PhoneNumber.analyze_many([*numbers, numobj])
+    assert results == [number.analyze() for number in numbers] + [results[1]]
+    assert results[0] is results[2]
+    assert "number_type" in numbers[2].__dict__
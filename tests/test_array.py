@@ -0,0 +1,145 @@
+import phonenumbers as pn
+from phonenumbers import PhoneNumberType as PT
+import pytest
+
+from digitz import PhoneNumber
+from .utils import create_number_list
+
+np = pytest.importorskip("numpy")
+
+from digitz.array import PhoneNumberArray  # noqa: E402
+
+REGIONS = ["US", "CA", "MX", "IT", "GB", "GG", "JE", "RU", "KZ"]
+PHONE_NUMBERS = (
+    create_number_list(REGIONS)
+    + create_number_list(REGIONS, PT.MOBILE)
+    + create_number_list(REGIONS, PT.TOLL_FREE)
+    + create_number_list(REGIONS, PT.UNKNOWN)
+)
+NUMBERS = [PhoneNumber.parse(number) for number in PHONE_NUMBERS] + [
+    PhoneNumber.parse("+390612345678 ext. 123"),
+    PhoneNumber(
+        country_code=39,
+        national_number=12345,
+        italian_leading_zero=True,
+        number_of_leading_zeros=3,
+    ),
+]
+
+
+@pytest.fixture
+def array() -> PhoneNumberArray:
+    return PhoneNumberArray.from_phone_numbers(NUMBERS)
+
+
+def test_round_trip(array: PhoneNumberArray) -> None:
+    assert len(array) == len(NUMBERS)
+    assert array.to_phone_numbers() == NUMBERS
+    assert array[0] == NUMBERS[0]
+    assert array[-1] == NUMBERS[-1]
+
+
+def test_to_e164(array: PhoneNumberArray) -> None:
+    assert array.to_e164().tolist() == [num.to_e164() for num in NUMBERS]
+
+
+def test_national_significant_number(array: PhoneNumberArray) -> None:
+    assert array.nsn().tolist() == [num.nsn for num in NUMBERS]
+
+
+def test_national_destination_code(array: PhoneNumberArray) -> None:
+    assert array.ndc().tolist() == [num.ndc for num in NUMBERS]
+
+
+def test_region_code(array: PhoneNumberArray) -> None:
+    assert array.region_code().tolist() == [num.region_code for num in NUMBERS]
+
+
+def test_is_possible(array: PhoneNumberArray) -> None:
+    assert array.is_possible().tolist() == [num.is_possible for num in NUMBERS]
+
+
+def test_number_type(array: PhoneNumberArray) -> None:
+    assert array.number_type().tolist() == [num.number_type for num in NUMBERS]
+
+
+def test_boolean_mask(array: PhoneNumberArray) -> None:
+    mask = array.country_code == 44
+    assert array[mask].to_phone_numbers() == [
+        num for num in NUMBERS if num.country_code == 44
+    ]
+
+
+def test_groupby_country_code(array: PhoneNumberArray) -> None:
+    groups = dict(array.groupby_country_code())
+    assert sorted(groups) == sorted({num.country_code for num in NUMBERS})
+    for country_code, group in groups.items():
+        assert group.to_phone_numbers() == [
+            num for num in NUMBERS if num.country_code == country_code
+        ]
+
+
+def test_empty() -> None:
+    array = PhoneNumberArray.from_phone_numbers([])
+    assert len(array) == 0
+    assert array.number_type().tolist() == []
+    assert array.region_code().tolist() == []
+
+
+def test_index_out_of_range(array: PhoneNumberArray) -> None:
+    with pytest.raises(IndexError):
+        array[len(array)]
+
+
+def test_mismatched_columns() -> None:
+    with pytest.raises(ValueError):
+        PhoneNumberArray([1, 44], [2015550123])
+
+
+@pytest.mark.parametrize("number_of_leading_zeros", [None, 0, 1, 2])
+def test_from_phone_numbers_same_as_from_bytes(
+    number_of_leading_zeros: int | None,
+) -> None:
+    from digitz.codec import encode_many
+
+    numbers = NUMBERS + [
+        PhoneNumber(
+            country_code=39,
+            national_number=612345678,
+            italian_leading_zero=True,
+            number_of_leading_zeros=number_of_leading_zeros,
+        )
+    ]
+    array = PhoneNumberArray.from_phone_numbers(numbers)
+    expected = PhoneNumberArray.from_bytes(encode_many(numbers))
+    assert array.leading_zeros.tolist() == expected.leading_zeros.tolist()
+    assert array.to_e164().tolist() == expected.to_e164().tolist()
+
+
+def test_is_possible_long_national_significant_number() -> None:
+    # 11 digits and 255 leading zeros, which must not be confused with the
+    # 10 digits of the first phone number.
+    array = PhoneNumberArray([1, 0], [2015550123, 12345678901], [0, 255])
+    assert array.is_possible().tolist() == [True, False]
+
+
+def test_leading_zeros_round_trip() -> None:
+    def number(italian_leading_zero: bool, number_of_leading_zeros: int | None):
+        return PhoneNumber(
+            country_code=39,
+            national_number=612345678,
+            italian_leading_zero=italian_leading_zero,
+            number_of_leading_zeros=number_of_leading_zeros,
+        )
+
+    # Phone numbers are restored exactly when their leading zeros are normalized.
+    exact = [number(False, None), number(True, None), number(True, 2)]
+    assert PhoneNumberArray.from_phone_numbers(exact).to_phone_numbers() == exact
+
+    # Otherwise they are restored with the same national significant number.
+    numbers = [number(True, 1), number(True, 0), number(False, 3)]
+    restored = PhoneNumberArray.from_phone_numbers(numbers).to_phone_numbers()
+    assert restored == [number(True, None), number(False, None), number(False, None)]
+    assert [num.nsn for num in restored] == [
+        pn.national_significant_number(num) for num in numbers
+    ]
@@ -0,0 +1,151 @@
+import time
+
+import phonenumbers as pn
+import pytest
+
+from digitz import NumberParseErrorType, PhoneNumber
+from digitz import cache
+from digitz.cache import ParseCache
+from .utils import USA_EXAMPLE_NUMBER
+
+
+@pytest.fixture
+def parse_cache():
+    cache.enable_parse_cache(maxsize=2)
+    yield cache.parse_cache
+    cache.disable_parse_cache()
+
+
+def test_disabled_by_default() -> None:
+    assert cache.parse_cache is None
+    assert cache.parse_cache_info() is None
+
+
+def test_hit_returns_shared_instance(parse_cache: ParseCache) -> None:
+    num1 = PhoneNumber.parse(USA_EXAMPLE_NUMBER)
+    num2 = PhoneNumber.parse(USA_EXAMPLE_NUMBER)
+    assert num1 is num2
+
+    info = cache.parse_cache_info()
+    assert info is not None
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_key_includes_region_and_raw_input(parse_cache: ParseCache) -> None:
+    num1 = PhoneNumber.parse(USA_EXAMPLE_NUMBER)
+    num2 = PhoneNumber.parse(USA_EXAMPLE_NUMBER, keep_raw_input=True)
+    assert num1 is not num2
+    assert num2.raw_input == USA_EXAMPLE_NUMBER
+
+
+def test_cached_failure(parse_cache: ParseCache) -> None:
+    for _ in range(2):
+        with pytest.raises(pn.NumberParseException) as exc_info:
+            PhoneNumber.parse("foo")
+        assert exc_info.value.error_type == NumberParseErrorType.NOT_A_NUMBER
+
+    assert parse_cache.hits == 1
+
+
+def test_eviction(parse_cache: ParseCache) -> None:
+    PhoneNumber.parse("+12015550123")
+    PhoneNumber.parse("+12015550124")
+    PhoneNumber.parse("+12015550123")
+    PhoneNumber.parse("+12015550125")
+
+    info = parse_cache.info()
+    assert info.evictions == 1
+    assert info.currsize == 2
+
+    # The least recently used entry was evicted.
+    PhoneNumber.parse("+12015550124")
+    assert parse_cache.info().misses == 4
+
+
+def test_ttl() -> None:
+    parse_cache = ParseCache(ttl=0.01)
+    parse_cache.put("key", "value")
+    assert parse_cache.get("key") == "value"
+    time.sleep(0.02)
+    assert parse_cache.get("key") is None
+    assert parse_cache.info() == (1, 1, 1, 4096, 0)
+
+
+def test_clear(parse_cache: ParseCache) -> None:
+    PhoneNumber.parse(USA_EXAMPLE_NUMBER)
+    cache.clear_parse_cache()
+    assert parse_cache.info() == (0, 0, 0, 2, 0)
+
+
+@pytest.mark.parametrize("kwargs", [{"maxsize": 0}, {"ttl": 0}])
+def test_invalid_arguments(kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        ParseCache(**kwargs)
+
+
+@pytest.fixture
+def method_cache():
+    yield
+    cache.configure_method_cache(enabled=True, maxsize=32)
+
+
+def test_cached_method_is_instance_local(method_cache: None) -> None:
+    num = PhoneNumber.parse(USA_EXAMPLE_NUMBER)
+    assert num.to_e164() is num.to_e164()
+    assert num.get_country_name(lang="en") is num.get_country_name(lang="en")
+    assert len(num.__dict__["_method_cache"]) == 2
+
+    other = PhoneNumber.parse(USA_EXAMPLE_NUMBER)
+    assert "_method_cache" not in other.__dict__
+
+    cache.clear_method_cache(num)
+    assert "_method_cache" not in num.__dict__
+
+
+def test_cached_method_maxsize(method_cache: None) -> None:
+    cache.configure_method_cache(maxsize=2)
+    num = PhoneNumber.parse(USA_EXAMPLE_NUMBER)
+    num.to_e164()
+    num.to_national()
+    num.to_international()
+    assert len(num.__dict__["_method_cache"]) == 2
+
+
+def test_cached_method_disabled(method_cache: None) -> None:
+    cache.configure_method_cache(enabled=False)
+    num = PhoneNumber.parse(USA_EXAMPLE_NUMBER)
+    assert num.to_e164() == "+12015550123"
+    assert "_method_cache" not in num.__dict__
+
+
+def test_cached_method_does_not_affect_equality(method_cache: None) -> None:
+    num1 = PhoneNumber.parse(USA_EXAMPLE_NUMBER)
+    num2 = PhoneNumber.parse(USA_EXAMPLE_NUMBER)
+    num1.to_e164()
+    assert num1 == num2
+    assert hash(num1) == hash(num2)
+
+
+def test_configure_method_cache_invalid_maxsize() -> None:
+    with pytest.raises(ValueError):
+        cache.configure_method_cache(maxsize=0)
+
+
+def test_cached_method_normalizes_arguments(method_cache: None) -> None:
+    class Greeter:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        @cache.cached_method
+        def greet(self, lang: str = "en") -> str:
+            self.calls += 1
+            return f"hello ({lang})"
+
+    greeter = Greeter()
+    assert greeter.greet("en") == greeter.greet(lang="en") == greeter.greet()
+    assert greeter.calls == 1
+    assert list(greeter.__dict__["_method_cache"]) == [("greet", "en")]
+
+    num = PhoneNumber.parse(USA_EXAMPLE_NUMBER)
+    assert num.get_country_name("en") is num.get_country_name(lang="en")
+    assert len(num.__dict__["_method_cache"]) == 1
@@ -0,0 +1,81 @@
+import random
+
+import phonenumbers as pn
+import pytest
+
+from digitz import PhoneNumber
+from digitz.classifier import number_type
+from digitz.enums import PhoneNumberType
+
+
+def _example_numbers() -> list[pn.PhoneNumber]:
+    numbers = []
+    for region in sorted(pn.SUPPORTED_REGIONS):
+        for numtype in PhoneNumberType:
+            numobj = pn.example_number_for_type(region, numtype)
+            if numobj is not None:
+                numbers.append(numobj)
+    for country_code in sorted(pn.COUNTRY_CODES_FOR_NON_GEO_REGIONS):
+        numobj = pn.example_number_for_non_geo_entity(country_code)
+        if numobj is not None:
+            numbers.append(numobj)
+    return numbers
+
+
+def _fuzz_numbers(examples: list[pn.PhoneNumber], size: int) -> list[pn.PhoneNumber]:
+    """Mutates the digits and lengths of the example numbers at random."""
+    rng = random.Random(0)
+    numbers = []
+    for _ in range(size):
+        example = rng.choice(examples)
+        digits = list(str(example.national_number))
+        for _ in range(rng.randint(1, 3)):
+            mutation = rng.randrange(3)
+            position = rng.randrange(len(digits))
+            if mutation == 0:
+                digits[position] = rng.choice("0123456789")
+            elif mutation == 1 and len(digits) < 17:
+                digits.insert(position, rng.choice("0123456789"))
+            elif len(digits) > 2:
+                del digits[position]
+        numbers.append(
+            pn.PhoneNumber(
+                country_code=example.country_code,
+                national_number=int("".join(digits)),
+                italian_leading_zero=example.italian_leading_zero,
+                number_of_leading_zeros=example.number_of_leading_zeros,
+            )
+        )
+    return numbers
+
+
+EXAMPLE_NUMBERS = _example_numbers()
+FUZZ_NUMBERS = _fuzz_numbers(EXAMPLE_NUMBERS, 5_000)
+
+
+@pytest.mark.parametrize(
+    "numbers", [EXAMPLE_NUMBERS, FUZZ_NUMBERS], ids=["examples", "fuzz"]
+)
+def test_same_as_phonenumbers(numbers: list[pn.PhoneNumber]) -> None:
+    for numobj in numbers:
+        assert number_type(numobj) == pn.number_type(numobj), numobj
+
+
+@pytest.mark.parametrize(
+    "numbers", [EXAMPLE_NUMBERS, FUZZ_NUMBERS], ids=["examples", "fuzz"]
+)
+def test_properties_same_as_phonenumbers(numbers: list[pn.PhoneNumber]) -> None:
+    for numobj in numbers:
+        number = PhoneNumber._from_numobj(numobj)
+        assert number.number_type == pn.number_type(numobj), numobj
+        assert number.region_code == pn.region_code_for_number(numobj), numobj
+        assert number.is_valid == pn.is_valid_number(numobj), numobj
+        assert number.is_geographical == pn.is_number_geographical(numobj), numobj
+        assert number.national_destination_code_length == (
+            pn.length_of_national_destination_code(numobj)
+        ), numobj
+
+
+def test_unknown_country_code() -> None:
+    numobj = pn.PhoneNumber(country_code=999, national_number=12345678)
+    assert number_type(numobj) == PhoneNumberType.UNKNOWN
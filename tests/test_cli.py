@@ -0,0 +1,110 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from digitz.cli import main
+
+
+CSV_INPUT = "id,phone\n1,+1 (201) 555-0123\n2,foo\n3,020 7946 0018\n"
+
+
+def test_normalize_csv(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    input = tmp_path / "input.csv"
+    input.write_text(CSV_INPUT)
+    output = tmp_path / "output.csv"
+    rejects = tmp_path / "rejects.csv"
+
+    args = ["normalize", str(input), "-o", str(output), "--rejects", str(rejects)]
+    assert main([*args, "-r", "GB"]) == 0
+
+    assert output.read_text().splitlines() == [
+        "id,phone,e164,national,region,type,valid",
+        "1,+1 (201) 555-0123,+12015550123,(201) 555-0123,US,FIXED_LINE_OR_MOBILE,true",
+        "3,020 7946 0018,+442079460018,020 7946 0018,GB,FIXED_LINE,true",
+    ]
+    assert rejects.read_text().splitlines() == [
+        "id,phone,error_type,error",
+        "2,foo,NOT_A_NUMBER,The string supplied did not seem to be a phone number.",
+    ]
+    assert "Processed 3 rows (1 rejected)" in capsys.readouterr().err
+
+
+def test_normalize_without_rejects_file(tmp_path: Path) -> None:
+    input = tmp_path / "input.tsv"
+    input.write_text(CSV_INPUT.replace(",", "\t"))
+    output = tmp_path / "output.tsv"
+
+    assert main(["normalize", str(input), "-o", str(output), "-r", "GB", "-q"]) == 0
+
+    lines = output.read_text().splitlines()
+    assert len(lines) == 4
+    assert lines[2] == "2\tfoo\t\t\t\t\t"
+
+
+def test_normalize_ndjson(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    input = tmp_path / "input.ndjson"
+    input.write_text('{"number": "2015550123", "id": 1}\n\n')
+
+    args = ["normalize", str(input), "-c", "number", "--chunk-size", "1"]
+    assert main([*args, "-r", "US", "-q"]) == 0
+
+    (line,) = capsys.readouterr().out.splitlines()
+    assert json.loads(line) == {
+        "number": "2015550123",
+        "id": 1,
+        "e164": "+12015550123",
+        "national": "(201) 555-0123",
+        "region": "US",
+        "type": "FIXED_LINE_OR_MOBILE",
+        "valid": True,
+    }
+
+
+def test_normalize_missing_column(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    input = tmp_path / "input.csv"
+    input.write_text(CSV_INPUT)
+
+    assert main(["normalize", str(input), "-c", "number"]) == 2
+    assert "Column 'number' not found" in capsys.readouterr().err
+
+
+def test_invalid_chunk_size() -> None:
+    with pytest.raises(SystemExit):
+        main(["normalize", "--chunk-size", "0"])
+
+
+def test_normalize_ndjson_malformed_lines(tmp_path: Path) -> None:
+    input = tmp_path / "input.ndjson"
+    input.write_text('{"phone": "+12015550123"}\n{"phone": \n[1]\n"x"\n')
+    output = tmp_path / "output.ndjson"
+    rejects = tmp_path / "rejects.ndjson"
+
+    args = ["normalize", str(input), "-o", str(output), "--rejects", str(rejects)]
+    assert main([*args, "-q"]) == 0
+
+    (line,) = output.read_text().splitlines()
+    assert json.loads(line)["e164"] == "+12015550123"
+    records = [json.loads(line) for line in rejects.read_text().splitlines()]
+    assert [(r["line"], r["error_type"]) for r in records] == [
+        ('{"phone": ', "INVALID_JSON"),
+        ("[1]", "NOT_AN_OBJECT"),
+        ('"x"', "NOT_AN_OBJECT"),
+    ]
+
+
+def test_normalize_ndjson_malformed_lines_without_rejects_file(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    input = tmp_path / "input.ndjson"
+    input.write_text('not json\n[1]\n{"phone": "+12015550123"}\n')
+
+    assert main(["normalize", str(input), "-f", "ndjson"]) == 0
+
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    assert [record["e164"] for record in records] == [None, None, "+12015550123"]
+    assert records[0]["line"] == "not json"
+    assert "Processed 3 rows (2 rejected)" in captured.err
@@ -0,0 +1,124 @@
+import pickle
+
+import phonenumbers as pn
+import pytest
+
+from digitz import PhoneNumber
+from digitz.codec import decode, decode_many, encode, encode_many
+from digitz.enums import CountryCodeSource
+
+
+NUMBERS = [
+    PhoneNumber.parse("+12015550123"),
+    PhoneNumber.parse("(201) 555-0123 ext. 12", region="US", keep_raw_input=True),
+    PhoneNumber.parse("+39 06 1234 5678"),
+    PhoneNumber.parse("0011 44 20 8366 1177", region="AU", keep_raw_input=True),
+    PhoneNumber(
+        country_code=39,
+        national_number=12345,
+        italian_leading_zero=True,
+        number_of_leading_zeros=3,
+    ),
+    PhoneNumber(
+        country_code=55,
+        national_number=1187654321,
+        extension="ü",
+        preferred_domestic_carrier_code="15",
+        country_code_source=CountryCodeSource.FROM_DEFAULT_COUNTRY,
+    ),
+    PhoneNumber(country_code=0, national_number=0),
+]
+
+
+@pytest.mark.parametrize("num", NUMBERS)
+def test_round_trip(num: PhoneNumber) -> None:
+    data = num.to_bytes()
+    decoded = PhoneNumber.from_bytes(data)
+    assert decoded == num
+    assert decoded.to_tuple() == num.to_tuple()
+    assert isinstance(decoded.country_code_source, CountryCodeSource)
+
+
+def test_size() -> None:
+    num = PhoneNumber.parse("+12015550123")
+    assert len(num.to_bytes()) == 8
+    assert len(num.to_bytes()) < len(pickle.dumps(num)) // 5
+
+
+def test_encode_phonenumbers_object() -> None:
+    numobj = pn.parse("+442083661177")
+    assert decode(encode(numobj)) == PhoneNumber._from_numobj(numobj)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"\x02\x00\x01\x01",
+        b"\x01\x00\x81",
+        b"\x01\x00\x01\x01\x00",
+        b"\x01\xe0\x01\x01",
+    ],
+    ids=["empty", "version", "truncated", "trailing", "source"],
+)
+def test_decode_invalid(data: bytes) -> None:
+    with pytest.raises(ValueError):
+        decode(data)
+
+
+def test_round_trip_many() -> None:
+    numbers = NUMBERS * 3
+    data = encode_many(numbers)
+    decoded = decode_many(data)
+    assert decoded == numbers
+    assert [num.to_tuple() for num in decoded] == [num.to_tuple() for num in numbers]
+    assert decode_many(encode_many([])) == []
+
+
+def test_decode_many_invalid() -> None:
+    data = encode_many(NUMBERS)
+    with pytest.raises(ValueError):
+        decode_many(data[:-1])
+    with pytest.raises(ValueError):
+        decode_many(data + b"\x00")
+    with pytest.raises(ValueError):
+        decode_many(b"XXXX" + data[4:])
+
+    # The country code source of the first phone number is out of range.
+    position = 16 + (2 + 8) * len(NUMBERS)
+    data = data[:position] + b"\xe0" + data[position + 1 :]
+    with pytest.raises(ValueError, match="Unsupported"):
+        decode_many(data)
+
+
+def test_encode_many_too_many_leading_zeros() -> None:
+    num = PhoneNumber(
+        country_code=39,
+        national_number=1,
+        italian_leading_zero=True,
+        number_of_leading_zeros=256,
+    )
+    assert decode(encode(num)) == num
+    with pytest.raises(ValueError, match="leading zeros"):
+        encode_many([num])
+
+
+def test_phone_number_array_from_bytes() -> None:
+    pytest.importorskip("numpy")
+    from digitz.array import PhoneNumberArray
+
+    numbers = NUMBERS * 2
+    array = PhoneNumberArray.from_bytes(encode_many(numbers))
+    expected = PhoneNumberArray.from_phone_numbers(numbers)
+    assert array.to_e164().tolist() == expected.to_e164().tolist()
+    assert array.extension.tolist() == expected.extension.tolist()
+    assert array.leading_zeros.tolist() == expected.leading_zeros.tolist()
+
+
+def test_from_bytes_subclass() -> None:
+    class MyPhoneNumber(PhoneNumber):
+        pass
+
+    num = MyPhoneNumber.from_bytes(NUMBERS[1].to_bytes())
+    assert type(num) is MyPhoneNumber
+    assert num.to_tuple() == NUMBERS[1].to_tuple()
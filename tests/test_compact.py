@@ -0,0 +1,116 @@
+from dataclasses import FrozenInstanceError
+import pickle
+import tracemalloc
+
+import phonenumbers as pn
+import pytest
+
+from digitz import PhoneNumber
+from digitz.compact import CompactPhoneNumber
+from .utils import create_number_list
+
+PHONE_NUMBERS = create_number_list(regions=["US", "CA", "MX", "IT", "GB"])
+
+
+@pytest.mark.parametrize("phonenumber", PHONE_NUMBERS)
+def test_fields(phonenumber: str) -> None:
+    num_dg = PhoneNumber.parse(phonenumber, keep_raw_input=True)
+    num_cp = CompactPhoneNumber.parse(phonenumber, keep_raw_input=True)
+    assert num_cp.to_tuple() == num_dg.to_tuple()
+    assert num_cp.to_phone_number() == num_dg
+
+
+@pytest.mark.parametrize("phonenumber", PHONE_NUMBERS)
+def test_eq_and_hash(phonenumber: str) -> None:
+    num_dg = PhoneNumber.parse(phonenumber)
+    num_cp = CompactPhoneNumber.from_phone_number(num_dg)
+    assert num_cp == num_dg
+    assert num_dg == num_cp
+    assert num_cp == pn.parse(phonenumber)
+    assert hash(num_cp) == hash(num_dg)
+
+
+@pytest.mark.parametrize("phonenumber", PHONE_NUMBERS)
+def test_derived_properties(phonenumber: str) -> None:
+    num_dg = PhoneNumber.parse(phonenumber)
+    num_cp = CompactPhoneNumber.from_phone_number(num_dg)
+    assert num_cp.nsn == num_dg.nsn
+    assert num_cp.region_code == num_dg.region_code
+    assert num_cp.is_possible == num_dg.is_possible
+    assert num_cp.is_valid == num_dg.is_valid
+    assert num_cp.number_type == num_dg.number_type
+    assert str(num_cp) == str(num_dg)
+    assert num_cp.to_international() == num_dg.to_international()
+    assert num_cp.to_national() == num_dg.to_national()
+    assert num_cp.to_rfc3966() == num_dg.to_rfc3966()
+
+
+@pytest.mark.parametrize("phonenumber", PHONE_NUMBERS)
+def test_phonenumbers_compatibility(phonenumber: str) -> None:
+    num_cp = CompactPhoneNumber.parse(phonenumber)
+    assert pn.is_number_match(num_cp, phonenumber) == pn.MatchType.EXACT_MATCH
+    assert pn.format_number(num_cp, pn.PhoneNumberFormat.E164) == phonenumber
+
+
+@pytest.mark.parametrize("phonenumber", PHONE_NUMBERS)
+def test_pickling(phonenumber: str) -> None:
+    num_cp = CompactPhoneNumber.parse(phonenumber, keep_raw_input=True)
+    assert pickle.loads(pickle.dumps(num_cp)) == num_cp
+
+
+def test_leading_zeros() -> None:
+    num_cp = CompactPhoneNumber(
+        country_code=39,
+        national_number=12345678,
+        italian_leading_zero=True,
+        number_of_leading_zeros=2,
+    )
+    assert num_cp.italian_leading_zero is True
+    assert num_cp.number_of_leading_zeros == 2
+    assert num_cp.nsn == "0012345678"
+
+
+def allocated_per_object(create) -> float:
+    """Returns the memory allocated per object of the list create() returns."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = create()
+        return (tracemalloc.get_traced_memory()[0] - before) / len(objects)
+    finally:
+        tracemalloc.stop()
+
+
+def test_memory() -> None:
+    numbers = [PhoneNumber.parse(f"+1201555{i:04}") for i in range(1000)]
+
+    def create_compact() -> list:
+        objects = [CompactPhoneNumber.from_phone_number(num) for num in numbers]
+        for num_cp in objects:
+            num_cp.to_e164()
+            num_cp.is_valid
+        return objects
+
+    def create_phone_numbers() -> list:
+        return [PhoneNumber(*num.to_tuple()) for num in numbers]
+
+    compact = allocated_per_object(create_compact)
+    assert compact < 0.75 * allocated_per_object(create_phone_numbers)
+
+
+def test_frozen() -> None:
+    num_cp = CompactPhoneNumber.parse("+12015550123")
+    with pytest.raises(FrozenInstanceError):
+        num_cp.national_number = 1  # type: ignore[misc]
+    with pytest.raises(FrozenInstanceError):
+        num_cp.clear()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"country_code": 1024}, {"country_code": 1, "number_of_leading_zeros": 31}],
+)
+def test_out_of_range(kwargs: dict) -> None:
+    kwargs.setdefault("national_number", 2015550123)
+    with pytest.raises(ValueError):
+        CompactPhoneNumber(**kwargs)
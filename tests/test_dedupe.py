@@ -0,0 +1,124 @@
+import phonenumbers as pn
+import pytest
+
+from digitz import PhoneNumber, dedupe
+from digitz.enums import MatchType
+
+
+CONTACTS = [
+    "+1 201-555-0123",
+    "(201) 555-0123",
+    "+1 201-555-0123 ext. 12",
+    "+39 06 1234 5678",
+    "+39 6 1234 5678",
+    "foo",
+    "+44 20 8366 1177",
+    "+1 201-555-0124",
+]
+
+
+@pytest.fixture(params=[False, True], ids=["memory", "spill"])
+def spill(request: pytest.FixtureRequest) -> bool:
+    return request.param
+
+
+def test_exact_match(spill: bool) -> None:
+    results = list(dedupe(CONTACTS, region="US", errors="skip", spill=spill))
+    assert [num.to_e164() for num in results] == [
+        "+12015550123",
+        "+12015550123",
+        "+390612345678",
+        "+39612345678",
+        "+442083661177",
+        "+12015550124",
+    ]
+
+
+def test_short_nsn_match(spill: bool) -> None:
+    results = list(
+        dedupe(
+            CONTACTS,
+            region="US",
+            level=MatchType.SHORT_NSN_MATCH,
+            errors="skip",
+            spill=spill,
+        )
+    )
+    assert results == [
+        PhoneNumber.parse("+12015550123"),
+        PhoneNumber.parse("+390612345678"),
+        PhoneNumber.parse("+442083661177"),
+        PhoneNumber.parse("+12015550124"),
+    ]
+
+
+def test_nsn_match(spill: bool) -> None:
+    numbers = [
+        pn.PhoneNumber(country_code=0, national_number=2015550123),
+        pn.PhoneNumber(country_code=1, national_number=2015550123),
+        pn.PhoneNumber(country_code=44, national_number=2015550123),
+    ]
+    exact = list(dedupe(numbers, spill=spill))
+    assert exact == numbers
+    nsn = list(dedupe(numbers, level=MatchType.NSN_MATCH, spill=spill))
+    assert nsn == [numbers[0]]
+
+
+def test_members(spill: bool) -> None:
+    groups = list(
+        dedupe(
+            CONTACTS,
+            region="US",
+            level=MatchType.SHORT_NSN_MATCH,
+            members=True,
+            errors="skip",
+            spill=spill,
+        )
+    )
+    assert [len(members) for _, members in groups] == [3, 2, 1, 1]
+    for first, members in groups:
+        assert members[0] is first
+        assert all(first.is_any_match(member) for member in members)
+
+
+def test_errors() -> None:
+    with pytest.raises(pn.NumberParseException):
+        list(dedupe(CONTACTS, region="US"))
+    with pytest.raises(ValueError):
+        dedupe(CONTACTS, level=MatchType.NO_MATCH)
+    with pytest.raises(ValueError):
+        dedupe(CONTACTS, errors="collect")  # type: ignore[call-overload]
+
+
+def test_spill_removes_database(tmp_path) -> None:
+    results = dedupe(CONTACTS[:2], region="US", spill=True, spill_dir=str(tmp_path))
+    next(results)
+    assert len(list(tmp_path.iterdir())) == 1
+    list(results)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_short_nsn_match_different_lengths(spill: bool) -> None:
+    numbers = [
+        "+1 202-555-0123",
+        "555-0123",
+        "+1 201-555-0124",
+        "0124",
+        "+1 312-555-0123",
+        "+44 20 8366 1177",
+    ]
+    results = list(
+        dedupe(
+            numbers,
+            region="US",
+            level=MatchType.SHORT_NSN_MATCH,
+            members=True,
+            spill=spill,
+        )
+    )
+    assert [[num.national_number for num in group] for _, group in results] == [
+        [2025550123, 5550123],
+        [2015550124, 124],
+        [3125550123],
+        [2083661177],
+    ]
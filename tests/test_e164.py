@@ -0,0 +1,71 @@
+import phonenumbers as pn
+import pytest
+
+from digitz import NumberParseErrorType, PhoneNumber
+from digitz.enums import CountryCodeSource
+from digitz.phonenumbers import _split_e164
+
+
+def _example_numbers() -> list[str]:
+    numbers = []
+    for region in sorted(pn.SUPPORTED_REGIONS):
+        for number_type in pn.PhoneNumberType.values():
+            numobj = pn.example_number_for_type(region, number_type)
+            if numobj is not None:
+                numbers.append(pn.format_number(numobj, pn.PhoneNumberFormat.E164))
+    for country_code in sorted(pn.COUNTRY_CODES_FOR_NON_GEO_REGIONS):
+        numobj = pn.example_number_for_non_geo_entity(country_code)
+        if numobj is not None:
+            numbers.append(pn.format_number(numobj, pn.PhoneNumberFormat.E164))
+    return sorted(set(numbers))
+
+
+E164_NUMBERS = _example_numbers()
+
+AMBIGUOUS_NUMBERS = [
+    "+390612345678",  # Italian leading zero
+    "+112015550123",  # US national prefix
+    "+5491187654321",  # Argentine national prefix transform
+]
+
+
+@pytest.mark.parametrize("keep_raw_input", [False, True])
+def test_fast_path_matches_full_parser(keep_raw_input: bool) -> None:
+    for number in E164_NUMBERS + AMBIGUOUS_NUMBERS:
+        expected = PhoneNumber._from_numobj(
+            pn.parse(number, keep_raw_input=keep_raw_input)
+        )
+        assert PhoneNumber.parse(number, keep_raw_input=keep_raw_input) == expected
+        assert PhoneNumber.from_e164(number, keep_raw_input=keep_raw_input) == expected
+
+
+def test_fast_path_is_taken() -> None:
+    assert _split_e164("+12015550123") == (1, "2015550123")
+    assert _split_e164("+442012345678") == (44, "2012345678")
+
+
+@pytest.mark.parametrize(
+    "number",
+    AMBIGUOUS_NUMBERS + ["+1 201 555 0123", "12015550123", "+0123456789", "+99912345678"],
+)
+def test_ambiguous_numbers_fall_back(number: str) -> None:
+    assert _split_e164(number) is None
+
+
+def test_keep_raw_input() -> None:
+    num = PhoneNumber.from_e164("+12015550123", keep_raw_input=True)
+    assert num.raw_input == "+12015550123"
+    assert num.country_code_source == CountryCodeSource.FROM_NUMBER_WITH_PLUS_SIGN
+
+
+@pytest.mark.parametrize("number", ["+1 (201) 555-0123", "2015550123", "foo"])
+def test_from_e164_not_e164(number: str) -> None:
+    with pytest.raises(pn.NumberParseException) as exc_info:
+        PhoneNumber.from_e164(number)
+    assert exc_info.value.error_type == NumberParseErrorType.NOT_A_NUMBER
+
+
+def test_from_e164_invalid_country_code() -> None:
+    with pytest.raises(pn.NumberParseException) as exc_info:
+        PhoneNumber.from_e164("+99912345678")
+    assert exc_info.value.error_type == NumberParseErrorType.INVALID_COUNTRY_CODE
@@ -0,0 +1,90 @@
+import os
+import subprocess
+import sys
+
+import phonenumbers as pn
+import pytest
+
+from digitz.enums import (
+    CountryCodeSource,
+    MatchType,
+    NumberParseErrorType,
+    PhoneNumberFormat,
+    PhoneNumberType,
+    ValidationResult,
+)
+
+
+@pytest.mark.parametrize(
+    "enum, constants",
+    [
+        (CountryCodeSource, pn.CountryCodeSource),
+        (MatchType, pn.MatchType),
+        (NumberParseErrorType, pn.NumberParseException),
+        (PhoneNumberFormat, pn.PhoneNumberFormat),
+        (PhoneNumberType, pn.PhoneNumberType),
+        (ValidationResult, pn.ValidationResult),
+    ],
+)
+def test_values_match_phonenumbers(enum, constants) -> None:
+    for member in enum:
+        assert member.value == getattr(constants, member.name)
+
+
+def _import_digitz(*statements: str) -> set[str]:
+    code = ";".join(["import sys", "import digitz", *statements, "print(*sys.modules)"])
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=os.environ.copy(),
+    )
+    return set(result.stdout.split())
+
+
+def test_import_does_not_import_phonenumbers() -> None:
+    modules = _import_digitz()
+    assert "phonenumbers" not in modules
+    assert "digitz.phonenumbers" not in modules
+
+
+def test_lazy_names() -> None:
+    modules = _import_digitz("digitz.PhoneNumber")
+    assert "digitz.phonenumbers" in modules
+
+    import digitz
+
+    assert digitz.NumberParseException is pn.NumberParseException
+    assert "PhoneNumber" in dir(digitz)
+    with pytest.raises(AttributeError):
+        digitz.foo
+
+
+def test_type_checking_not_exported() -> None:
+    import digitz
+
+    assert "TYPE_CHECKING" not in dir(digitz)
+    assert not hasattr(digitz, "TYPE_CHECKING")
+
+
+# Importing digitz takes about 5 ms. The threshold is generous so that slow CI
+# machines pass, but it fails if an import of phonenumbers or typing creeps in.
+IMPORT_TIME_THRESHOLD_US = 50_000
+
+
+def test_import_time() -> None:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import digitz"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=os.environ.copy(),
+    )
+    # Each line is "import time: <self us> | <cumulative us> | <module>".
+    times = {}
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+    assert "typing" not in times
+    assert times["digitz"] < IMPORT_TIME_THRESHOLD_US
@@ -0,0 +1,174 @@
+import phonenumbers as pn
+import pytest
+
+import digitz
+from digitz import NumberParseErrorType, PhoneNumber
+from digitz import instrumentation
+from digitz.instrumentation import Hook
+
+
+class RecordingHook(Hook):
+    def __init__(self) -> None:
+        self.events: list[tuple] = []
+
+    def on_call(self, operation, seconds, error) -> None:
+        self.events.append(("call", operation, error))
+
+    def on_method_cache(self, hit) -> None:
+        self.events.append(("method_cache", hit))
+
+    def on_metadata_load(self, region, seconds) -> None:
+        self.events.append(("metadata_load", region))
+
+
+@pytest.fixture
+def hook():
+    hook = RecordingHook()
+    instrumentation.enable_instrumentation(hook)
+    yield hook
+    instrumentation.disable_instrumentation()
+
+
+def test_disabled_by_default() -> None:
+    assert instrumentation.recorder is None
+    assert not hasattr(PhoneNumber.__dict__["parse"].__func__, "__wrapped__")
+
+    stats = digitz.stats()
+    assert not stats.enabled
+    assert stats.operations == {}
+
+
+def test_parse(hook: RecordingHook) -> None:
+    PhoneNumber.parse("+12015550123")
+    with pytest.raises(pn.NumberParseException):
+        PhoneNumber.parse("foo")
+    PhoneNumber.try_parse("bar")
+
+    stats = digitz.stats()
+    assert stats.enabled
+    parse = stats.operations["parse"]
+    assert parse.calls == 2
+    assert parse.errors == {NumberParseErrorType.NOT_A_NUMBER: 1}
+    assert sum(parse.latency.counts) == 2
+    assert len(parse.latency.counts) == len(parse.latency.bounds) + 1
+    assert parse.latency.total > 0
+
+    try_parse = stats.operations["try_parse"]
+    assert try_parse.calls == 1
+    assert try_parse.errors == {NumberParseErrorType.NOT_A_NUMBER: 1}
+
+    assert ("call", "parse", NumberParseErrorType.NOT_A_NUMBER) in hook.events
+
+
+def test_format_and_method_cache(hook: RecordingHook) -> None:
+    number = PhoneNumber.parse("+12015550123")
+    number.to_e164()
+    number.to_e164()
+    number.get_country_name("en")
+
+    stats = digitz.stats()
+    assert stats.operations["format"].calls == 2
+    assert stats.operations["get_country_name"].calls == 1
+    assert stats.method_cache == (1, 2)
+    assert stats.method_cache.hit_ratio == pytest.approx(1 / 3)
+    assert ("method_cache", True) in hook.events
+
+
+def test_metadata_loads() -> None:
+    loaded = []
+    pn.PhoneMetadata.register_region_loader("ZZ", loaded.append)
+    hook = RecordingHook()
+    instrumentation.enable_instrumentation(hook)
+    try:
+        pn.PhoneMetadata.metadata_for_region("ZZ")
+        stats = digitz.stats()
+    finally:
+        instrumentation.disable_instrumentation()
+        del pn.PhoneMetadata._region_available["ZZ"]
+
+    assert loaded == ["ZZ"]
+    assert "ZZ" in stats.metadata_loads
+    assert hook.events == [("metadata_load", "ZZ")]
+
+
+def test_hooks(hook: RecordingHook) -> None:
+    other = RecordingHook()
+    instrumentation.add_hook(other)
+    PhoneNumber.parse("+12015550123")
+    instrumentation.remove_hook(other)
+    PhoneNumber.parse("+12015550123")
+
+    assert other.events == [("call", "parse", None)]
+    assert hook.events == [("call", "parse", None)] * 2
+
+
+def test_reset_stats(hook: RecordingHook) -> None:
+    PhoneNumber.parse("+12015550123")
+    instrumentation.reset_stats()
+    PhoneNumber.parse("+12015550124")
+
+    assert digitz.stats().operations["parse"].calls == 1
+    assert len(hook.events) == 2
+
+
+def test_disable_restores_originals() -> None:
+    instrumentation.enable_instrumentation()
+    instrumentation.disable_instrumentation()
+
+    assert all(
+        owner.__dict__[name] is method
+        for owner, name, method, _ in instrumentation._methods
+    )
+    assert not any(
+        isinstance(loader, instrumentation._TimedLoader)
+        for loader in pn.PhoneMetadata._region_available.values()
+    )
+    with pytest.raises(RuntimeError):
+        instrumentation.add_hook(RecordingHook())
+
+
+def assert_disabled() -> None:
+    assert instrumentation.recorder is None
+    assert all(
+        owner.__dict__[name] is method
+        for owner, name, method, _ in instrumentation._methods
+    )
+    assert not any(
+        isinstance(loader, instrumentation._TimedLoader)
+        for table in instrumentation._loader_tables()
+        for loader in table.values()
+    )
+
+
+def test_enabled_block_restores_state_on_exception() -> None:
+    hook = RecordingHook()
+    with pytest.raises(pn.NumberParseException):
+        with instrumentation.instrumentation_enabled(hook):
+            assert instrumentation.recorder is not None
+            PhoneNumber.parse("foo")
+
+    assert hook.events == [("call", "parse", NumberParseErrorType.NOT_A_NUMBER)]
+    assert_disabled()
+
+
+def test_enabled_block_restores_previous_recorder(hook: RecordingHook) -> None:
+    previous = instrumentation.recorder
+    with pytest.raises(ZeroDivisionError):
+        with instrumentation.instrumentation_enabled():
+            1 / 0
+    assert instrumentation.recorder is previous
+
+
+def test_missing_loader_tables(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Without the private loader tables of phonenumbers, everything but the
+    # metadata loads is still recorded.
+    monkeypatch.delattr(pn.PhoneMetadata, "_region_available")
+    monkeypatch.delattr(pn.PhoneMetadata, "_country_code_available")
+    with instrumentation.instrumentation_enabled():
+        PhoneNumber.parse("+12015550123")
+        stats = digitz.stats()
+    monkeypatch.undo()
+
+    assert stats.operations["parse"].calls == 1
+    assert stats.metadata_loads == {}
+    assert_disabled()
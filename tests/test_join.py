@@ -0,0 +1,72 @@
+import random
+
+import phonenumbers as pn
+import pytest
+
+from digitz import PhoneNumber
+from digitz.enums import MatchType
+from digitz.match import join
+
+
+def _random_numbers(count: int, seed: int) -> list[pn.PhoneNumber]:
+    rng = random.Random(seed)
+    numbers = []
+    for _ in range(count):
+        numobj = pn.PhoneNumber(
+            country_code=rng.choice([0, 1, 1, 44, 39]),
+            national_number=int(
+                rng.choice(["20155501", "5550", "55501", "2015550"])
+                + str(rng.randint(0, 99))
+            ),
+            extension=rng.choice([None, None, "12"]),
+        )
+        if numobj.country_code == 39 and rng.random() < 0.5:
+            numobj.italian_leading_zero = True
+        numbers.append(numobj)
+    return numbers
+
+
+@pytest.mark.parametrize(
+    "min_match",
+    [MatchType.EXACT_MATCH, MatchType.NSN_MATCH, MatchType.SHORT_NSN_MATCH],
+)
+def test_same_as_pairwise(min_match: MatchType) -> None:
+    left = _random_numbers(300, seed=1)
+    right = _random_numbers(300, seed=2)
+
+    expected = []
+    for left_number in left:
+        for right_number in right:
+            match_type = MatchType(pn.is_number_match(left_number, right_number))
+            if match_type >= min_match:
+                expected.append((left_number, right_number, match_type))
+
+    results = list(join(left, right, min_match=min_match))
+    assert len(results) == len(expected) > 0
+    key = lambda triple: (id(triple[0]), id(triple[1]), triple[2])
+    assert sorted(map(key, results)) == sorted(map(key, expected))
+
+
+def test_join_phone_numbers() -> None:
+    left = [PhoneNumber.parse("+12015550123"), PhoneNumber.parse("+442083661177")]
+    right = (
+        num
+        for num in [
+            PhoneNumber.parse("+12015550123"),
+            PhoneNumber.parse("+12015550123").replace(extension="1"),
+            PhoneNumber.parse("+12015550124"),
+        ]
+    )
+    assert list(join(left, right, min_match=MatchType.SHORT_NSN_MATCH)) == [
+        (left[0], PhoneNumber.parse("+12015550123"), MatchType.EXACT_MATCH),
+        (
+            left[0],
+            PhoneNumber.parse("+12015550123").replace(extension="1"),
+            MatchType.SHORT_NSN_MATCH,
+        ),
+    ]
+
+
+def test_invalid_min_match() -> None:
+    with pytest.raises(ValueError):
+        join([], [], min_match=MatchType.NO_MATCH)
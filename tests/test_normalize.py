@@ -0,0 +1,87 @@
+import phonenumbers as pn
+import pytest
+
+import digitz
+from digitz import NumberParseErrorType, Parser, PhoneNumber, normalize, normalize_many
+from digitz import instrumentation
+from digitz.enums import PhoneNumberFormat
+from .utils import INVALID_STRINGS, region_strings
+
+
+def format_or_none(
+    number: str, region: str | None, format: PhoneNumberFormat
+) -> str | None:
+    try:
+        return PhoneNumber.parse(number, region=region).format(format)
+    except pn.NumberParseException:
+        return None
+
+
+@pytest.mark.parametrize("region", sorted(pn.SUPPORTED_REGIONS))
+def test_same_as_parse_and_format(region: str) -> None:
+    strings = region_strings(region) + INVALID_STRINGS
+    for format in PhoneNumberFormat:
+        for string in strings:
+            expected = format_or_none(string, region, format)
+            assert normalize(string, region=region, format=format) == expected
+
+
+@pytest.mark.parametrize("region", [None, "ZZ", "us"])
+def test_without_supported_region(region: str | None) -> None:
+    strings = region_strings("US") + INVALID_STRINGS
+    for string in strings:
+        expected = format_or_none(string, region, PhoneNumberFormat.E164)
+        assert normalize(string, region=region) == expected
+
+
+def test_normalize() -> None:
+    assert normalize("(201) 555-0123", region="US") == "+12015550123"
+    assert normalize("+1 201-555-0123") == "+12015550123"
+    assert normalize("+12015550123") == "+12015550123"
+    assert normalize("foo", region="US") is None
+
+
+def test_normalize_format() -> None:
+    number = "(201) 555-0123 ext. 12"
+    assert normalize(number, region="US", format=PhoneNumberFormat.NATIONAL) == (
+        "(201) 555-0123 ext. 12"
+    )
+    assert normalize(number, region="US", format=PhoneNumberFormat.RFC3966) == (
+        "tel:+1-201-555-0123;ext=12"
+    )
+
+
+def test_normalize_many() -> None:
+    strings = ["(201) 555-0123", "foo", "+442083661177", "1-201-555-0124"]
+    assert normalize_many(strings, region="US") == [
+        "+12015550123",
+        None,
+        "+442083661177",
+        "+12015550124",
+    ]
+    assert normalize_many(strings) == [normalize(string) for string in strings]
+
+
+def test_parser_normalize() -> None:
+    parser = Parser("GB")
+    assert parser.normalize("020 8366 1177") == "+442083661177"
+    assert parser.normalize("020 8366 1177", PhoneNumberFormat.INTERNATIONAL) == (
+        "+44 20 8366 1177"
+    )
+    assert parser.normalize_many(["020 8366 1177", ""]) == ["+442083661177", None]
+
+
+@pytest.mark.parametrize("region", [None, "ZZ", "US"])
+def test_stats(region: str | None) -> None:
+    instrumentation.enable_instrumentation()
+    try:
+        assert normalize("+12015550123", region=region) == "+12015550123"
+        assert normalize("foo", region=region) is None
+        assert normalize_many(["+12015550124", ""], region=region)[1] is None
+        stats = digitz.stats()
+    finally:
+        instrumentation.disable_instrumentation()
+
+    operation = stats.operations["normalize"]
+    assert operation.calls == 4
+    assert operation.errors == {NumberParseErrorType.NOT_A_NUMBER: 2}
@@ -0,0 +1,79 @@
+import phonenumbers as pn
+import pytest
+
+from digitz import NumberParseErrorType, ParseFailure, PhoneNumber
+from digitz.parallel import normalize
+from .utils import create_number_list
+
+PHONE_NUMBERS = create_number_list(regions=["US", "IT", "GB"])
+STRINGS = ["201-555-0123", "foo", "+442083661177", "", "+39 06 1234 5678"] * 5
+
+
+def test_normalize() -> None:
+    assert list(normalize(PHONE_NUMBERS, workers=2, chunksize=7)) == (
+        PhoneNumber.parse_many(PHONE_NUMBERS)
+    )
+
+
+def test_normalize_keeps_input_order() -> None:
+    results = list(normalize(STRINGS, region="US", errors="collect", chunksize=3))
+    expected = PhoneNumber.parse_many(STRINGS, region="US", errors="collect")
+    assert results == expected
+    assert [type(result) for result in results] == [type(r) for r in expected]
+
+
+def test_normalize_errors_skip() -> None:
+    assert list(
+        normalize(STRINGS, region="US", errors="skip", workers=1, chunksize=4)
+    ) == PhoneNumber.parse_many(STRINGS, region="US", errors="skip")
+
+
+def test_normalize_errors_collect() -> None:
+    results = list(normalize(["foo"], errors="collect", workers=1))
+    assert results == [
+        ParseFailure(
+            "foo",
+            NumberParseErrorType.NOT_A_NUMBER,
+            "The string supplied did not seem to be a phone number.",
+        )
+    ]
+
+
+def test_normalize_errors_raise() -> None:
+    with pytest.raises(pn.NumberParseException) as exc_info:
+        list(normalize(STRINGS, region="US", workers=1))
+    assert exc_info.value.error_type == NumberParseErrorType.NOT_A_NUMBER
+
+
+def test_normalize_keep_raw_input() -> None:
+    (num,) = normalize(["+1 (201) 555-0123"], keep_raw_input=True, workers=1)
+    assert num.raw_input == "+1 (201) 555-0123"
+
+
+def test_normalize_properties() -> None:
+    properties = ("region_code", "number_type", "is_valid")
+    (num,) = normalize(["+12015550123"], properties=properties, workers=1)
+    assert {name: num.__dict__[name] for name in properties} == {
+        "region_code": "US",
+        "number_type": pn.PhoneNumberType.FIXED_LINE_OR_MOBILE,
+        "is_valid": True,
+    }
+
+
+def test_normalize_empty() -> None:
+    assert list(normalize([], workers=1)) == []
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"errors": "ignore"},
+        {"properties": ["carrier_name"]},
+        {"workers": 0},
+        {"workers": -1},
+        {"chunksize": 0},
+    ],
+)
+def test_normalize_invalid_arguments(kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        normalize(["+12015550123"], **kwargs)
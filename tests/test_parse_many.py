@@ -0,0 +1,121 @@
+import phonenumbers as pn
+import pytest
+
+from digitz import NumberParseErrorType, ParseFailure, PhoneNumber
+from .utils import create_number_list
+
+PHONE_NUMBERS = create_number_list(regions=["US", "CA", "MX", "IT", "GB"])
+
+
+def test_parse_many() -> None:
+    assert PhoneNumber.parse_many(PHONE_NUMBERS) == [
+        PhoneNumber.parse(number) for number in PHONE_NUMBERS
+    ]
+
+
+def test_parse_many_keeps_input_order() -> None:
+    numbers = [("2015550123", "US"), "+442012345678", ("020 1234 5678", "GB")]
+    assert PhoneNumber.parse_many(numbers, region="IT") == [
+        PhoneNumber.parse("2015550123", region="US"),
+        PhoneNumber.parse("+442012345678"),
+        PhoneNumber.parse("020 1234 5678", region="GB"),
+    ]
+
+
+def test_parse_many_default_region() -> None:
+    assert PhoneNumber.parse_many(["201-555-0123"], region="US") == [
+        PhoneNumber.parse("201-555-0123", region="US")
+    ]
+
+
+def test_parse_many_keep_raw_input() -> None:
+    (num,) = PhoneNumber.parse_many(["+1 (201) 555-0123"], keep_raw_input=True)
+    assert num.raw_input == "+1 (201) 555-0123"
+
+
+def test_parse_many_errors_raise() -> None:
+    with pytest.raises(pn.NumberParseException) as exc_info:
+        PhoneNumber.parse_many([PHONE_NUMBERS[0], "foo"])
+    assert exc_info.value.error_type == NumberParseErrorType.NOT_A_NUMBER
+
+
+def test_parse_many_errors_raise_first_in_input_order() -> None:
+    numbers = [("+12025550123", "US"), "foo", ("+999 (201) 555-0123", "US")]
+    with pytest.raises(pn.NumberParseException) as exc_info:
+        PhoneNumber.parse_many(numbers)
+    assert exc_info.value.error_type == NumberParseErrorType.NOT_A_NUMBER
+
+
+def test_parse_many_errors_skip() -> None:
+    numbers = ["foo", PHONE_NUMBERS[0], "+999 (201) 555-0123"]
+    assert PhoneNumber.parse_many(numbers, errors="skip") == [
+        PhoneNumber.parse(PHONE_NUMBERS[0])
+    ]
+
+
+def test_parse_many_errors_collect() -> None:
+    numbers = ["foo", PHONE_NUMBERS[0], "+999 (201) 555-0123"]
+    first, second, third = PhoneNumber.parse_many(numbers, errors="collect")
+
+    assert isinstance(first, ParseFailure)
+    assert not first
+    assert first.number == "foo"
+    assert first.error_type == NumberParseErrorType.NOT_A_NUMBER
+
+    assert second == PhoneNumber.parse(PHONE_NUMBERS[0])
+
+    assert isinstance(third, ParseFailure)
+    assert third.error_type == NumberParseErrorType.INVALID_COUNTRY_CODE
+    assert third.to_exception().error_type == NumberParseErrorType.INVALID_COUNTRY_CODE
+
+
+def test_parse_many_invalid_errors() -> None:
+    with pytest.raises(ValueError):
+        PhoneNumber.parse_many(PHONE_NUMBERS, errors="ignore")  # type: ignore
+
+
+MIXED_REGIONS = [
+    ("020 8366 1177", "GB"),
+    "201-555-0123",
+    ("foo", "GB"),
+    ("06 1234 5678", "IT"),
+    "bar",
+    ("+44 20 8366 1177", None),
+    ("020 8366 1178", "GB"),
+]
+
+
+def test_parse_many_mixed_regions_skip() -> None:
+    assert PhoneNumber.parse_many(MIXED_REGIONS, region="US", errors="skip") == [
+        PhoneNumber.parse("+442083661177"),
+        PhoneNumber.parse("+12015550123"),
+        PhoneNumber.parse("+390612345678"),
+        PhoneNumber.parse("+442083661177"),
+        PhoneNumber.parse("+442083661178"),
+    ]
+
+
+def test_parse_many_mixed_regions_collect() -> None:
+    results = PhoneNumber.parse_many(MIXED_REGIONS, region="US", errors="collect")
+    expected = [
+        PhoneNumber.try_parse(number, region=region)
+        for number, region in (
+            item if isinstance(item, tuple) else (item, "US") for item in MIXED_REGIONS
+        )
+    ]
+    assert [result.to_tuple() if result else result for result in results] == [
+        result.to_tuple() if result else result for result in expected
+    ]
+    failures = [result for result in results if isinstance(result, ParseFailure)]
+    assert [failure.number for failure in failures] == ["foo", "bar"]
+    with pytest.raises(pn.NumberParseException) as exc_info:
+        PhoneNumber.parse_many(MIXED_REGIONS, region="US")
+    assert exc_info.value.error_type == NumberParseErrorType.NOT_A_NUMBER
+
+
+def test_parse_many_subclass() -> None:
+    class MyPhoneNumber(PhoneNumber):
+        pass
+
+    results = MyPhoneNumber.parse_many(["201-555-0123"], region="US")
+    assert type(results[0]) is MyPhoneNumber
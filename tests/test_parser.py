@@ -0,0 +1,108 @@
+import phonenumbers as pn
+import pytest
+
+from digitz import NumberParseErrorType, ParseFailure, Parser, PhoneNumber
+from digitz import cache
+from digitz.enums import CountryCodeSource
+from .utils import INVALID_STRINGS, region_strings
+
+
+def to_comparable(result: PhoneNumber | ParseFailure) -> tuple:
+    if isinstance(result, ParseFailure):
+        return (result.error_type, result.message)
+    return result.to_tuple()
+
+
+@pytest.mark.parametrize("region", sorted(pn.SUPPORTED_REGIONS))
+@pytest.mark.parametrize("keep_raw_input", [False, True])
+def test_same_as_try_parse(region: str, keep_raw_input: bool) -> None:
+    parser = Parser(region, keep_raw_input=keep_raw_input)
+    for string in region_strings(region) + INVALID_STRINGS:
+        expected = PhoneNumber.try_parse(
+            string, region=region, keep_raw_input=keep_raw_input
+        )
+        assert to_comparable(parser.try_parse(string)) == to_comparable(expected)
+
+
+def test_parse() -> None:
+    assert Parser("US").parse("(201) 555-0123") == PhoneNumber.parse("+12015550123")
+
+
+def test_parse_raises() -> None:
+    with pytest.raises(pn.NumberParseException) as exc_info:
+        Parser("US").parse("foo")
+    assert exc_info.value.error_type == NumberParseErrorType.NOT_A_NUMBER
+
+
+def test_keep_raw_input() -> None:
+    num = Parser("US", keep_raw_input=True).parse("1 (201) 555-0123")
+    assert num.raw_input == "1 (201) 555-0123"
+    assert num.country_code_source == CountryCodeSource.FROM_NUMBER_WITHOUT_PLUS_SIGN
+
+
+def test_carrier_code() -> None:
+    num = Parser("BR", keep_raw_input=True).parse("0 15 11 3456-7890")
+    assert num == PhoneNumber.parse(
+        "0 15 11 3456-7890", region="BR", keep_raw_input=True
+    )
+    assert num.preferred_domestic_carrier_code == "15"
+
+
+def test_region() -> None:
+    assert Parser("GB").region == "GB"
+
+
+@pytest.mark.parametrize("region", [None, "ZZ", "gb", "001"])
+def test_unsupported_region(region: str | None) -> None:
+    # Like PhoneNumber.parse(), only strings with a plus sign are parsed.
+    parser = Parser(region)
+    assert parser.region == region
+    assert parser.parse("+44 20 7946 0018") == PhoneNumber.parse(
+        "+44 20 7946 0018", region=region
+    )
+    assert parser.normalize("+44 20 7946 0018") == "+442079460018"
+
+    with pytest.raises(pn.NumberParseException) as exc_info:
+        PhoneNumber.parse("020 7946 0018", region=region)
+    with pytest.raises(pn.NumberParseException) as parser_exc_info:
+        parser.parse("020 7946 0018")
+    assert parser_exc_info.value.error_type == exc_info.value.error_type
+    assert parser_exc_info.value._msg == exc_info.value._msg
+    assert parser.normalize("020 7946 0018") is None
+    for string in region_strings("GB") + INVALID_STRINGS:
+        expected = PhoneNumber.try_parse(string, region=region)
+        assert to_comparable(parser.try_parse(string)) == to_comparable(expected)
+
+
+def test_repr() -> None:
+    assert repr(Parser("US")) == "Parser(region='US', keep_raw_input=False)"
+
+
+def test_parse_many() -> None:
+    strings = ["(201) 555-0123", "foo", "+442083661177"]
+    parser = Parser("US")
+    assert parser.parse_many(strings, errors="collect") == PhoneNumber.parse_many(
+        strings, region="US", errors="collect"
+    )
+    assert parser.parse_many(strings, errors="skip") == PhoneNumber.parse_many(
+        strings, region="US", errors="skip"
+    )
+    with pytest.raises(pn.NumberParseException):
+        parser.parse_many(strings)
+
+
+def test_parse_many_invalid_errors() -> None:
+    with pytest.raises(ValueError):
+        Parser("US").parse_many([], errors="ignore")  # type: ignore[call-overload]
+
+
+def test_parse_cache() -> None:
+    cache.enable_parse_cache()
+    try:
+        num = PhoneNumber.parse("(201) 555-0123", region="US")
+        assert Parser("US").parse("(201) 555-0123") is num
+        assert isinstance(Parser("US").try_parse("foo"), ParseFailure)
+        with pytest.raises(pn.NumberParseException):
+            Parser("US").parse("foo")
+    finally:
+        cache.disable_parse_cache()
@@ -0,0 +1,101 @@
+from pathlib import Path
+
+import phonenumbers as pn
+from phonenumbers.carrier import name_for_number
+from phonenumbers.geocoder import country_name_for_number, description_for_number
+import pytest
+
+from digitz import PhoneNumber, prefixindex
+from digitz.cli import main
+from digitz.prefixindex import PrefixIndex, build_prefix_index
+
+
+def _example_numbers() -> list[pn.PhoneNumber]:
+    numbers = []
+    for region in sorted(pn.SUPPORTED_REGIONS):
+        for number_type in range(pn.PhoneNumberType.VOICEMAIL + 1):
+            numobj = pn.example_number_for_type(region, number_type)
+            if numobj is not None:
+                numbers.append(numobj)
+    for country_code in pn.COUNTRY_CODES_FOR_NON_GEO_REGIONS:
+        numobj = pn.example_number_for_non_geo_entity(country_code)
+        if numobj is not None:
+            numbers.append(numobj)
+    # A mobile number with a mobile token and an invalid number.
+    numbers.append(pn.parse("+5491187654321"))
+    numbers.append(pn.parse("+1201555012"))
+    return numbers
+
+
+EXAMPLE_NUMBERS = _example_numbers()
+LOCALES = [
+    ("en", None, None),
+    ("de", None, None),
+    ("zh", "Hant", "TW"),
+    ("ko", None, None),
+    ("en", None, "US"),
+    ("es", None, "AR"),
+    ("xx", None, None),
+]
+
+
+@pytest.fixture(scope="module")
+def index_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("prefixindex") / "digitz.idx"
+    build_prefix_index(path)
+    return path
+
+
+@pytest.fixture()
+def index(index_path: Path):
+    with PrefixIndex(index_path) as index:
+        yield index
+
+
+@pytest.mark.parametrize("lang, script, region", LOCALES)
+def test_matches_phonenumbers(index: PrefixIndex, lang, script, region) -> None:
+    for numobj in EXAMPLE_NUMBERS:
+        args = (numobj, lang, script, region)
+        assert index.name_for_number(*args) == name_for_number(*args)
+        assert index.description_for_number(*args) == description_for_number(*args)
+        assert index.country_name_for_number(*args) == country_name_for_number(*args)
+
+
+def test_phone_number_methods(index_path: Path) -> None:
+    prefixindex.enable_prefix_index(index_path)
+    try:
+        for numobj in EXAMPLE_NUMBERS:
+            num = PhoneNumber._from_numobj(numobj)
+            assert num.get_carrier_name("en") == name_for_number(numobj, "en")
+            assert num.get_description("fr") == description_for_number(numobj, "fr")
+            assert num.get_country_name("de") == country_name_for_number(numobj, "de")
+    finally:
+        prefixindex.disable_prefix_index()
+    assert prefixindex.prefix_index is None
+
+
+def test_not_an_index(tmp_path: Path) -> None:
+    path = tmp_path / "digitz.idx"
+    path.write_bytes(b"foo" * 100)
+    with pytest.raises(ValueError, match="Not a prefix index file"):
+        PrefixIndex(path)
+
+
+def test_other_phonenumbers_version(
+    index_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(pn, "__version__", "0.0.0")
+    with pytest.raises(ValueError, match="rebuild it for phonenumbers 0.0.0"):
+        PrefixIndex(index_path)
+
+
+def test_build_index_command(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    path = tmp_path / "digitz.idx"
+    assert main(["build-index", str(path)]) == 0
+    assert f"Built {path}" in capsys.readouterr().err
+    with PrefixIndex(path) as index:
+        assert index.description_for_number(pn.parse("+16502530000"), "en") == (
+            "Mountain View, CA"
+        )
@@ -0,0 +1,73 @@
+import gc
+
+import phonenumbers as pn
+import pytest
+
+from digitz import preload, preload_for_fork, warmup
+from digitz.classifier import _classifier
+
+
+def test_warmup() -> None:
+    report = warmup(["US", "GB"], langs=["en", "de"])
+    assert [step.name for step in report.steps] == [
+        "regions",
+        "carrier",
+        "geocoder",
+        "timezones",
+    ]
+    assert all(step.seconds >= 0 for step in report.steps)
+    assert report.seconds == sum(step.seconds for step in report.steps)
+
+
+def test_warmup_selected_steps() -> None:
+    report = warmup(["US"], carrier=False, geocoder=False, timezones=False)
+    assert [step.name for step in report.steps] == ["regions"]
+
+
+def test_warmup_memory() -> None:
+    report = warmup(["US"], carrier=False, geocoder=False)
+    if report.memory is not None:
+        assert report.memory == sum(step.memory or 0 for step in report.steps)
+
+
+def test_preload_for_fork() -> None:
+    try:
+        report = preload_for_fork(["US", "GB"], carrier=False, geocoder=False)
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+    assert [step.name for step in report.steps] == [
+        "regions",
+        "timezones",
+        "indexes",
+        "timezone index",
+        "freeze",
+    ]
+    classifier = _classifier(pn.PhoneMetadata.metadata_for_region("GB"))
+    assert set(classifier._tables) == set(range(1, 18))
+
+
+def test_preload_for_fork_without_timezones() -> None:
+    try:
+        report = preload_for_fork(
+            ["US"], carrier=False, geocoder=False, timezones=False
+        )
+    finally:
+        gc.unfreeze()
+    assert [step.name for step in report.steps] == ["regions", "indexes", "freeze"]
+
+
+def test_region_codes_are_taken_as_given(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Like PhoneNumber.parse() and Parser, lower case region codes are not
+    # supported, so there is nothing to load for them.
+    warmed_up = []
+    warmup_regions = preload._warmup_regions
+
+    def record(regions: list[str], include_non_geo: bool) -> list:
+        warmed_up.append(regions)
+        return warmup_regions(regions, include_non_geo)
+
+    monkeypatch.setattr(preload, "_warmup_regions", record)
+    warmup(["US", "gb", "ZZ"], carrier=False, geocoder=False, timezones=False)
+    assert warmed_up == [["US"]]
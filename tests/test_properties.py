@@ -106,3 +106,21 @@ def test_is_nanpa_country(phonenumber: str) -> None:
     assert num_dg.is_nanpa_country == pn.is_nanpa_country(
         pn.region_code_for_number(num_pn)
     )
+
+
+def test_test_general_length_same_as_phonenumbers() -> None:
+    from phonenumbers.phonenumberutil import _test_number_length
+
+    from digitz.phonenumbers import _test_general_length
+
+    metadata = [
+        pn.PhoneMetadata.metadata_for_region_or_calling_code(code, region)
+        for code, regions in pn.COUNTRY_CODE_TO_REGION_CODE.items()
+        for region in regions
+    ]
+    for region_metadata in metadata:
+        for length in range(20):
+            national_number = "9876543210987654321"[:length]
+            assert _test_general_length(
+                national_number, region_metadata
+            ) == _test_number_length(national_number, region_metadata)
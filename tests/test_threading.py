@@ -0,0 +1,119 @@
+from concurrent.futures import ThreadPoolExecutor
+import subprocess
+import sys
+import sysconfig
+import threading
+
+import pytest
+
+from digitz import PhoneNumber
+from digitz import cache
+from digitz.cache import ParseCache
+from digitz.enums import PhoneNumberFormat
+from .utils import create_number_list
+
+PHONE_NUMBERS = create_number_list(regions=["US", "GB", "IT", "BR", "JP"])
+THREADS = 8
+
+
+def run_in_threads(func, *args):
+    """Runs a function in several threads at once and returns their results."""
+    barrier = threading.Barrier(THREADS)
+
+    def target():
+        barrier.wait()
+        return func(*args)
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        futures = [executor.submit(target) for _ in range(THREADS)]
+        return [future.result() for future in futures]
+
+
+def test_parse_and_format() -> None:
+    def work():
+        return [
+            PhoneNumber.parse(number).format(PhoneNumberFormat.INTERNATIONAL)
+            for number in PHONE_NUMBERS
+        ]
+
+    expected = work()
+    assert run_in_threads(work) == [expected] * THREADS
+
+
+def test_shared_instances() -> None:
+    # The threads compute the cached properties and methods of the same instances.
+    numbers = [PhoneNumber.parse(number) for number in PHONE_NUMBERS]
+    expected = [
+        (num.number_type, num.region_code, num.is_valid, num.to_national())
+        for num in numbers
+    ]
+    numbers = [PhoneNumber._from_fields(*num.to_tuple()) for num in numbers]
+
+    def work():
+        return [
+            (num.number_type, num.region_code, num.is_valid, num.to_national())
+            for num in numbers
+        ]
+
+    assert run_in_threads(work) == [expected] * THREADS
+
+
+def test_method_cache_eviction() -> None:
+    num = PhoneNumber.parse(PHONE_NUMBERS[0])
+
+    def work():
+        return [num.format(format) for format in list(PhoneNumberFormat) * 50]
+
+    cache.configure_method_cache(maxsize=2)
+    try:
+        results = run_in_threads(work)
+    finally:
+        cache.configure_method_cache(maxsize=32)
+    assert results == [work()] * THREADS
+
+
+def test_parse_cache() -> None:
+    cache.enable_parse_cache(maxsize=64, shards=4)
+    try:
+        results = run_in_threads(
+            lambda: [PhoneNumber.parse(number) for number in PHONE_NUMBERS]
+        )
+        info = cache.parse_cache_info()
+    finally:
+        cache.disable_parse_cache()
+
+    assert results == [[PhoneNumber.parse(n) for n in PHONE_NUMBERS]] * THREADS
+    assert info is not None
+    assert info.hits + info.misses == THREADS * len(PHONE_NUMBERS)
+    assert info.currsize <= 64
+
+
+def test_parse_cache_shards() -> None:
+    parse_cache = ParseCache(maxsize=4096)
+    assert len(parse_cache._shards) == 4
+    assert sum(shard.maxsize for shard in parse_cache._shards) == 4096
+
+    parse_cache = ParseCache(maxsize=10, shards=3)
+    assert [shard.maxsize for shard in parse_cache._shards] == [4, 3, 3]
+
+
+def test_parse_cache_invalid_shards() -> None:
+    with pytest.raises(ValueError):
+        ParseCache(maxsize=2, shards=3)
+
+
+@pytest.mark.skipif(
+    not sysconfig.get_config_var("Py_GIL_DISABLED"),
+    reason="Requires a free-threaded build of Python.",
+)
+def test_gil_stays_disabled() -> None:
+    # A module that does not declare free-threading support re-enables the GIL.
+    code = (
+        "import sys, digitz; from digitz import PhoneNumber; "
+        "PhoneNumber.parse('+12015550123').to_national(); "
+        "print(sys._is_gil_enabled())"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
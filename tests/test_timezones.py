@@ -0,0 +1,80 @@
+from zoneinfo import ZoneInfo
+
+import phonenumbers as pn
+from phonenumbers.timezone import time_zones_for_number
+import pytest
+
+from digitz import PhoneNumber
+from digitz.compact import CompactPhoneNumber
+from digitz.timezones import timezones_for, timezones_for_number
+
+
+def _example_numbers() -> list[pn.PhoneNumber]:
+    numbers = []
+    for region in sorted(pn.SUPPORTED_REGIONS):
+        for number_type in range(pn.PhoneNumberType.VOICEMAIL + 1):
+            numobj = pn.example_number_for_type(region, number_type)
+            if numobj is not None:
+                numbers.append(numobj)
+        numobj = pn.invalid_example_number(region)
+        if numobj is not None:
+            numbers.append(numobj)
+    for country_code in pn.COUNTRY_CODES_FOR_NON_GEO_REGIONS:
+        numobj = pn.example_number_for_non_geo_entity(country_code)
+        if numobj is not None:
+            numbers.append(numobj)
+    return numbers
+
+
+EXAMPLE_NUMBERS = _example_numbers()
+
+
+def _expected(numobj: pn.PhoneNumber) -> tuple[ZoneInfo, ...]:
+    zones = time_zones_for_number(numobj)
+    if zones == ("Etc/Unknown",):
+        return ()
+    return tuple(ZoneInfo(zone) for zone in zones)
+
+
+def test_matches_phonenumbers() -> None:
+    for numobj in EXAMPLE_NUMBERS:
+        num = PhoneNumber._from_numobj(numobj)
+        assert num.timezones == _expected(numobj), num
+        assert timezones_for_number(numobj) == _expected(numobj), num
+
+
+def test_unknown() -> None:
+    num = PhoneNumber.parse("+1201555012")
+    assert not num.is_valid
+    assert num.timezones == ()
+
+
+def test_shared_tuples() -> None:
+    first = PhoneNumber.parse("+12015550124")
+    second = PhoneNumber.parse("+12015550125")
+    assert first.timezones == (ZoneInfo("America/New_York"),)
+    assert first.timezones is second.timezones
+
+
+def test_timezones_for() -> None:
+    numbers = [
+        PhoneNumber.parse("+442083661177"),
+        pn.parse("+442083661177"),
+        CompactPhoneNumber.parse("+12015550124"),
+        PhoneNumber.parse("+1201555012"),
+    ]
+    assert timezones_for(numbers) == [
+        (ZoneInfo("Europe/London"),),
+        (ZoneInfo("Europe/London"),),
+        (ZoneInfo("America/New_York"),),
+        (),
+    ]
+    assert timezones_for(iter([])) == []
+
+
+@pytest.mark.parametrize("number", ["+16502530000", "+390236618300"])
+def test_timezones_for_generator(number: str) -> None:
+    results = timezones_for(pn.parse(number) for _ in range(3))
+    assert len(results) == 3
+    assert results[0] is results[1] is results[2]
+    assert results[0] == _expected(pn.parse(number))
@@ -0,0 +1,75 @@
+import phonenumbers as pn
+import pytest
+
+from digitz import NumberParseErrorType, ParseFailure, PhoneNumber
+from digitz import cache
+from .utils import USA_EXAMPLE_NUMBER, create_number_list
+
+PHONE_NUMBERS = create_number_list(regions=["US", "CA", "MX", "IT", "GB"])
+
+INVALID_STRINGS = [
+    "",
+    "foo",
+    "n/a",
+    "5",
+    "+",
+    "+1",
+    "１",
+    "abc1def",
+    "john.doe123@example.com",
+    "12",
+    "++12",
+    "2015550123",
+    "0044",
+    "tel:2015550123;phone-context=",
+    "tel:;phone-context=+1",
+    "1" * 251,
+    "x" * 300,
+]
+
+
+@pytest.mark.parametrize("number", PHONE_NUMBERS)
+def test_same_as_parse(number: str) -> None:
+    assert PhoneNumber.try_parse(number) == PhoneNumber.parse(number)
+
+
+@pytest.mark.parametrize(
+    "number", ["(201) 555-0123", "201.555.0123", "２０１５５５０１２３"]
+)
+def test_same_as_parse_with_region(number: str) -> None:
+    result = PhoneNumber.try_parse(number, region="US", keep_raw_input=True)
+    assert result == PhoneNumber.parse(number, region="US", keep_raw_input=True)
+
+
+@pytest.mark.parametrize("region", [None, "US", "gb", "XX"])
+@pytest.mark.parametrize("number", INVALID_STRINGS)
+def test_failure_same_as_exception(number: str, region: str | None) -> None:
+    try:
+        expected = PhoneNumber.parse(number, region=region)
+    except pn.NumberParseException as e:
+        expected = ParseFailure.from_exception(number, e)
+
+    assert PhoneNumber.try_parse(number, region=region) == expected
+
+
+def test_failure() -> None:
+    result = PhoneNumber.try_parse("foo")
+    assert isinstance(result, ParseFailure)
+    assert not result
+    assert result.number == "foo"
+    assert result.error_type == NumberParseErrorType.NOT_A_NUMBER
+
+
+def test_with_parse_cache() -> None:
+    cache.enable_parse_cache(maxsize=10)
+    try:
+        assert PhoneNumber.try_parse(USA_EXAMPLE_NUMBER) is PhoneNumber.parse(
+            USA_EXAMPLE_NUMBER
+        )
+        failure = PhoneNumber.try_parse("foo")
+        assert PhoneNumber.try_parse("foo") is failure
+        with pytest.raises(pn.NumberParseException):
+            PhoneNumber.parse("foo")
+        assert cache.parse_cache_info().hits == 3
+    finally:
+        cache.disable_parse_cache()
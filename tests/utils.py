@@ -1,6 +1,8 @@
 from typing import Union
 import phonenumbers as pn
 
+from digitz.enums import PhoneNumberFormat, PhoneNumberType
+
 USA_EXAMPLE_NUMBER = "+1 (201) 555-0123"
 
 
@@ -26,3 +28,30 @@ def create_number_list(
 
     assert len(numbers) > 0, "No example numbers found"
     return tuple(numbers)
+
+
+def region_strings(region: str) -> list[str]:
+    """Returns the example numbers of a region in the ways people write them."""
+    strings = []
+    for number_type in PhoneNumberType:
+        numobj = pn.example_number_for_type(region, number_type)
+        if numobj is None:
+            continue
+        nsn = pn.national_significant_number(numobj)
+        country_code = str(numobj.country_code)
+        national = pn.format_number(numobj, PhoneNumberFormat.NATIONAL)
+        international = pn.format_number(numobj, PhoneNumberFormat.INTERNATIONAL)
+        strings += [
+            national,
+            national.replace(" ", "-"),
+            international,
+            international.lstrip("+"),
+            nsn,
+            "0" + nsn,
+            country_code + nsn,
+            "00" + country_code + nsn,
+        ]
+    return strings
+
+
+INVALID_STRINGS = ["", "foo", "1", "12", "1-2", "(0) 1", "0" * 20, "1" * 300, "..."]